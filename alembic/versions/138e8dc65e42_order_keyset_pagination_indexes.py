@@ -0,0 +1,35 @@
+"""order keyset pagination indexes
+
+Revision ID: 138e8dc65e42
+Revises: b1a4744053b7
+Create Date: 2026-10-17 09:12:31.104211
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '138e8dc65e42'
+down_revision: Union[str, Sequence[str], None] = 'b1a4744053b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_orders_total_id', 'orders', ['total', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_orders_user_id_created_at_id', 'orders', ['user_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_user_id_created_at_id', table_name='orders', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_orders_total_id', table_name='orders', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_orders_created_at_id', table_name='orders', postgresql_concurrently=True, if_exists=True)
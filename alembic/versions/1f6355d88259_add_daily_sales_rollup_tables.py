@@ -0,0 +1,44 @@
+"""add daily sales rollup tables
+
+Revision ID: 1f6355d88259
+Revises: 569f0de08363
+Create Date: 2026-10-17 11:26:05.913742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '1f6355d88259'
+down_revision: Union[str, Sequence[str], None] = '569f0de08363'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_order_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('order_status', postgresql.ENUM('PENDING', 'CONFIRMED', 'PREPARING', 'OUT_FOR_DELIVERY', 'DELIVERED', 'CANCELLED', name='orderstatus', create_type=False), nullable=False),
+    sa.Column('payment_method', postgresql.ENUM('COD', 'DIGITAL', name='paymentmethod', create_type=False), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'order_status', 'payment_method')
+    )
+    op.create_table('daily_pizza_sales',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('pizza_name', sa.String(length=255), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'pizza_name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_pizza_sales')
+    op.drop_table('daily_order_stats')
@@ -0,0 +1,56 @@
+"""add cart item fingerprint
+
+Revision ID: 4e8a61c0d9f2
+Revises: 7c2e9b4d1a30
+Create Date: 2026-10-17 14:21:47.905316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8a61c0d9f2'
+down_revision: Union[str, Sequence[str], None] = '7c2e9b4d1a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# same canonical form as app.cart.utils.cart_item_fingerprint
+FINGERPRINTS = """
+    SELECT ci.id, encode(sha256(convert_to(
+        ci.pizza_id::text || ':' || ci.size_id::text || ':' || ci.crust_id::text || ':' ||
+        coalesce(string_agg(cit.topping_id::text, ',' ORDER BY cit.topping_id), ''),
+        'UTF8')), 'hex') AS fingerprint
+    FROM cart_item ci
+    LEFT JOIN cart_item_topping cit ON cit.cart_item_id = ci.id
+    GROUP BY ci.id
+"""
+
+# duplicates per cart collapse into the oldest row, quantities summed
+DUPLICATES = """
+    SELECT id,
+        first_value(id) OVER (PARTITION BY cart_id, fingerprint ORDER BY created_at, id) AS keep_id,
+        sum(quantity) OVER (PARTITION BY cart_id, fingerprint) AS quantity
+    FROM cart_item
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('cart_item', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    op.execute(f'UPDATE cart_item SET fingerprint = f.fingerprint FROM ({FINGERPRINTS}) f WHERE cart_item.id = f.id')
+    op.execute(f'UPDATE cart_item SET quantity = d.quantity FROM ({DUPLICATES}) d WHERE cart_item.id = d.id AND d.id = d.keep_id')
+    op.execute(f'DELETE FROM cart_item USING ({DUPLICATES}) d WHERE cart_item.id = d.id AND d.id <> d.keep_id')
+    op.alter_column('cart_item', 'fingerprint', existing_type=sa.String(length=64), nullable=False)
+    # the backfill commits first; CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('uq_cart_item_cart_id_fingerprint', 'cart_item', ['cart_id', 'fingerprint'], unique=True, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_cart_item_cart_id_fingerprint', table_name='cart_item', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('cart_item', 'fingerprint')
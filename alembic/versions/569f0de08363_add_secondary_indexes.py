@@ -0,0 +1,47 @@
+"""add secondary indexes
+
+Revision ID: 569f0de08363
+Revises: 138e8dc65e42
+Create Date: 2026-10-17 10:03:47.582190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '569f0de08363'
+down_revision: Union[str, Sequence[str], None] = '138e8dc65e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_order_status_created_at_id', 'orders', ['order_status', 'created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_order_item_order_id', 'order_item', ['order_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_order_item_topping_order_item_id', 'order_item_topping', ['order_item_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_notifications_user_id_created_at_unread', 'notifications', ['user_id', 'created_at'], unique=False, postgresql_where=sa.text('is_read = false'), postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_payments_order_id', 'payments', ['order_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_cart_user_id', 'cart', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_cart_item_cart_id', 'cart_item', ['cart_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_addresses_user_id', 'addresses', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_addresses_user_id', table_name='addresses', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_cart_item_cart_id', table_name='cart_item', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_cart_user_id', table_name='cart', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_payments_order_id', table_name='payments', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notifications_user_id_created_at_unread', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notifications_user_id_created_at', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_order_item_topping_order_item_id', table_name='order_item_topping', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_order_item_order_id', table_name='order_item', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_orders_order_status_created_at_id', table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,35 @@
+"""add sales rollup watermark
+
+Revision ID: 5b7e0c2f4a91
+Revises: 9d3f27a6c1b8
+Create Date: 2026-10-17 18:42:10.518320
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e0c2f4a91'
+down_revision: Union[str, Sequence[str], None] = '9d3f27a6c1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sales_rollup_watermark',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # carry over the implicit watermark of an existing rollup
+    op.execute('INSERT INTO sales_rollup_watermark (id, day) SELECT 1, max(day) FROM daily_order_stats HAVING max(day) IS NOT NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sales_rollup_watermark')
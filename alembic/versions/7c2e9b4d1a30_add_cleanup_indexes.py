@@ -0,0 +1,33 @@
+"""add cleanup indexes
+
+Revision ID: 7c2e9b4d1a30
+Revises: 1f6355d88259
+Create Date: 2026-10-17 13:02:18.440127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9b4d1a30'
+down_revision: Union[str, Sequence[str], None] = '1f6355d88259'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_cart_updated_at_guest', 'cart', ['updated_at'], unique=False, postgresql_where=sa.text('user_id IS NULL'), postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_notifications_expires_at', 'notifications', ['expires_at'], unique=False, postgresql_where=sa.text('expires_at IS NOT NULL'), postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_notifications_expires_at', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_cart_updated_at_guest', table_name='cart', postgresql_concurrently=True, if_exists=True)
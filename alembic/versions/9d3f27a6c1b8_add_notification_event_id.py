@@ -0,0 +1,33 @@
+"""add notification event id
+
+Revision ID: 9d3f27a6c1b8
+Revises: 4e8a61c0d9f2
+Create Date: 2026-10-17 15:08:33.274019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f27a6c1b8'
+down_revision: Union[str, Sequence[str], None] = '4e8a61c0d9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notifications', sa.Column('event_id', sa.String(length=64), nullable=True))
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('uq_notifications_event_id', 'notifications', ['event_id'], unique=True, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_notifications_event_id', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('notifications', 'event_id')
@@ -49,6 +49,7 @@ class Address(Base):
         nullable=False,
     )
     __table_args__ = (
+        Index("ix_addresses_user_id", "user_id"),
         Index(
             "unique_default_address_per_user",
             "user_id",
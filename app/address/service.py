@@ -4,7 +4,7 @@ from app.core.exceptions import (
     MaxAddressesExceededError,
     AddressNotFoundError,
 )
-from app.auth.model import User
+from app.auth.schema import AuthUser
 from app.address.schema import AddressCreate, AddressUpdate
 from app.address.model import Address
 from app.address.constants import MAX_ADDRESSES_PER_USER
@@ -15,7 +15,7 @@ class AddressesService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, data: AddressCreate, user: User):
+    async def create(self, data: AddressCreate, user: AuthUser):
         count_result = await self.session.scalar(
             select(func.count()).select_from(Address).where(Address.user_id == user.id)
         )
@@ -41,7 +41,7 @@ class AddressesService:
         await self.session.refresh(new_address)
         return new_address
 
-    async def get_all(self, user: User):
+    async def get_all(self, user: AuthUser):
         return (
             await self.session.scalars(
                 select(Address).where(Address.user_id == user.id)
@@ -56,7 +56,7 @@ class AddressesService:
             raise AddressNotFoundError()
         return address
 
-    async def update(self, address_id: UUID, data: AddressUpdate, user: User):
+    async def update(self, address_id: UUID, data: AddressUpdate, user: AuthUser):
         address = await self.get_one(address_id, user.id)
 
         update_data = data.model_dump(exclude_unset=True)
@@ -76,7 +76,7 @@ class AddressesService:
         await self.session.refresh(address)
         return address
 
-    async def delete(self, address_id: UUID, user: User):
+    async def delete(self, address_id: UUID, user: AuthUser):
         address = await self.get_one(address_id, user.id)
 
         is_default = address.is_default
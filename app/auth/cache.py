@@ -0,0 +1,86 @@
+import asyncio
+import time
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.auth.model import User
+from app.auth.schema import UserResponse
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.notifications.redis_pubsub import RedisPubSubService
+from app.utils.logger import logger
+
+USER_INVALIDATION_CHANNEL = "user_invalidations"
+
+# user_id -> UserResponse snapshot, for handlers that need more than the token claims
+user_cache = LRUCache(
+    maxsize=settings.USER_CACHE_MAX_ENTRIES, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+# user_id -> when the user last changed; access tokens issued before that carry
+# stale claims. Older tokens have expired anyway once the entry does.
+user_invalidated_at = LRUCache(
+    maxsize=settings.USER_CACHE_MAX_ENTRIES,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+# own connection: the notifications listener owns the shared pubsub
+invalidation_pubsub = RedisPubSubService()
+
+
+def claims_are_current(user_id: str, issued_at: float | None) -> bool:
+    invalidated_at = user_invalidated_at.get(user_id)
+    if invalidated_at is None:
+        return True
+    # iat has whole-second precision, so a tie counts as stale
+    return issued_at is not None and issued_at > invalidated_at
+
+
+async def get_cached_user(
+    session: AsyncSession, user_id: UUID | str
+) -> UserResponse | None:
+    key = str(user_id)
+    cached = user_cache.get(key)
+    if cached is not None:
+        return cached
+
+    user = await session.get(User, user_id)
+    if not user:
+        return None
+
+    snapshot = UserResponse.model_validate(user)
+    user_cache.set(key, snapshot)
+    return snapshot
+
+
+def invalidate_user_locally(user_id: str, at: float):
+    user_cache.pop(user_id)
+    user_invalidated_at.set(user_id, max(at, user_invalidated_at.get(user_id, 0)))
+
+
+async def invalidate_user(user_id: UUID | str):
+    """Drop the user's cached row and claims on every replica (role change, password reset...)."""
+    user_id = str(user_id)
+    at = time.time()
+    invalidate_user_locally(user_id, at)
+    await invalidation_pubsub.publish(
+        USER_INVALIDATION_CHANNEL, event_data={"user_id": user_id, "at": at}
+    )
+
+
+async def start_user_invalidation_listener():
+    try:
+        await invalidation_pubsub.subscribe(USER_INVALIDATION_CHANNEL)
+        logger.info("User invalidation listener started.")
+
+        async for message in invalidation_pubsub.listen():
+            data = message["data"]
+            try:
+                invalidate_user_locally(data["user_id"], float(data["at"]))
+            except Exception as e:
+                logger.error(f"Bad user invalidation {data}: {e}")
+    except asyncio.CancelledError:
+        logger.info("User invalidation listener cancelled")
+        await invalidation_pubsub.close()
+    except Exception as e:
+        logger.error(f"User invalidation listener error: {e}", exc_info=True)
+        await invalidation_pubsub.close()
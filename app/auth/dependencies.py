@@ -2,9 +2,12 @@ from fastapi.security import OAuth2PasswordBearer
 from fastapi.security.utils import get_authorization_scheme_param
 from fastapi import Depends, Request, Cookie
 from typing import Annotated
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import SessionDep, async_session
 from app.auth.utils import decode_token
-from app.auth.model import User, UserRole
+from app.auth.model import UserRole
+from app.auth.schema import AuthUser
+from app.auth.cache import claims_are_current, get_cached_user
 from app.libs.fastmail import FastMailService
 from app.core.exceptions import (
     UserNotFoundError,
@@ -47,15 +50,12 @@ class OAuth2PasswordBearerWithCookie(OAuth2PasswordBearer):
 oauth2_scheme = OAuth2PasswordBearerWithCookie(tokenUrl="/api/v1/auth/token")
 
 
-async def get_current_user(
-    session: SessionDep, token: Annotated[str, Depends(oauth2_scheme)]
-):
+def decode_access_token(token: str) -> dict:
     payload = decode_token(token)
     if not payload:
         raise InvalidTokenError()
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         raise InvalidTokenError(
             message="Token missing user identifier",
             error_code="INVALID_TOKEN_STRUCTURE",
@@ -66,14 +66,52 @@ async def get_current_user(
             message="Refresh token cannot be used for authentication",
             error_code="REFRESH_TOKEN_MISUSE",
         )
+    return payload
+
+
+def get_user_from_claims(payload: dict) -> AuthUser | None:
+    """
+    The caller straight from the token, or None when the claims can't be
+    trusted (tokens minted before role/verified claims, or the user changed
+    since the token was issued).
+    """
+    if "role" not in payload or "verified" not in payload:
+        return None
+    if not claims_are_current(payload["sub"], payload.get("iat")):
+        return None
+
+    return AuthUser(
+        id=payload["sub"],
+        email=payload.get("email", ""),
+        role=UserRole(payload["role"]),
+        is_verified=payload["verified"],
+    )
+
+
+async def get_auth_user(session: AsyncSession, payload: dict) -> AuthUser | None:
+    user = get_user_from_claims(payload)
+    if user:
+        return user
 
-    user = await session.get(User, user_id)
+    cached = await get_cached_user(session, payload["sub"])
+    if not cached:
+        return None
+    return AuthUser.model_validate(cached, from_attributes=True)
+
+
+async def get_current_user(
+    session: SessionDep, token: Annotated[str, Depends(oauth2_scheme)]
+) -> AuthUser:
+    """Authorize from the access-token claims; the session is only used for stale tokens."""
+    payload = decode_access_token(token)
+
+    user = await get_auth_user(session, payload)
     if not user:
         raise UserNotFoundError()
     return user
 
 
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
+CurrentUserDep = Annotated[AuthUser, Depends(get_current_user)]
 
 oauth2_optional = OAuth2PasswordBearerWithCookie(
     tokenUrl="/api/v1/auth/token",
@@ -83,7 +121,7 @@ oauth2_optional = OAuth2PasswordBearerWithCookie(
 
 async def get_optional_user(
     session: SessionDep, token: Annotated[str | None, Depends(oauth2_optional)] = None
-) -> User | None:
+) -> AuthUser | None:
     if not token:
         return None
     try:
@@ -92,7 +130,7 @@ async def get_optional_user(
         return None
 
 
-OptionalUserDep = Annotated[User | None, Depends(get_optional_user)]
+OptionalUserDep = Annotated[AuthUser | None, Depends(get_optional_user)]
 
 
 class RoleChecker:
@@ -105,53 +143,42 @@ class RoleChecker:
         return current_user
 
 
-AdminOnlyDep = Annotated[User, Depends(RoleChecker([UserRole.ADMIN]))]
+AdminOnlyDep = Annotated[AuthUser, Depends(RoleChecker([UserRole.ADMIN]))]
 
-UserOrAdminDep = Annotated[User, Depends(RoleChecker([UserRole.ADMIN, UserRole.USER]))]
+UserOrAdminDep = Annotated[
+    AuthUser, Depends(RoleChecker([UserRole.ADMIN, UserRole.USER]))
+]
 
 
-async def get_current_user_ws(
-    websocket: WebSocket,
-    token: Annotated[str | None, Cookie(alias="access_token")] = None,
-):
+async def get_ws_user(token: str | None) -> AuthUser:
     if token is None:
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
 
     payload = decode_token(token)
-    if not payload:
+    if not payload or not payload.get("sub") or payload.get("refresh"):
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    user = get_user_from_claims(payload)
+    if not user:
+        async with async_session() as session:
+            user = await get_auth_user(session, payload)
+    if not user:
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
-
-    async with async_session() as session:
-        user = await session.get(User, user_id)
-        if not user:
-            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
-
     return user
 
 
-async def get_current_admin_ws(
+async def get_current_user_ws(
     websocket: WebSocket,
     token: Annotated[str | None, Cookie(alias="access_token")] = None,
-):
-    if token is None:
-        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+) -> AuthUser:
+    return await get_ws_user(token)
 
-    payload = decode_token(token)
-    if not payload:
-        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
 
-    user_id = payload.get("sub")
-
-    if not user_id:
+async def get_current_admin_ws(
+    websocket: WebSocket,
+    token: Annotated[str | None, Cookie(alias="access_token")] = None,
+) -> AuthUser:
+    user = await get_ws_user(token)
+    if user.role != UserRole.ADMIN:
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
-
-    async with async_session() as session:
-        user = await session.get(User, user_id)
-        if not user or user.role != UserRole.ADMIN:
-            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
-
     return user
@@ -15,8 +15,9 @@ from app.auth.schema import (
     UserPassword,
 )
 from app.auth.dependencies import CurrentUserDep
+from app.auth.cache import get_cached_user
 from app.core.config import settings
-from app.core.exceptions import InvalidRefreshTokenError
+from app.core.exceptions import InvalidRefreshTokenError, UserNotFoundError
 
 auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -165,9 +166,12 @@ async def logout(
 
 
 @auth_router.get("/me", response_model=UserResponse)
-async def get_me(current_user: CurrentUserDep):
+async def get_me(session: SessionDep, current_user: CurrentUserDep):
     """Get current user information"""
-    return current_user
+    user = await get_cached_user(session, current_user.id)
+    if not user:
+        raise UserNotFoundError()
+    return user
 
 
 @auth_router.post("/resend-verification")
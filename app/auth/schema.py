@@ -28,6 +28,15 @@ class UserResponse(UserBase):
     role: UserRole
 
 
+class AuthUser(BaseSchema):
+    """The caller as described by access-token claims (no users row loaded)."""
+
+    id: UUID
+    email: str
+    role: UserRole
+    is_verified: bool
+
+
 class RegistrationResponse(BaseSchema):
     message: str
     user: UserResponse
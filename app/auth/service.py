@@ -1,15 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import timedelta
-from app.auth.schema import UserCreate, UserLogin
+from app.auth.schema import UserCreate, UserLogin, UserResponse
 from app.auth.model import User, UserRole
 from app.auth.utils import (
-    get_password_hash,
+    hash_password_async,
     generate_urlsafe_token,
-    verify_password,
+    verify_and_update_password_async,
     create_token,
     decode_token,
 )
+from app.auth.cache import invalidate_user, get_cached_user
 from app.core.config import settings
 from app.core.redis import RedisService
 from app.utils.templates.email_templates import (
@@ -55,7 +56,7 @@ class AuthService:
         if existing_user:
             raise UserAlreadyExistsError()
 
-        password_hash = get_password_hash(user_credentials.password)
+        password_hash = await hash_password_async(user_credentials.password)
 
         user = User(
             email=user_credentials.email,
@@ -83,6 +84,7 @@ class AuthService:
         user.is_verified = True
         await self.session.commit()
         await self.session.refresh(user)
+        await invalidate_user(user.id)
 
         await self.redis.delete_token(token, token_type="verification")
 
@@ -96,17 +98,32 @@ class AuthService:
     async def authenticate_user(self, credentials: UserLogin) -> User:
         user = await self.get_user_by_email(credentials.email)
 
-        if not user or not verify_password(credentials.password, user.password_hash):
+        if not user:
+            raise InvalidCredentialsError()
+
+        is_valid, new_hash = await verify_and_update_password_async(
+            credentials.password, user.password_hash
+        )
+        if not is_valid:
             raise InvalidCredentialsError()
+        if new_hash:
+            # stored hash predates the configured scheme/cost
+            user.password_hash = new_hash
+            await self.session.commit()
+
         if not user.is_verified:
             raise UnverifiedAccountError()
         return user
 
-    async def generate_tokens(self, user: User) -> tuple[str, str]:
+    def _create_token_pair(self, user: User | UserResponse) -> tuple[str, str, str]:
+        """Access token, refresh token and the refresh token's jti."""
         access_token, _ = create_token(
             sub=str(user.id),
+            # lets most requests authorize from the token alone, see get_current_user
             payload={
                 "email": user.email,
+                "role": user.role.value,
+                "verified": user.is_verified,
             },
         )
         refresh_token, refresh_payload = create_token(
@@ -114,8 +131,11 @@ class AuthService:
             refresh=True,
             expiry=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
         )
+        return access_token, refresh_token, refresh_payload["jti"]
+
+    async def generate_tokens(self, user: User) -> tuple[str, str]:
+        access_token, refresh_token, refresh_jti = self._create_token_pair(user)
         # Store in Redis with expiration
-        refresh_jti = refresh_payload["jti"]
         await self.redis.store_refresh_jti(
             refresh_jti,
             str(user.id),
@@ -132,26 +152,27 @@ class AuthService:
         if not user_id or not refresh_jti:
             raise InvalidRefreshTokenError()
 
-        token_valid = await self.redis.validate_refresh_jti(refresh_jti, user_id)
-        if not token_valid:
-            raise InvalidRefreshTokenError()
-
-        user = await self.session.get(User, user_id)
+        user = await get_cached_user(self.session, user_id)
         if not user:
             raise UserNotFoundError()
 
-        # Delete the old refresh-token-id from redis
-        await self.redis.revoke_refresh_jti(refresh_jti)
+        access_token, new_refresh_token, new_jti = self._create_token_pair(user)
+
+        # validate + revoke the old jti + store the new one in a single atomic call,
+        # so concurrent refreshes with the same token can't both succeed
+        rotated = await self.redis.rotate_refresh_jti(refresh_jti, new_jti, user_id)
+        if not rotated:
+            raise InvalidRefreshTokenError()
 
-        return await self.generate_tokens(user)
+        return access_token, new_refresh_token
 
     async def logout_user(self, refresh_token: str):
         payload = decode_token(refresh_token)
         if payload and payload.get("refresh"):
             refresh_jti = payload.get("jti")
-            if refresh_jti:
+            if refresh_jti and payload.get("sub"):
                 # Remove refresh token-id from Redis
-                await self.redis.revoke_refresh_jti(refresh_jti)
+                await self.redis.revoke_refresh_jti(refresh_jti, payload["sub"])
 
     async def resend_verification_token(self, email: str):
         user = await self.get_user_by_email(email)
@@ -224,10 +245,11 @@ class AuthService:
 
         await self.redis.delete_token(token, token_type="reset")
 
-        password_hash = get_password_hash(password)
+        password_hash = await hash_password_async(password)
         user.password_hash = password_hash
         await self.session.commit()
         await self.session.refresh(user)
+        await invalidate_user(user.id)
 
         # revoke all refresh-tokens-ids for this user
         await self.redis.revoke_all_user_refresh_jtis(str(user.id))
@@ -4,8 +4,41 @@ from uuid import uuid4
 import jwt
 import secrets
 from app.core.config import settings
+from app.core.executor import BoundedExecutor
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PASSWORD_HASH_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_pwd_context() -> CryptContext:
+    """
+    Hash with PASSWORD_HASH_SCHEME at the configured cost. Hashes in another
+    scheme, or at a different cost, still verify but report needs_update.
+    """
+    scheme = settings.PASSWORD_HASH_SCHEME
+    return CryptContext(
+        schemes=[scheme, *(s for s in PASSWORD_HASH_SCHEMES if s != scheme)],
+        deprecated="auto",
+        # min == max == default, so raising or lowering the cost both upgrade
+        bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+        argon2__type="ID",
+        argon2__default_rounds=settings.ARGON2_TIME_COST,
+        argon2__min_rounds=settings.ARGON2_TIME_COST,
+        argon2__max_rounds=settings.ARGON2_TIME_COST,
+        argon2__memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+        argon2__parallelism=settings.ARGON2_PARALLELISM,
+    )
+
+
+pwd_context = build_pwd_context()
+
+# a hash/verify costs ~100ms+ of CPU per call, keep it off the event loop
+password_hash_pool = BoundedExecutor(
+    "password-hash",
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
 
 
 def get_password_hash(password: str) -> str:
@@ -16,16 +49,39 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hash=hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """get_password_hash on the hashing pool; raises ServiceBusyError when saturated."""
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify, and return a fresh hash when the stored one uses an outdated scheme/cost."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """verify_and_update_password on the hashing pool; raises ServiceBusyError when saturated."""
+    return await password_hash_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
 def create_token(
     sub: str,
     payload: dict | None = None,
     expiry: timedelta | None = None,
     refresh: bool = False,
 ) -> tuple[str, dict]:
+    now = datetime.now(timezone.utc)
     encode = {
         **(payload or {}),
         "sub": sub,
-        "exp": datetime.now(timezone.utc)
+        "iat": now,
+        "exp": now
         + (expiry or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)),
         "jti": str(uuid4()),
         "refresh": refresh,
@@ -8,6 +8,8 @@ from sqlalchemy import (
     Column,
     Integer,
     DECIMAL,
+    Index,
+    String,
 )
 from datetime import datetime
 import uuid
@@ -66,6 +68,8 @@ class CartItem(Base):
     toppings: Mapped[list["Topping"]] = relationship(
         "Topping", secondary=cart_item_topping, back_populates="cart_items"
     )
+    # sha256 of pizza/size/crust/sorted topping ids, see cart_item_fingerprint
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
     )
@@ -76,6 +80,15 @@ class CartItem(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        Index("ix_cart_item_cart_id", "cart_id"),
+        Index(
+            "uq_cart_item_cart_id_fingerprint", "cart_id", "fingerprint", unique=True
+        ),
+    )
+    # RETURNING server-side timestamps so mutated carts serialize without a reload
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<CartItem(id={self.id})>"
 
@@ -115,5 +128,17 @@ class Cart(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        Index("ix_cart_user_id", "user_id"),
+        # abandoned guest carts, see DatabaseCartService.purge_guest_carts
+        Index(
+            "ix_cart_updated_at_guest",
+            "updated_at",
+            postgresql_where=(user_id.is_(None)),
+        ),
+    )
+    # RETURNING server-side timestamps so mutated carts serialize without a reload
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<Cart(id={self.id})>"
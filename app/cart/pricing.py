@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable
+from app.cart.constants import TAX_RATE, DELIVERY_CHARGE
+from app.cart.model import Cart, CartItem
+from app.menu.model import Pizza, Size, Crust, Topping
+from app.menu.schema import PizzaResponse, SizeResponse, CrustResponse, ToppingResponse
+
+CENT = Decimal("0.01")
+
+
+def to_money(amount: Decimal) -> Decimal:
+    """Round to cents the same way the DECIMAL(10, 2) columns store it."""
+    return Decimal(amount).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True, slots=True)
+class LinePrice:
+    base_pizza_price: Decimal
+    size_price: Decimal
+    crust_price: Decimal
+    toppings_total_price: Decimal
+    unit_price: Decimal
+    total_price: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class Totals:
+    subtotal: Decimal
+    tax: Decimal
+    delivery_charge: Decimal
+    total: Decimal
+
+
+def price_line(
+    pizza: Pizza | PizzaResponse,
+    size: Size | SizeResponse,
+    crust: Crust | CrustResponse,
+    toppings: Iterable[Topping | ToppingResponse],
+    quantity: int,
+) -> LinePrice:
+    """
+    Price one pizza configuration (shared by cart items and order lines).
+    Accepts ORM rows or the menu response schemas cached in the catalog.
+    """
+    base_pizza_price = to_money(pizza.base_price)
+    # str() keeps float multipliers (menu schemas) exact
+    size_price = to_money(base_pizza_price * Decimal(str(size.multiplier)))
+    crust_price = to_money(crust.additional_price)
+    toppings_total_price = to_money(sum((t.price for t in toppings), Decimal("0")))
+    unit_price = size_price + crust_price + toppings_total_price
+
+    return LinePrice(
+        base_pizza_price=base_pizza_price,
+        size_price=size_price,
+        crust_price=crust_price,
+        toppings_total_price=toppings_total_price,
+        unit_price=unit_price,
+        total_price=unit_price * quantity,
+    )
+
+
+def price_totals(subtotal: Decimal) -> Totals:
+    """Tax and delivery on top of a subtotal; nothing to deliver means no charge."""
+    subtotal = to_money(subtotal)
+    tax = to_money(subtotal * TAX_RATE)
+    delivery_charge = DELIVERY_CHARGE if subtotal > 0 else Decimal("0.00")
+
+    return Totals(
+        subtotal=subtotal,
+        tax=tax,
+        delivery_charge=delivery_charge,
+        total=subtotal + tax + delivery_charge,
+    )
+
+
+def price_cart_item(item: CartItem) -> Decimal:
+    """Set and return the item total from its loaded pizza/size/crust/toppings."""
+    item.total = price_line(
+        item.pizza, item.size, item.crust, item.toppings, item.quantity
+    ).total_price
+    return item.total
+
+
+def price_cart(cart: Cart) -> Cart:
+    """
+    Reprice every item and the cart totals in one pass over the loaded graph,
+    no aggregate query needed.
+    """
+    totals = price_totals(
+        sum((price_cart_item(item) for item in cart.cart_items), Decimal("0"))
+    )
+    cart.subtotal = totals.subtotal
+    cart.tax = totals.tax
+    cart.delivery_charge = totals.delivery_charge
+    cart.total = totals.total
+    return cart
@@ -1,20 +1,59 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.cart.schema import CartItemCreate, CartItemUpdate
-from app.cart.model import Cart, CartItem
-from app.menu.service import PizzaService, SizeService, CrustService
-from sqlalchemy import select, delete, func
+from app.cart.schema import (
+    CartItemCreate,
+    CartItemUpdate,
+    CartItemResponse,
+    CartResponse,
+)
+from app.cart.model import Cart, CartItem, cart_item_topping
+from app.cart.store import CartWrites, RedisCartStore, cart_store
+from app.cart.utils import cart_item_fingerprint
+from app.menu.service import (
+    PizzaService,
+    SizeService,
+    CrustService,
+    ToppingService,
+    MenuCatalogService,
+)
+from app.menu.schema import (
+    PizzaResponse,
+    SizeResponse,
+    CrustResponse,
+    ToppingResponse,
+)
+from sqlalchemy import (
+    select,
+    delete,
+    insert,
+    update,
+    func,
+    values,
+    column,
+    Uuid,
+    Integer,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
-from app.menu.model import Topping
+from sqlalchemy.orm.attributes import set_committed_value
 from uuid import UUID
+from app.core.config import settings
+from app.core.database import delete_in_batches
 from app.core.exceptions import (
+    CartConflictError,
     CartNotFoundError,
     ToppingNotFoundError,
     CartItemNotFoundError,
+    PizzaNotFoundError,
+    SizeNotFoundError,
+    CrustNotFoundError,
 )
-from app.cart.constants import TAX_RATE, DELIVERY_CHARGE
+from app.cart.pricing import price_cart, price_line, price_totals
 from app.menu.model import Pizza
+from app.utils.logger import logger
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-import asyncio
+from redis.exceptions import WatchError
+import uuid
 
 CART_ITEM_OPTIONS = (
     selectinload(CartItem.pizza).selectinload(Pizza.default_toppings),
@@ -24,19 +63,23 @@ CART_ITEM_OPTIONS = (
 )
 
 
-class CartService:
+class DatabaseCartService:
     def __init__(
         self,
         session: AsyncSession,
     ):
         self.session = session
 
-    async def _load_cart(self, cart_id: UUID):
-        """Always return a fully loaded cart with all relationships"""
+    async def _load_cart(self, cart_id: UUID, refresh: bool = False):
+        """
+        Always return a fully loaded cart with all relationships. `refresh`
+        overwrites objects already in the session after bulk statements.
+        """
         return await self.session.scalar(
             select(Cart)
             .where(Cart.id == cart_id)
             .options(selectinload(Cart.cart_items).options(*CART_ITEM_OPTIONS))
+            .execution_options(populate_existing=refresh)
         )
 
     async def get_guest_cart(self, guest_cart_id: UUID) -> Cart | None:
@@ -79,133 +122,139 @@ class CartService:
     async def merge_guest_cart_to_user(
         self, guest_cart_id: UUID, user_id: UUID
     ) -> Cart:
-        """Merge guest cart into user cart when user logs in"""
-        # Get guest cart (which has the given cart-id and user-id is null)
-        guest_cart = await self.get_guest_cart(guest_cart_id)
+        """
+        Merge guest cart into user cart when user logs in.
 
-        if not guest_cart:
+        Items are matched by configuration fingerprint, so the merge is a handful
+        of set-based statements regardless of how many items either cart holds.
+        """
+        # Get guest cart (which has the given cart-id and user-id is null)
+        guest_cart_id = await self.session.scalar(
+            select(Cart.id).where(Cart.id == guest_cart_id, Cart.user_id.is_(None))
+        )
+        if not guest_cart_id:
             # No guest cart exists, just return or create user cart
             return await self.get_or_create_user_cart(user_id)
 
         # Guest-cart exists, check for user-cart
-        user_cart = await self.get_user_cart(user_id)
-
-        if not user_cart:
+        user_cart_id = await self.session.scalar(
+            select(Cart.id).where(Cart.user_id == user_id)
+        )
+        if not user_cart_id:
             # No existing user cart, just assign guest cart to user
-            guest_cart.user_id = user_id
+            await self.session.execute(
+                update(Cart).where(Cart.id == guest_cart_id).values(user_id=user_id)
+            )
             await self.session.commit()
-            return await self._load_cart(guest_cart.id)
+            return await self._load_cart(guest_cart_id)
 
-        # Both guest-cart and user-cart exists, Loop over guest-cart-items and merge them (if already exists) or insert them into user cart
-        for guest_item in guest_cart.cart_items:
-            existing_item = await self._find_matching_cart_item(user_cart, guest_item)
-
-            if existing_item:
-                # Increment quantity
-                existing_item.quantity += guest_item.quantity
-                existing_item.total = self._calculate_item_total(existing_item)
+        result = await self.session.execute(
+            select(
+                CartItem.id, CartItem.cart_id, CartItem.fingerprint, CartItem.quantity
+            ).where(CartItem.cart_id.in_([guest_cart_id, user_cart_id]))
+        )
+        user_items: dict[str, UUID] = {}
+        guest_items = []
+        for item in result.all():
+            if item.cart_id == user_cart_id:
+                user_items[item.fingerprint] = item.id
             else:
-                # Copy guest item to user cart
-                new_item = CartItem(
-                    cart_id=user_cart.id,
-                    pizza_id=guest_item.pizza_id,
-                    size_id=guest_item.size_id,
-                    crust_id=guest_item.crust_id,
-                    quantity=guest_item.quantity,
-                    total=guest_item.total,
-                    toppings=guest_item.toppings,
-                )
-                self.session.add(new_item)
+                guest_items.append(item)
+
+        bumps = [
+            (user_items[item.fingerprint], item.quantity)
+            for item in guest_items
+            if item.fingerprint in user_items
+        ]
+        moved_ids = [
+            item.id for item in guest_items if item.fingerprint not in user_items
+        ]
+
+        if bumps:
+            # Same configuration already in the user cart: add the guest quantity,
+            # item totals are repriced below
+            guest_values = values(
+                column("id", Uuid),
+                column("quantity", Integer),
+                name="guest_items",
+            ).data(bumps)
+            await self.session.execute(
+                update(CartItem)
+                .where(CartItem.id == guest_values.c.id)
+                .values(quantity=CartItem.quantity + guest_values.c.quantity)
+                .execution_options(synchronize_session=False)
+            )
+        if moved_ids:
+            # New configurations move over as-is, toppings included
+            await self.session.execute(
+                update(CartItem)
+                .where(CartItem.id.in_(moved_ids))
+                .values(cart_id=user_cart_id)
+                .execution_options(synchronize_session=False)
+            )
 
-        # Delete guest cart - cascade will handle guest_cart_items automatically!
-        await self.session.delete(guest_cart)
-        await self._recalculate_cart_totals(user_cart)
+        # Delete guest cart - cascade will handle the merged guest items
+        await self.session.execute(delete(Cart).where(Cart.id == guest_cart_id))
+
+        user_cart = await self._load_cart(user_cart_id, refresh=True)
+        price_cart(user_cart)
         await self.session.commit()
-        return await self._load_cart(user_cart.id)
-
-    async def _find_matching_cart_item(
-        self, cart: Cart, item: CartItem
-    ) -> CartItem | None:
-        """Find cart item with same pizza configuration"""
-        for cart_item in cart.cart_items:
-            if (
-                cart_item.pizza_id == item.pizza_id
-                and cart_item.size_id == item.size_id
-                and cart_item.crust_id == item.crust_id
-            ):
-                cart_item_toppings = set(t.id for t in cart_item.toppings)
-                item_toppings = set(t.id for t in item.toppings)
-
-                if cart_item_toppings == item_toppings:
-                    return cart_item
-
-        return None
+        return user_cart
 
     async def add_item_to_cart(self, cart_id: UUID, item_data: CartItemCreate):
-        """Add item to cart"""
-        cart = await self._load_cart(cart_id)
-        if not cart:
+        """
+        Add item to cart. Adding a configuration the cart already holds bumps its
+        quantity through the unique (cart_id, fingerprint) index instead of
+        matching against the loaded items.
+        """
+        if not await self.session.get(Cart, cart_id):
             raise CartNotFoundError()
 
-        pizza, size, crust = await asyncio.gather(
-            PizzaService(self.session).get_one(item_data.pizza_id),
-            SizeService(self.session).get_one(item_data.size_id),
-            CrustService(self.session).get_one(item_data.crust_id),
-        )
-
-        # Check if identical item already exists, if yes then simply increase the quantity and recalculate the totals
-        existing_item = await self._find_existing_item(cart, item_data)
-
-        if existing_item:
-            existing_item.quantity += item_data.quantity
-            existing_item.total = self._calculate_item_total(existing_item)
-            await self._recalculate_cart_totals(cart)
-            await self.session.commit()
-            return await self._load_cart(cart.id)
+        await PizzaService(self.session).get_many([item_data.pizza_id])
+        await SizeService(self.session).get_many([item_data.size_id])
+        await CrustService(self.session).get_many([item_data.crust_id])
+        topping_ids = set(item_data.topping_ids or [])
+        if topping_ids:
+            await ToppingService(self.session).get_many(topping_ids)
 
-        # CartItem does not exist so create a new one
-        cart_item = CartItem(
+        stmt = pg_insert(CartItem).values(
+            id=uuid.uuid4(),
             cart_id=cart_id,
-            pizza=pizza,
-            size=size,
-            crust=crust,
+            pizza_id=item_data.pizza_id,
+            size_id=item_data.size_id,
+            crust_id=item_data.crust_id,
+            fingerprint=cart_item_fingerprint(
+                item_data.pizza_id, item_data.size_id, item_data.crust_id, topping_ids
+            ),
             quantity=item_data.quantity,
             total=Decimal("0"),
         )
-
-        # Add toppings if specified
-        if item_data.topping_ids:
-            toppings = list(
-                await self.session.scalars(
-                    select(Topping).where(Topping.id.in_(item_data.topping_ids))
+        cart_item_id = await self.session.scalar(
+            stmt.on_conflict_do_update(
+                index_elements=[CartItem.cart_id, CartItem.fingerprint],
+                set_={
+                    "quantity": CartItem.quantity + stmt.excluded.quantity,
+                    "updated_at": func.now(),
+                },
+            ).returning(CartItem.id)
+        )
+        if topping_ids:
+            # Same fingerprint means same toppings, so this is a no-op on a bump
+            await self.session.execute(
+                pg_insert(cart_item_topping)
+                .values(
+                    [
+                        {"cart_item_id": cart_item_id, "topping_id": topping_id}
+                        for topping_id in topping_ids
+                    ]
                 )
+                .on_conflict_do_nothing()
             )
-            if len(toppings) != len(item_data.topping_ids):
-                raise ToppingNotFoundError(message="One or more toppings not found")
-            cart_item.toppings = toppings
 
-        cart_item.total = self._calculate_item_total(cart_item)
-        self.session.add(cart_item)
-        await self._recalculate_cart_totals(cart)
+        cart = await self._load_cart(cart_id, refresh=True)
+        price_cart(cart)
         await self.session.commit()
-        return await self._load_cart(cart.id)
-
-    async def _find_existing_item(
-        self, cart: Cart, item_data: CartItemCreate
-    ) -> CartItem | None:
-        """Find existing cart item with same configuration"""
-        topping_ids = set(item_data.topping_ids or [])
-
-        for cart_item in cart.cart_items:
-            if (
-                cart_item.pizza_id == item_data.pizza_id
-                and cart_item.crust_id == item_data.crust_id
-                and cart_item.size_id == item_data.size_id
-            ):
-                item_topping_ids = set(t.id for t in cart_item.toppings)
-                if topping_ids == item_topping_ids:
-                    return cart_item
-        return None
+        return cart
 
     async def update_cart_item(
         self, cart_item_id: UUID, update_data: CartItemUpdate
@@ -224,11 +273,10 @@ class CartService:
             raise CartItemNotFoundError()
 
         cart_item.quantity = update_data.quantity
-        cart_item.total = self._calculate_item_total(cart_item)
 
-        await self._recalculate_cart_totals(cart_item.cart)
+        cart = price_cart(cart_item.cart)
         await self.session.commit()
-        return await self._load_cart(cart_item.cart_id)
+        return cart
 
     async def remove_cart_item(self, cart_item_id: UUID):
         """Remove item from cart"""
@@ -244,10 +292,12 @@ class CartService:
         if not cart_item:
             raise CartItemNotFoundError()
 
-        await self.session.delete(cart_item)
-        await self._recalculate_cart_totals(cart_item.cart)
+        cart = cart_item.cart
+        # delete-orphan cascade deletes the row on flush
+        cart.cart_items.remove(cart_item)
+        price_cart(cart)
         await self.session.commit()
-        return await self._load_cart(cart_item.cart_id)
+        return cart
 
     async def clear_cart(self, cart_id: UUID):
         """Clear all items from cart"""
@@ -257,31 +307,453 @@ class CartService:
 
         await self.session.execute(delete(CartItem).where(CartItem.cart_id == cart_id))
 
-        cart.subtotal = Decimal("0")
-        cart.tax = Decimal("0")
-        cart.delivery_charge = Decimal("0")
-        cart.total = Decimal("0")
+        set_committed_value(cart, "cart_items", [])
+        price_cart(cart)
 
         await self.session.commit()
-        return await self._load_cart(cart_id)
+        return cart
+
+    async def purge_guest_carts(
+        self,
+        retention_days: int = settings.GUEST_CART_RETENTION_DAYS,
+        batch_size: int = settings.CLEANUP_BATCH_SIZE,
+        max_batches: int | None = settings.CLEANUP_MAX_BATCHES,
+    ) -> int:
+        """
+        Delete guest carts untouched for `retention_days`; their items and item
+        toppings go with them through ON DELETE CASCADE.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        return await delete_in_batches(
+            self.session,
+            Cart,
+            Cart.user_id.is_(None),
+            Cart.updated_at < cutoff,
+            batch_size=batch_size,
+            max_batches=max_batches,
+        )
 
-    def _calculate_item_total(self, item: CartItem) -> Decimal:
-        base_price = Decimal(item.pizza.base_price)
-        crust_price = Decimal(item.crust.additional_price)
-        toppings_price = sum(Decimal(t.price) for t in item.toppings)
-        size_price = base_price * Decimal(item.size.multiplier)
-        return (size_price + crust_price + toppings_price) * item.quantity
 
-    async def _recalculate_cart_totals(self, cart: Cart):
-        """Recalculate cart totals"""
-        result = await self.session.execute(
-            select(func.sum(CartItem.total)).where(CartItem.cart_id == cart.id)
+class RedisCartService(DatabaseCartService):
+    """
+    Same API as DatabaseCartService, but active carts live in redis (see
+    RedisCartStore) and are priced in-process from the cached menu catalog.
+
+    Guest carts never touch postgres. User carts are written behind to the
+    cart/cart_item tables on login merge and by the idle flush task; carts
+    missing from redis are hydrated from postgres on first access. Every change
+    to a stored cart is a WATCHed read-modify-write (RedisCartStore.update).
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        store: RedisCartStore | None = None,
+    ):
+        super().__init__(session)
+        self.store = store or cart_store
+        self._catalog: dict | None = None
+
+    async def get_guest_cart(self, guest_cart_id: UUID) -> CartResponse | None:
+        """Get guest cart"""
+        state = await self._get_state(guest_cart_id)
+        if not state or state["user_id"] is not None:
+            return None
+        return await self._build_cart(state)
+
+    async def get_or_create_guest_cart(
+        self, cart_id: UUID | None = None
+    ) -> CartResponse:
+        """Get existing guest cart or create a new one"""
+        if cart_id:
+            cart = await self.get_guest_cart(cart_id)
+            if cart:
+                return cart
+        return await self._save(self._new_state(user_id=None))
+
+    async def get_user_cart(self, user_id: UUID) -> CartResponse | None:
+        """Get user's persistent cart"""
+        state = await self._get_user_state(user_id)
+        if not state:
+            return None
+        return await self._build_cart(state)
+
+    async def get_or_create_user_cart(self, user_id: UUID) -> CartResponse:
+        """Get existing user cart or create a new one"""
+        state = await self._get_user_state(user_id)
+        if state:
+            return await self._build_cart(state)
+        return await self._save(self._new_state(user_id=user_id))
+
+    async def merge_guest_cart_to_user(
+        self, guest_cart_id: UUID, user_id: UUID
+    ) -> CartResponse:
+        """Merge guest cart into user cart when user logs in, then write it behind"""
+        user_cart_id = await self._get_user_cart_id(user_id)
+        cart_ids = [guest_cart_id] + ([user_cart_id] if user_cart_id else [])
+
+        def merge(writes: CartWrites, guest_state, user_state=None):
+            if not guest_state or guest_state["user_id"] is not None:
+                return None
+            if not user_state:
+                # No existing user cart, just assign guest cart to user
+                guest_state["user_id"] = str(user_id)
+                return self._stage(writes, guest_state, write_through=True)
+
+            items_by_fingerprint = {
+                self._fingerprint(item): item for item in user_state["items"].values()
+            }
+            for item_id, guest_item in guest_state["items"].items():
+                existing_item = items_by_fingerprint.get(self._fingerprint(guest_item))
+                if existing_item:
+                    existing_item["quantity"] += guest_item["quantity"]
+                    existing_item["updated_at"] = self._now()
+                else:
+                    user_state["items"][item_id] = guest_item
+
+            writes.delete(guest_state)
+            return self._stage(writes, user_state, write_through=True)
+
+        state = await self._update(cart_ids, merge)
+        if state is None:
+            return await self.get_or_create_user_cart(user_id)
+
+        if state["id"] != str(guest_cart_id):
+            # the guest cart may have been persisted before the backend was switched
+            await self.session.execute(
+                delete(Cart).where(Cart.id == guest_cart_id, Cart.user_id.is_(None))
+            )
+        return await self._respond(state, write_through=True)
+
+    async def add_item_to_cart(
+        self, cart_id: UUID, item_data: CartItemCreate
+    ) -> CartResponse:
+        """Add item to cart"""
+        catalog = await self._get_catalog()
+        if str(item_data.pizza_id) not in catalog["pizzas"]:
+            raise PizzaNotFoundError()
+        if str(item_data.size_id) not in catalog["sizes"]:
+            raise SizeNotFoundError()
+        if str(item_data.crust_id) not in catalog["crusts"]:
+            raise CrustNotFoundError()
+
+        topping_ids = sorted({str(t) for t in item_data.topping_ids or []})
+        if any(t not in catalog["toppings"] for t in topping_ids):
+            raise ToppingNotFoundError(message="One or more toppings not found")
+
+        now = self._now()
+        new_item = {
+            "pizza_id": str(item_data.pizza_id),
+            "size_id": str(item_data.size_id),
+            "crust_id": str(item_data.crust_id),
+            "topping_ids": topping_ids,
+            "quantity": item_data.quantity,
+            "created_at": now,
+            "updated_at": now,
+        }
+        new_item_id = str(uuid.uuid4())
+
+        def add(writes: CartWrites, state):
+            if not state:
+                raise CartNotFoundError()
+            # Same configuration already in the cart, just increase the quantity
+            for item in state["items"].values():
+                if self._fingerprint(item) == self._fingerprint(new_item):
+                    item["quantity"] += item_data.quantity
+                    item["updated_at"] = now
+                    break
+            else:
+                state["items"][new_item_id] = dict(new_item)
+            return self._stage(writes, state)
+
+        return await self._respond(await self._update([cart_id], add))
+
+    async def update_cart_item(
+        self, cart_item_id: UUID, update_data: CartItemUpdate
+    ) -> CartResponse:
+        """Update cart item quantity"""
+
+        def update_item(writes: CartWrites, state):
+            item = self._get_item(state, cart_item_id)
+            item["quantity"] = update_data.quantity
+            item["updated_at"] = self._now()
+            return self._stage(writes, state)
+
+        cart_id = await self._get_item_cart_id(cart_item_id)
+        return await self._respond(await self._update([cart_id], update_item))
+
+    async def remove_cart_item(self, cart_item_id: UUID) -> CartResponse:
+        """Remove item from cart"""
+
+        def remove_item(writes: CartWrites, state):
+            self._get_item(state, cart_item_id)
+            del state["items"][str(cart_item_id)]
+            writes.forget_item(cart_item_id)
+            return self._stage(writes, state)
+
+        cart_id = await self._get_item_cart_id(cart_item_id)
+        return await self._respond(await self._update([cart_id], remove_item))
+
+    async def clear_cart(self, cart_id: UUID) -> CartResponse:
+        """Clear all items from cart"""
+
+        def clear(writes: CartWrites, state):
+            if not state:
+                raise CartNotFoundError()
+            for item_id in state["items"]:
+                writes.forget_item(item_id)
+            state["items"] = {}
+            return self._stage(writes, state)
+
+        return await self._respond(await self._update([cart_id], clear))
+
+    async def flush_idle_carts(
+        self, idle_seconds: float = settings.CART_IDLE_FLUSH_SECONDS
+    ) -> int:
+        """Write behind every user cart untouched for `idle_seconds`."""
+        cart_ids, cutoff = await self.store.get_idle_cart_ids(idle_seconds)
+        if not cart_ids:
+            return 0
+
+        # Workers run outside the api event loop, so skip the shared menu cache
+        self._catalog = await MenuCatalogService(self.session).get_catalog(
+            use_cache=False
         )
-        subtotal = result.scalar() or Decimal("0")
-        cart.subtotal = Decimal(subtotal)
-        cart.tax = subtotal * Decimal(TAX_RATE)
-        cart.delivery_charge = (
-            Decimal(DELIVERY_CHARGE) if subtotal > Decimal("0") else Decimal("0")
+        flushed = 0
+        for cart_id in cart_ids:
+            state = await self.store.load(cart_id)
+            if state and state["user_id"]:
+                await self._write_behind(state, await self._build_cart(state))
+                flushed += 1
+            await self.store.mark_clean(cart_id, cutoff)
+        return flushed
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    @staticmethod
+    def _fingerprint(item: dict) -> str:
+        return cart_item_fingerprint(
+            item["pizza_id"], item["size_id"], item["crust_id"], item["topping_ids"]
         )
-        cart.total = subtotal + cart.tax + cart.delivery_charge
+
+    def _new_state(self, user_id: UUID | None) -> dict:
+        now = self._now()
+        return {
+            "id": str(uuid.uuid4()),
+            "user_id": str(user_id) if user_id else None,
+            "created_at": now,
+            "updated_at": now,
+            "items": {},
+        }
+
+    def _state_from_cart(self, cart: Cart) -> dict:
+        return {
+            "id": str(cart.id),
+            "user_id": str(cart.user_id) if cart.user_id else None,
+            "created_at": cart.created_at.isoformat(),
+            "updated_at": cart.updated_at.isoformat(),
+            "items": {
+                str(item.id): {
+                    "pizza_id": str(item.pizza_id),
+                    "size_id": str(item.size_id),
+                    "crust_id": str(item.crust_id),
+                    "topping_ids": sorted(str(t.id) for t in item.toppings),
+                    "quantity": item.quantity,
+                    "created_at": item.created_at.isoformat(),
+                    "updated_at": item.updated_at.isoformat(),
+                }
+                for item in cart.cart_items
+            },
+        }
+
+    async def _load_state(self, cart_id: UUID | str) -> dict | None:
+        cart = await self._load_cart(UUID(str(cart_id)))
+        return self._state_from_cart(cart) if cart else None
+
+    async def _get_state(self, cart_id: UUID | str) -> dict | None:
+        """Cart state from redis, hydrated from postgres on a miss."""
+        state = await self.store.load(cart_id)
+        if state is None:
+            state = await self._update([cart_id], self._hydrate)
+        return state
+
+    async def _get_user_state(self, user_id: UUID) -> dict | None:
+        cart_id = await self._get_user_cart_id(user_id)
+        return await self._get_state(cart_id) if cart_id else None
+
+    async def _get_user_cart_id(self, user_id: UUID) -> str | None:
+        cart_id = await self.store.get_user_cart_id(user_id)
+        if not cart_id:
+            cart_id = await self.session.scalar(
+                select(Cart.id).where(Cart.user_id == user_id)
+            )
+        return str(cart_id) if cart_id else None
+
+    async def _get_item_cart_id(self, cart_item_id: UUID) -> str:
+        cart_id = await self.store.get_item_cart_id(cart_item_id)
+        if not cart_id:
+            cart_id = await self.session.scalar(
+                select(CartItem.cart_id).where(CartItem.id == cart_item_id)
+            )
+        if not cart_id:
+            raise CartItemNotFoundError()
+        return str(cart_id)
+
+    @staticmethod
+    def _get_item(state: dict | None, cart_item_id: UUID) -> dict:
+        if not state or str(cart_item_id) not in state["items"]:
+            raise CartItemNotFoundError()
+        return state["items"][str(cart_item_id)]
+
+    async def _update(self, cart_ids: list[UUID | str], change):
+        """
+        Apply `change(writes, *states)` through RedisCartStore.update, so two
+        requests on the same cart can't overwrite each other's items. Carts
+        missing from redis are hydrated from postgres first.
+        """
+
+        async def apply(writes: CartWrites, *states):
+            states = [
+                state or await self._load_state(cart_id)
+                for cart_id, state in zip(cart_ids, states)
+            ]
+            return change(writes, *states)
+
+        try:
+            return await self.store.update(cart_ids, apply)
+        except WatchError:
+            raise CartConflictError()
+
+    @staticmethod
+    def _hydrate(writes: CartWrites, state: dict | None) -> dict | None:
+        if state:
+            writes.save(state, dirty=False)
+        return state
+
+    async def _get_catalog(self) -> dict:
+        if self._catalog is None:
+            self._catalog = await MenuCatalogService(self.session).get_catalog()
+        return self._catalog
+
+    async def _save(self, state: dict) -> CartResponse:
+        """Store a new cart, nothing to race with yet."""
+        await self.store.save(state)
+        return await self._build_cart(state)
+
+    def _stage(
+        self, writes: CartWrites, state: dict, write_through: bool = False
+    ) -> dict:
+        state["updated_at"] = self._now()
+        writes.save(state, dirty=not write_through)
+        return state
+
+    async def _respond(self, state: dict, write_through: bool = False) -> CartResponse:
+        cart = await self._build_cart(state)
+        if write_through and state["user_id"]:
+            await self._write_behind(state, cart)
         return cart
+
+    async def _build_cart(self, state: dict) -> CartResponse:
+        """Price the cart state against the menu catalog in one pass."""
+        catalog = await self._get_catalog()
+
+        cart_items: list[CartItemResponse] = []
+        items = sorted(state["items"].items(), key=lambda entry: entry[1]["created_at"])
+        for item_id, item in items:
+            try:
+                pizza = PizzaResponse.model_validate(catalog["pizzas"][item["pizza_id"]])
+                size = SizeResponse.model_validate(catalog["sizes"][item["size_id"]])
+                crust = CrustResponse.model_validate(catalog["crusts"][item["crust_id"]])
+                toppings = [
+                    ToppingResponse.model_validate(catalog["toppings"][topping_id])
+                    for topping_id in item["topping_ids"]
+                ]
+            except KeyError:
+                logger.warning(f"Skipping cart item {item_id}: menu entry was removed")
+                continue
+
+            line = price_line(pizza, size, crust, toppings, item["quantity"])
+            cart_items.append(
+                CartItemResponse(
+                    id=item_id,
+                    quantity=item["quantity"],
+                    total=line.total_price,
+                    pizza=pizza,
+                    size=size,
+                    crust=crust,
+                    toppings=toppings,
+                    created_at=item["created_at"],
+                    updated_at=item["updated_at"],
+                )
+            )
+
+        totals = price_totals(sum((item.total for item in cart_items), Decimal("0")))
+        return CartResponse(
+            id=state["id"],
+            subtotal=totals.subtotal,
+            tax=totals.tax,
+            delivery_charge=totals.delivery_charge,
+            total=totals.total,
+            cart_items=cart_items,
+            created_at=state["created_at"],
+            updated_at=state["updated_at"],
+        )
+
+    async def _write_behind(self, state: dict, cart: CartResponse):
+        """Persist a priced redis cart: upsert the cart row and replace its items."""
+        totals = {
+            "user_id": state["user_id"],
+            "subtotal": cart.subtotal,
+            "tax": cart.tax,
+            "delivery_charge": cart.delivery_charge,
+            "total": cart.total,
+        }
+        await self.session.execute(
+            pg_insert(Cart)
+            .values(id=cart.id, **totals)
+            .on_conflict_do_update(
+                index_elements=[Cart.id],
+                set_={**totals, "updated_at": func.now()},
+            )
+        )
+        await self.session.execute(delete(CartItem).where(CartItem.cart_id == cart.id))
+
+        if cart.cart_items:
+            await self.session.execute(
+                insert(CartItem),
+                [
+                    {
+                        "id": item.id,
+                        "cart_id": cart.id,
+                        "pizza_id": item.pizza.id,
+                        "size_id": item.size.id,
+                        "crust_id": item.crust.id,
+                        "fingerprint": cart_item_fingerprint(
+                            item.pizza.id,
+                            item.size.id,
+                            item.crust.id,
+                            (topping.id for topping in item.toppings),
+                        ),
+                        "quantity": item.quantity,
+                        "total": item.total,
+                    }
+                    for item in cart.cart_items
+                ],
+            )
+            topping_rows = [
+                {"cart_item_id": item.id, "topping_id": topping.id}
+                for item in cart.cart_items
+                for topping in item.toppings
+            ]
+            if topping_rows:
+                await self.session.execute(insert(cart_item_topping), topping_rows)
+
+        await self.session.commit()
+
+
+# Flip per deployment with CART_BACKEND; both expose the same API
+CartService = (
+    RedisCartService if settings.CART_BACKEND == "redis" else DatabaseCartService
+)
@@ -0,0 +1,170 @@
+import json
+import time
+from collections.abc import Awaitable, Callable
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+from uuid import UUID
+from app.core.config import settings
+from app.core.redis import redis_client
+
+CART_DIRTY_KEY = "cart:dirty"
+CART_META_FIELD = "meta"
+CART_UPDATE_ATTEMPTS = 10
+
+
+class CartWrites:
+    """Writes queued by an update callback, applied in one MULTI."""
+
+    def __init__(self):
+        self.saves: list[tuple[dict, bool]] = []
+        self.deletes: list[dict] = []
+        self.forgotten_items: list[str] = []
+
+    def save(self, state: dict, dirty: bool = True):
+        self.saves.append((state, dirty))
+
+    def delete(self, state: dict):
+        self.deletes.append(state)
+
+    def forget_item(self, item_id: UUID | str):
+        self.forgotten_items.append(str(item_id))
+
+
+class RedisCartStore:
+    """
+    Redis layout for hot carts.
+
+    - cart:{id}            hash, "meta" -> cart json, "{item_id}" -> item json
+    - cart:user:{user_id}  id of the user's cart
+    - cart:item:{item_id}  id of the cart owning the item (item routes only get an item id)
+    - cart:dirty           zset of user carts not yet written to postgres, scored by last write
+
+    A cart state is a plain dict: id, user_id, created_at, updated_at and
+    `items` keyed by item id (pizza_id, size_id, crust_id, topping_ids, quantity,
+    created_at, updated_at). Every key slides to CART_REDIS_TTL_SECONDS on write.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    def get_cart_key(self, cart_id: UUID | str):
+        return f"cart:{cart_id}"
+
+    def get_user_cart_key(self, user_id: UUID | str):
+        return f"cart:user:{user_id}"
+
+    def get_item_cart_key(self, item_id: UUID | str):
+        return f"cart:item:{item_id}"
+
+    async def load(self, cart_id: UUID | str) -> dict | None:
+        return self._parse(await self.redis.hgetall(self.get_cart_key(cart_id)))
+
+    async def save(self, state: dict, dirty: bool = True):
+        """Replace the stored cart; user carts are queued for write-behind when dirty."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._queue_save(pipe, state, dirty)
+            await pipe.execute()
+
+    async def update(
+        self,
+        cart_ids: list[UUID | str],
+        change: Callable[..., Awaitable[object]],
+    ):
+        """
+        Read-modify-write of carts under WATCH. `change(writes, *states)` gets
+        the stored states (None when missing) and queues its saves/deletes on
+        `writes`; they commit only if no other write touched the carts since the
+        read, otherwise the whole cycle reruns on fresh states. Returns what
+        `change` returned; raises WatchError after CART_UPDATE_ATTEMPTS tries.
+        """
+        keys = [self.get_cart_key(cart_id) for cart_id in cart_ids]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for attempt in range(CART_UPDATE_ATTEMPTS):
+                try:
+                    await pipe.watch(*keys)
+                    states = [self._parse(await pipe.hgetall(key)) for key in keys]
+                    writes = CartWrites()
+                    result = await change(writes, *states)
+
+                    pipe.multi()
+                    for state in writes.deletes:
+                        self._queue_delete(pipe, state)
+                    for state, dirty in writes.saves:
+                        self._queue_save(pipe, state, dirty)
+                    if writes.forgotten_items:
+                        pipe.delete(
+                            *map(self.get_item_cart_key, writes.forgotten_items)
+                        )
+                    await pipe.execute()
+                    return result
+                except WatchError:
+                    if attempt == CART_UPDATE_ATTEMPTS - 1:
+                        raise
+                finally:
+                    await pipe.reset()
+
+    @staticmethod
+    def _parse(raw: dict) -> dict | None:
+        if CART_META_FIELD not in raw:
+            return None
+
+        state = json.loads(raw.pop(CART_META_FIELD))
+        state["items"] = {
+            item_id: json.loads(item) for item_id, item in raw.items()
+        }
+        return state
+
+    def _queue_save(self, pipe: Pipeline, state: dict, dirty: bool):
+        cart_id = state["id"]
+        key = self.get_cart_key(cart_id)
+        ttl = settings.CART_REDIS_TTL_SECONDS
+        meta = {k: v for k, v in state.items() if k != "items"}
+
+        pipe.delete(key)
+        pipe.hset(
+            key,
+            mapping={
+                CART_META_FIELD: json.dumps(meta),
+                **{
+                    item_id: json.dumps(item)
+                    for item_id, item in state["items"].items()
+                },
+            },
+        )
+        pipe.expire(key, ttl)
+        for item_id in state["items"]:
+            pipe.set(self.get_item_cart_key(item_id), cart_id, ex=ttl)
+        if state["user_id"]:
+            pipe.set(self.get_user_cart_key(state["user_id"]), cart_id, ex=ttl)
+            if dirty:
+                pipe.zadd(CART_DIRTY_KEY, {cart_id: time.time()})
+
+    def _queue_delete(self, pipe: Pipeline, state: dict):
+        pipe.delete(
+            self.get_cart_key(state["id"]),
+            *(self.get_item_cart_key(item_id) for item_id in state["items"]),
+        )
+        if state["user_id"]:
+            pipe.delete(self.get_user_cart_key(state["user_id"]))
+        pipe.zrem(CART_DIRTY_KEY, state["id"])
+
+    async def get_user_cart_id(self, user_id: UUID | str) -> str | None:
+        return await self.redis.get(self.get_user_cart_key(user_id))
+
+    async def get_item_cart_id(self, item_id: UUID | str) -> str | None:
+        return await self.redis.get(self.get_item_cart_key(item_id))
+
+    async def get_idle_cart_ids(self, idle_seconds: float) -> tuple[list[str], float]:
+        """Dirty carts untouched for `idle_seconds`, plus the cutoff used."""
+        cutoff = time.time() - idle_seconds
+        return await self.redis.zrangebyscore(CART_DIRTY_KEY, "-inf", cutoff), cutoff
+
+    async def mark_clean(self, cart_id: str, written_at: float):
+        """Dequeue a flushed cart unless it was written again in the meantime."""
+        score = await self.redis.zscore(CART_DIRTY_KEY, cart_id)
+        if score is not None and score <= written_at:
+            await self.redis.zrem(CART_DIRTY_KEY, cart_id)
+
+
+cart_store = RedisCartStore(redis_client.redis)
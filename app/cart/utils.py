@@ -1,5 +1,7 @@
 from fastapi import Request, Response
 from uuid import UUID
+from typing import Iterable
+import hashlib
 from app.cart.constants import CART_COOKIE_NAME, CART_COOKIE_MAX_AGE
 from app.core.config import settings
 
@@ -31,3 +33,19 @@ def set_cart_cookie(response: Response, cart_id: UUID):
 def clear_cart_cookie(response: Response):
     """Clear cart_id cookie"""
     response.delete_cookie(key=CART_COOKIE_NAME)
+
+
+def cart_item_fingerprint(
+    pizza_id: UUID | str,
+    size_id: UUID | str,
+    crust_id: UUID | str,
+    topping_ids: Iterable[UUID | str],
+) -> str:
+    """
+    Canonical hash of a cart item configuration; topping order and duplicates
+    don't matter. Must stay in sync with the backfill in the cart_item
+    fingerprint migration.
+    """
+    toppings = ",".join(sorted({str(topping_id) for topping_id in topping_ids}))
+    raw = f"{pizza_id}:{size_id}:{crust_id}:{toppings}"
+    return hashlib.sha256(raw.encode()).hexdigest()
@@ -5,5 +5,44 @@ celery_app = Celery(
     "pizzabox",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    imports=["app.workers.email_tasks"],
+    imports=[
+        "app.workers.email_tasks",
+        "app.workers.rollup_tasks",
+        "app.workers.cart_tasks",
+        "app.workers.cleanup_tasks",
+    ],
 )
+
+# kombu/redis-py sync clients can't share the app's asyncio pool; mirror its limits
+celery_app.conf.update(
+    broker_pool_limit=settings.CELERY_BROKER_POOL_LIMIT,
+    broker_transport_options={
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        "socket_connect_timeout": settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        "retry_on_timeout": True,
+    },
+    redis_max_connections=settings.REDIS_MAX_CONNECTIONS,
+    redis_socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+    redis_socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+    redis_backend_health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+    redis_retry_on_timeout=True,
+)
+
+celery_app.conf.beat_schedule = {
+    "refresh-sales-rollup": {
+        "task": "app.workers.rollup_tasks.refresh_sales_rollup_task",
+        "schedule": settings.SALES_ROLLUP_INTERVAL_MINUTES * 60,
+    },
+    "purge-stale-rows": {
+        "task": "app.workers.cleanup_tasks.purge_stale_rows_task",
+        "schedule": settings.CLEANUP_INTERVAL_MINUTES * 60,
+    },
+}
+
+if settings.CART_BACKEND == "redis":
+    celery_app.conf.beat_schedule["flush-idle-carts"] = {
+        "task": "app.workers.cart_tasks.flush_idle_carts_task",
+        "schedule": settings.CART_FLUSH_INTERVAL_SECONDS,
+    }
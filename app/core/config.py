@@ -1,5 +1,6 @@
 from pydantic_settings import SettingsConfigDict, BaseSettings
 from pydantic import SecretStr
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -14,6 +15,29 @@ class Settings(BaseSettings):
     CLIENT_URL: str = "http://localhost:5173"
     ADMIN_URL: str = "http://localhost:3000"
 
+    # Database settings
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # False: skip the per-checkout ping; a disconnect error invalidates the pool instead
+    DB_POOL_PRE_PING: bool = True
+    # set to 0 behind pgbouncer in transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_APPLICATION_NAME: str = "pizza-box-api"
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+
+    # Redis settings
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5.0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    REDIS_RETRY_ATTEMPTS: int = 3
+    REDIS_RETRY_BACKOFF_BASE_SECONDS: float = 0.05
+    REDIS_RETRY_BACKOFF_CAP_SECONDS: float = 1.0
+    CELERY_BROKER_POOL_LIMIT: int = 10
+
     # App Settings
     PROJECT_NAME: str = "pizza-box api"
     VERSION: str = "0.1.0"
@@ -38,6 +62,19 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # Password hashing settings
+    # argon2 needs argon2-cffi installed; hashes in the other scheme keep
+    # verifying and are rehashed on the next successful login
+    PASSWORD_HASH_SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST_KIB: int = 19456
+    ARGON2_PARALLELISM: int = 1
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     # Bucket storage settings
     BUCKET_ACCESS_KEY_ID: str
@@ -50,6 +87,55 @@ class Settings(BaseSettings):
     RAZORPAY_KEY_ID: str
     RAZORPAY_KEY_SECRET: str
 
+    # Menu cache settings
+    MENU_CACHE_TTL_SECONDS: int = 600
+    MENU_CACHE_MAX_ENTRIES: int = 256
+    MENU_CACHE_VERSION_CHECK_SECONDS: float = 1.0
+    MENU_HTTP_MAX_AGE_SECONDS: int = 30
+    MENU_HTTP_STALE_WHILE_REVALIDATE_SECONDS: int = 60
+
+    # Orders settings
+    ORDER_COUNT_CACHE_SECONDS: int = 30
+    ORDER_STATS_CACHE_SECONDS: int = 30
+    SALES_ROLLUP_INTERVAL_MINUTES: int = 15
+    SALES_ROLLUP_LOOKBACK_DAYS: int = 2
+
+    # Event stream settings
+    EVENT_STREAM_MAXLEN: int = 100000
+    EVENT_STREAM_BATCH_SIZE: int = 50
+    EVENT_STREAM_BLOCK_MS: int = 5000
+    # other consumers claim entries this long after delivery, keep it well above
+    # the worst dispatcher queue wait (EVENT_DISPATCH_QUEUE_SIZE jobs per worker)
+    EVENT_STREAM_CLAIM_IDLE_MS: int = 600000
+    EVENT_STREAM_MAX_DELIVERIES: int = 5
+    # concurrent writers are what fills a notification write batch
+    EVENT_DISPATCH_WORKERS: int = 32
+    EVENT_DISPATCH_QUEUE_SIZE: int = 100
+    EVENT_DISPATCH_DRAIN_SECONDS: float = 5.0
+    NOTIFICATION_WRITE_BATCH_SIZE: int = 100
+    NOTIFICATION_WRITE_FLUSH_MS: int = 5
+
+    # Websocket settings
+    PRESENCE_TTL_SECONDS: int = 60
+    PRESENCE_HEARTBEAT_SECONDS: int = 20
+    WS_SEND_QUEUE_SIZE: int = 100
+    WS_SEND_TIMEOUT_SECONDS: float = 10.0
+    # drop: discard messages for a full queue; disconnect: close the socket (1013)
+    WS_SLOW_CONSUMER_POLICY: Literal["drop", "disconnect"] = "disconnect"
+
+    # Cart settings
+    CART_BACKEND: Literal["database", "redis"] = "database"
+    CART_REDIS_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    CART_IDLE_FLUSH_SECONDS: int = 300
+    CART_FLUSH_INTERVAL_SECONDS: int = 60
+
+    # Cleanup settings
+    CLEANUP_INTERVAL_MINUTES: int = 30
+    CLEANUP_BATCH_SIZE: int = 500
+    CLEANUP_MAX_BATCHES: int = 200
+    GUEST_CART_RETENTION_DAYS: int = 14
+    EXPIRED_NOTIFICATION_RETENTION_DAYS: int = 0
+
     model_config = SettingsConfigDict(
         env_file=".env.local",
         extra="ignore",
@@ -1,9 +1,62 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import ColumnElement, select, delete
 from fastapi import Depends
-from typing import Annotated
+from typing import Annotated, Any
+import time
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    checkouts = 0
+    total_wait_ms = 0.0
+    max_wait_ms = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 2)
+            if self.checkouts
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+        }
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    poolclass=TimedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={
+        # asyncpg's own cache and SQLAlchemy's prepared-statement cache on top of it
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "server_settings": {
+            "application_name": settings.DB_APPLICATION_NAME,
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+        },
+    },
+)
 
 async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
 
@@ -14,3 +67,41 @@ async def get_session():
 
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+
+def get_db_pool_stats() -> dict:
+    return engine.sync_engine.pool.stats()
+
+
+async def delete_in_batches(
+    session: AsyncSession,
+    model: Any,
+    *criteria: ColumnElement[bool],
+    batch_size: int,
+    max_batches: int | None = None,
+) -> int:
+    """
+    Delete rows matching `criteria` in short transactions of at most `batch_size`
+    rows each, skipping rows locked by other transactions. Returns rows deleted.
+    """
+    deleted = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        batch_ids = (
+            select(model.id)
+            .where(*criteria)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(
+            delete(model)
+            .where(model.id.in_(batch_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+        deleted += result.rowcount
+        batches += 1
+        if result.rowcount < batch_size:
+            break
+    return deleted
@@ -1,9 +1,9 @@
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.utils.logger import logger
-from app.core.exceptions import AppException
+from app.core.exceptions import AppException, NotModified
 
 
 async def global_exception_handler(request: Request, exc: Exception):
@@ -39,6 +39,7 @@ async def app_exception_handler(request: Request, exc: AppException):
     return JSONResponse(
         status_code=exc.status_code,
         content={"error": exc.error_code, "message": exc.message},
+        headers=exc.headers,
     )
 
 
@@ -86,8 +87,14 @@ async def http_exception_handler(
     )
 
 
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    """Answer conditional GETs whose ETag still matches."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
+
 def setup_exception_handlers(app):
     """Setup all exception handlers."""
+    app.add_exception_handler(NotModified, not_modified_handler)
     app.add_exception_handler(AppException, app_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
@@ -7,6 +7,7 @@ class AppException(Exception):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
     error_code: str = "INTERNAL_SERVER_ERROR"
     message: str = "Something went wrong."
+    headers: dict[str, str] | None = None
 
     def __init__(
         self,
@@ -20,6 +21,14 @@ class AppException(Exception):
         super().__init__(self.message)
 
 
+class NotModified(Exception):
+    """Short-circuits a conditional GET with 304 Not Modified (not an error)."""
+
+    def __init__(self, headers: dict[str, str] | None = None):
+        self.headers = headers or {}
+        super().__init__("Not modified")
+
+
 class EntityNotFoundError(AppException):
     status_code = status.HTTP_404_NOT_FOUND
     error_code = "ENTITY_NOT_FOUND"
@@ -50,6 +59,13 @@ class AuthorizationError(AppException):
     message = "Access denied"
 
 
+class ServiceBusyError(AppException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    error_code = "SERVICE_BUSY"
+    message = "Server is busy, please try again shortly"
+    headers = {"Retry-After": "1"}
+
+
 # Auth specific errors
 class UserNotFoundError(EntityNotFoundError):
     error_code = "USER_NOT_FOUND"
@@ -140,6 +156,11 @@ class CartItemNotFoundError(EntityNotFoundError):
     message = "Cart item does not exist."
 
 
+class CartConflictError(ConflictError):
+    error_code = "CART_CONFLICT"
+    message = "Cart is being changed by another request, please retry."
+
+
 class MaxAddressesExceededError(BadRequestError):
     error_code = "MAX_ADDRESSES_PER_USER_EXCEEDED"
     message = "User already has too many addresses"
@@ -166,6 +187,11 @@ class OrderStatusUpdateError(BadRequestError):
     message = "failed to update order-status"
 
 
+class InvalidCursorError(BadRequestError):
+    error_code = "INVALID_CURSOR"
+    message = "Invalid or expired pagination cursor"
+
+
 # Payment Erros
 
 
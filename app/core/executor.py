@@ -0,0 +1,99 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from app.core.exceptions import ServiceBusyError
+from app.utils.logger import logger
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Dedicated thread pool for CPU-heavy calls that would otherwise block the
+    event loop (the C extensions we hand it release the GIL).
+
+    At most `max_pending` calls are admitted at once (running + queued); past
+    that callers get ServiceBusyError straight away instead of piling up
+    behind the pool. Counters are only touched on the event loop, never in
+    the worker threads; admit from a single event loop.
+    """
+
+    def __init__(self, name: str, workers: int, max_pending: int):
+        self.name = name
+        self.workers = workers
+        self.max_pending = max(max_pending, workers)
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_wait_ms = 0.0
+        self._total_wait_ms = 0.0
+        self._waits = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=self.name
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(
+                f"{self.name} pool saturated ({self.pending} pending), rejecting call"
+            )
+            raise ServiceBusyError()
+
+        self.pending += 1
+        admitted_at = time.perf_counter()
+        started_at = None
+
+        def timed():
+            # only stamps the start; the wait is recorded back on the loop
+            nonlocal started_at
+            started_at = time.perf_counter()
+            return fn(*args)
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), timed
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            self.pending -= 1
+            if started_at is not None:
+                self._record_wait((started_at - admitted_at) * 1000)
+
+    def _record_wait(self, wait_ms: float):
+        # time spent queued behind other calls
+        self._waits += 1
+        self._total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queued": max(self.pending - self.workers, 0),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self._total_wait_ms / self._waits, 2)
+            if self._waits
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
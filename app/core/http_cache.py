@@ -0,0 +1,57 @@
+from fastapi import Request, Response
+from typing import Awaitable, Callable
+from app.core.exceptions import NotModified
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ConditionalGet:
+    """
+    Reusable dependency for read-mostly routes.
+
+    The ETag is derived from a cheap version lookup, so a matching If-None-Match
+    is answered with 304 before the handler (and any db query or serialization)
+    runs. Otherwise ETag and Cache-Control are set on the response and also
+    returned, for handlers that build their own Response.
+    """
+
+    def __init__(
+        self,
+        get_version: Callable[[], Awaitable[int | str]],
+        namespace: str,
+        max_age: int = 0,
+        stale_while_revalidate: int = 0,
+        public: bool = True,
+    ):
+        self.get_version = get_version
+        self.namespace = namespace
+
+        directives = ["public" if public else "private", f"max-age={max_age}"]
+        if stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={stale_while_revalidate}")
+        self.cache_control = ", ".join(directives)
+
+    async def __call__(self, request: Request, response: Response) -> dict[str, str]:
+        version = await self.get_version()
+        headers = {
+            "ETag": f'W/"{self.namespace}-{version}"',
+            "Cache-Control": self.cache_control,
+        }
+
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise NotModified(headers=headers)
+
+        response.headers.update(headers)
+        return headers
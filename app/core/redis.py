@@ -1,4 +1,6 @@
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
 from typing import Annotated, Literal
 from fastapi import Depends
 from datetime import timedelta
@@ -6,16 +8,108 @@ from app.core.config import settings
 
 TokenType = Literal["reset", "verification"]
 
+REFRESH_JTI_PREFIX = "refresh:"
+USER_REFRESH_JTIS_PREFIX = "user_refresh:"
+
+# KEYS: old jti key, new jti key, user's jti set
+# ARGV: user_id, old jti, new jti, ttl seconds
+ROTATE_REFRESH_JTI_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('SREM', KEYS[3], ARGV[2])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[4])
+redis.call('SADD', KEYS[3], ARGV[3])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+return 1
+"""
+
+# KEYS: user's jti set, then one key per jti; ARGV: the jtis, in the same order
+# (every key is passed in, never built in the script, so this runs on cluster
+# and behind key-prefixing proxies)
+REVOKE_REFRESH_JTIS_LUA = """
+local revoked = 0
+for i, jti in ipairs(ARGV) do
+    revoked = revoked + redis.call('DEL', KEYS[i + 1])
+    redis.call('SREM', KEYS[1], jti)
+end
+return revoked
+"""
+
+
+def create_redis_pool(
+    max_connections: int | None = None,
+    socket_timeout: float | None = settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+) -> redis.BlockingConnectionPool:
+    """
+    Connection pool every redis client is built on. Blocking: under a burst,
+    callers wait up to REDIS_POOL_TIMEOUT_SECONDS for a free connection
+    instead of opening new ones without bound.
+    """
+    return redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=max_connections or settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        retry=Retry(
+            ExponentialBackoff(
+                cap=settings.REDIS_RETRY_BACKOFF_CAP_SECONDS,
+                base=settings.REDIS_RETRY_BACKOFF_BASE_SECONDS,
+            ),
+            settings.REDIS_RETRY_ATTEMPTS,
+        ),
+    )
+
+
+# shared by all request-path clients (tokens, menu cache, cart store, publishes)
+redis_pool = create_redis_pool()
+
+# subscribers and blocking stream reads hold a connection and wait on reads
+# indefinitely, so no socket timeout
+pubsub_pool = create_redis_pool(max_connections=8, socket_timeout=None)
+
+
+def get_pool_stats(pool: redis.ConnectionPool) -> dict:
+    in_use = len(pool._in_use_connections)
+    idle = len(pool._available_connections)
+    return {
+        "max_connections": pool.max_connections,
+        "in_use": in_use,
+        "idle": idle,
+        "utilization": round(in_use / pool.max_connections, 3),
+    }
+
+
+def get_redis_pool_stats() -> dict:
+    return {
+        "commands": get_pool_stats(redis_pool),
+        "pubsub": get_pool_stats(pubsub_pool),
+    }
+
+
+async def close_redis_pools():
+    await redis_pool.aclose()
+    await pubsub_pool.aclose()
+
 
 class RedisService:
-    def __init__(self):
-        self.redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    def __init__(self, pool: redis.ConnectionPool = redis_pool):
+        self.redis = redis.Redis(connection_pool=pool)
+        # one round trip each, and atomic: no two refreshes can spend the same jti
+        self._rotate_refresh_jti = self.redis.register_script(ROTATE_REFRESH_JTI_LUA)
+        self._revoke_refresh_jtis = self.redis.register_script(
+            REVOKE_REFRESH_JTIS_LUA
+        )
 
     def get_refresh_jti_key(self, jti: str):
-        return f"refresh:{jti}"
+        return f"{REFRESH_JTI_PREFIX}{jti}"
 
     def get_user_refresh_jtis_key(self, user_id: str):
-        return f"user_refresh:{user_id}"
+        return f"{USER_REFRESH_JTIS_PREFIX}{user_id}"
 
     async def store_refresh_jti(
         self,
@@ -24,46 +118,55 @@ class RedisService:
         expires_in: timedelta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
     ):
         """Store refresh-token-id."""
-        key = self.get_refresh_jti_key(jti)
-        await self.redis.set(key, user_id, ex=expires_in)
-
-        # Add JTI to user's active tokens set
         user_jtis_key = self.get_user_refresh_jtis_key(user_id)
-        await self.redis.sadd(user_jtis_key, jti)
-        await self.redis.expire(user_jtis_key, expires_in)
 
-    async def validate_refresh_jti(self, jti: str, user_id: str) -> bool:
-        """Validate refresh-token-id by comparing stored user_id."""
-        key = self.get_refresh_jti_key(jti)
-        stored_user_id = await self.redis.get(key)
-        return stored_user_id == user_id
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self.get_refresh_jti_key(jti), user_id, ex=expires_in)
+            # Add JTI to user's active tokens set
+            pipe.sadd(user_jtis_key, jti)
+            pipe.expire(user_jtis_key, expires_in)
+            await pipe.execute()
 
-    async def revoke_refresh_jti(self, jti: str):
+    async def rotate_refresh_jti(
+        self,
+        old_jti: str,
+        new_jti: str,
+        user_id: str,
+        expires_in: timedelta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    ) -> bool:
+        """Swap a valid refresh-token-id for a new one; False if it was already spent."""
+        rotated = await self._rotate_refresh_jti(
+            keys=[
+                self.get_refresh_jti_key(old_jti),
+                self.get_refresh_jti_key(new_jti),
+                self.get_user_refresh_jtis_key(user_id),
+            ],
+            args=[user_id, old_jti, new_jti, int(expires_in.total_seconds())],
+        )
+        return rotated == 1
+
+    async def _revoke_user_jtis(self, user_id: str, jtis: list[str]) -> int:
+        if not jtis:
+            return 0
+        return await self._revoke_refresh_jtis(
+            keys=[
+                self.get_user_refresh_jtis_key(user_id),
+                *(self.get_refresh_jti_key(jti) for jti in jtis),
+            ],
+            args=jtis,
+        )
+
+    async def revoke_refresh_jti(self, jti: str, user_id: str):
         """Revoke a single refresh token-id."""
-        key = self.get_refresh_jti_key(jti)
-        user_id = await self.redis.get(key)
-        if user_id:
-            # Remove jti from user's token set
-            user_jtis_key = self.get_user_refresh_jtis_key(user_id)
-            await self.redis.srem(user_jtis_key, jti)
-        await self.redis.delete(key)
+        await self._revoke_user_jtis(user_id, [jti])
 
     async def revoke_all_user_refresh_jtis(self, user_id: str):
-        """Revoke all refresh token ids for a specific user."""
-        user_jtis_key = self.get_user_refresh_jtis_key(user_id)
-
-        # Get all JTIs for this user
-        jtis = await self.redis.smembers(user_jtis_key)
-
-        if jtis:
-            # Delete all refresh token ids
-            token_id_keys = [self.get_refresh_jti_key(jti) for jti in jtis]
-            await self.redis.delete(*token_id_keys)
-
-            # Clear the user's token set
-            await self.redis.delete(user_jtis_key)
-
-        return len(jtis) if jtis else 0
+        """
+        Revoke all refresh token ids for a specific user. A token issued while
+        this runs stays valid; it was issued after the revocation was asked for.
+        """
+        jtis = await self.redis.smembers(self.get_user_refresh_jtis_key(user_id))
+        return await self._revoke_user_jtis(user_id, list(jtis))
 
     def get_token_key(self, token: str, token_type: TokenType):
         return f"{token_type}:{token}"
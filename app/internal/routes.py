@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+from app.auth.utils import password_hash_pool
+from app.core.database import get_db_pool_stats
+from app.core.redis import get_redis_pool_stats
+from app.notifications.dispatcher import event_dispatcher
+from app.notifications.manager import notifications_manager
+from app.notifications.writer import notification_writer
+
+# not proxied by nginx, only reachable from inside the network
+internal_router = APIRouter(
+    prefix="/internal", tags=["Internal"], include_in_schema=False
+)
+
+
+@internal_router.get("/metrics")
+async def get_metrics():
+    """Connection pool and worker pool utilization for this replica"""
+    return {
+        "db_pool": get_db_pool_stats(),
+        "redis_pools": get_redis_pool_stats(),
+        "password_hash_pool": password_hash_pool.stats(),
+        "websockets": notifications_manager.get_stats(),
+        "event_dispatcher": event_dispatcher.stats(),
+        "notification_writer": notification_writer.stats(),
+    }
@@ -3,6 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import asyncio
 from app.core.config import settings
+from app.core.redis import close_redis_pools
+from app.auth.utils import password_hash_pool
+from app.auth.cache import start_user_invalidation_listener
 from app.auth.routes import auth_router
 from app.core.exception_handlers import setup_exception_handlers
 from app.menu.routes import menu_router
@@ -11,22 +14,51 @@ from app.cart.routes import cart_router
 from app.address.routes import address_router
 from app.orders.routes import orders_router
 from app.payments.routes import payments_router
-from app.notifications.events import start_event_listener
+from app.notifications.events import start_event_listener, start_event_consumer
 from app.notifications.routes import notifications_router
+from app.notifications.manager import start_presence_heartbeat
+from app.notifications.writer import notification_writer
+from app.internal.routes import internal_router
 from app.utils.logger import logger
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     listener_task = asyncio.create_task(start_event_listener())
+    consumer_task = asyncio.create_task(start_event_consumer())
+    heartbeat_task = asyncio.create_task(start_presence_heartbeat())
+    invalidation_task = asyncio.create_task(start_user_invalidation_listener())
 
     yield
 
     listener_task.cancel()
+    consumer_task.cancel()
+    heartbeat_task.cancel()
+    invalidation_task.cancel()
     try:
         await listener_task
     except asyncio.CancelledError:
         logger.info("Event listener stopped")
+    try:
+        await consumer_task
+    except asyncio.CancelledError:
+        logger.info("Event consumer stopped")
+    try:
+        await heartbeat_task
+    except asyncio.CancelledError:
+        logger.info("Presence heartbeat stopped")
+    try:
+        await invalidation_task
+    except asyncio.CancelledError:
+        logger.info("User invalidation listener stopped")
+
+    # after the consumer, whose draining events may still be writing
+    await notification_writer.close()
+    logger.info("Notification writer flushed")
+
+    password_hash_pool.shutdown()
+    await close_redis_pools()
+    logger.info("Redis pools closed")
 
 
 app = FastAPI(
@@ -54,3 +86,4 @@ app.include_router(address_router, prefix=f"{settings.API_V1_STR}")
 app.include_router(orders_router, prefix=f"{settings.API_V1_STR}")
 app.include_router(payments_router, prefix=f"{settings.API_V1_STR}")
 app.include_router(notifications_router, prefix=f"{settings.API_V1_STR}")
+app.include_router(internal_router)
@@ -0,0 +1,163 @@
+import json
+import time
+from typing import Any, Awaitable, Callable
+from redis.exceptions import RedisError
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.utils.logger import logger
+
+MENU_VERSION_KEY = "menu:version"
+
+
+class MenuCache:
+    """
+    Two-tier read-through cache for public menu reads.
+
+    Entries live in a per-process LRU in front of a shared Redis tier. Every key
+    embeds the global menu version, so bumping the version (on any admin write)
+    invalidates all replicas at once; old Redis entries simply expire.
+    """
+
+    def __init__(self):
+        self.local = LRUCache(maxsize=settings.MENU_CACHE_MAX_ENTRIES)
+        self.redis = redis_client.redis
+        self._version: int | None = None
+        self._version_checked_at = 0.0
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "errors": 0,
+            "invalidations": 0,
+        }
+
+    def _make_key(self, version: int, namespace: str, params: dict[str, Any]) -> str:
+        normalized = json.dumps(params, sort_keys=True, default=str)
+        return f"menu:v{version}:{namespace}:{normalized}"
+
+    async def get_version(self) -> int:
+        """Return the current menu version, re-reading it from redis at most once per interval."""
+        now = time.monotonic()
+        if (
+            self._version is not None
+            and now - self._version_checked_at < settings.MENU_CACHE_VERSION_CHECK_SECONDS
+        ):
+            return self._version
+
+        try:
+            version = await self.redis.get(MENU_VERSION_KEY)
+            if version is None:
+                # Seed from the clock so a flushed redis never reuses an old
+                # version (and with it, a stale cache entry or ETag).
+                await self.redis.set(MENU_VERSION_KEY, int(time.time()), nx=True)
+                version = await self.redis.get(MENU_VERSION_KEY)
+            version = int(version)
+        except RedisError as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Menu cache version lookup failed: {e}")
+            return self._version or 0
+
+        if version != self._version:
+            self.local.clear()
+        self._version = version
+        self._version_checked_at = now
+        return version
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        params: dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached JSON-able value for (namespace, params) or load and cache it."""
+        version = await self.get_version()
+        key = self._make_key(version, namespace, params)
+
+        value = self.local.get(key)
+        if value is not None:
+            self.stats["local_hits"] += 1
+            return value
+
+        raw = await self._redis_get(namespace, key)
+        if raw is not None:
+            self.stats["redis_hits"] += 1
+            value = json.loads(raw)
+            self.local.set(key, value)
+            return value
+
+        self.stats["misses"] += 1
+        value = await loader()
+        self.local.set(key, value)
+        await self._redis_set(namespace, key, json.dumps(value))
+        return value
+
+    async def get_or_build_raw(
+        self,
+        namespace: str,
+        builder: Callable[[], Awaitable[str]],
+    ) -> bytes:
+        """Return a pre-serialized JSON document, building it at most once per menu version."""
+        version = await self.get_version()
+        key = self._make_key(version, namespace, {})
+
+        body = self.local.get(key)
+        if body is not None:
+            self.stats["local_hits"] += 1
+            return body
+
+        raw = await self._redis_get(namespace, key)
+        if raw is not None:
+            self.stats["redis_hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            raw = await builder()
+            await self._redis_set(namespace, key, raw)
+
+        body = raw.encode()
+        self.local.set(key, body)
+        return body
+
+    async def _redis_get(self, namespace: str, key: str) -> str | None:
+        try:
+            return await self.redis.get(key)
+        except RedisError as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Menu cache read failed for {namespace}: {e}")
+            return None
+
+    async def _redis_set(self, namespace: str, key: str, raw: str):
+        try:
+            await self.redis.set(key, raw, ex=settings.MENU_CACHE_TTL_SECONDS)
+        except RedisError as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Menu cache write failed for {namespace}: {e}")
+
+    async def bump_version(self) -> int:
+        """Invalidate every cached menu read across all replicas."""
+        self.local.clear()
+        self.stats["invalidations"] += 1
+        try:
+            version = await self.redis.incr(MENU_VERSION_KEY)
+        except RedisError as e:
+            self.stats["errors"] += 1
+            logger.error(f"Menu cache invalidation failed: {e}")
+            self._version = None
+            return 0
+
+        self._version = version
+        self._version_checked_at = time.monotonic()
+        return version
+
+    def get_stats(self) -> dict[str, Any]:
+        hits = self.stats["local_hits"] + self.stats["redis_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self.local),
+            "version": self._version,
+        }
+
+
+menu_cache = MenuCache()
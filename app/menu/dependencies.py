@@ -0,0 +1,14 @@
+from fastapi import Depends
+from typing import Annotated
+from app.core.config import settings
+from app.core.http_cache import ConditionalGet
+from app.menu.cache import menu_cache
+
+menu_http_cache = ConditionalGet(
+    menu_cache.get_version,
+    namespace="menu",
+    max_age=settings.MENU_HTTP_MAX_AGE_SECONDS,
+    stale_while_revalidate=settings.MENU_HTTP_STALE_WHILE_REVALIDATE_SECONDS,
+)
+
+MenuHttpCacheDep = Annotated[dict[str, str], Depends(menu_http_cache)]
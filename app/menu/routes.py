@@ -1,4 +1,4 @@
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, status, Query, Response, Depends
 from uuid import UUID
 from app.core.database import SessionDep
 from app.menu.schema import (
@@ -19,9 +19,18 @@ from app.menu.schema import (
     ToppingQueryParams,
     SizeQueryParams,
     CrustQueryParams,
+    MenuSnapshotResponse,
 )
 from app.auth.dependencies import AdminOnlyDep
-from app.menu.service import PizzaService, ToppingService, SizeService, CrustService
+from app.menu.service import (
+    PizzaService,
+    ToppingService,
+    SizeService,
+    CrustService,
+    MenuSnapshotService,
+)
+from app.menu.cache import menu_cache
+from app.menu.dependencies import menu_http_cache, MenuHttpCacheDep
 from typing import Annotated
 
 menu_router = APIRouter(prefix="/menu", tags=["Menu"])
@@ -36,6 +45,8 @@ menu_router = APIRouter(prefix="/menu", tags=["Menu"])
     "/pizzas",
     response_model=PaginatedPizzaResponse,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_all_pizzas(
     session: SessionDep,
@@ -71,6 +82,8 @@ async def create_pizza(
     "/pizzas/{pizza_id}",
     response_model=PizzaResponse,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_pizza_by_id(
     pizza_id: UUID,
@@ -121,6 +134,8 @@ async def delete_pizza(
 @menu_router.get(
     "/toppings",
     response_model=list[ToppingResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_all_toppings(
     session: SessionDep,
@@ -156,6 +171,8 @@ async def create_topping(
 @menu_router.get(
     "/toppings/{topping_id}",
     response_model=ToppingResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_topping_by_id(
     topping_id: UUID,
@@ -206,6 +223,8 @@ async def delete_topping(
 @menu_router.get(
     "/sizes",
     response_model=list[SizeResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_all_sizes(
     session: SessionDep,
@@ -272,6 +291,8 @@ async def delete_size(
 @menu_router.get(
     "/crusts",
     response_model=list[CrustResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_all_crusts(
     session: SessionDep,
@@ -304,6 +325,8 @@ async def create_crust(
 @menu_router.get(
     "/crusts/{crust_id}",
     response_model=CrustResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+    dependencies=[Depends(menu_http_cache)],
 )
 async def get_crust_by_id(
     crust_id: UUID,
@@ -344,3 +367,35 @@ async def delete_crust(
     Admin endpoint to remove crust option.
     """
     return await CrustService(session).delete(crust_id)
+
+
+# ===========================================================
+# SNAPSHOT ROUTES
+# ===========================================================
+
+
+@menu_router.get(
+    "/snapshot",
+    response_model=MenuSnapshotResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+)
+async def get_menu_snapshot(session: SessionDep, cache_headers: MenuHttpCacheDep):
+    """
+    Get the whole available menu with a precomputed size x crust price matrix per pizza.
+    The body is serialized once per menu version.
+    """
+    body = await MenuSnapshotService(session).get_snapshot()
+    return Response(content=body, media_type="application/json", headers=cache_headers)
+
+
+# ===========================================================
+# CACHE ROUTES
+# ===========================================================
+
+
+@menu_router.get("/cache/stats")
+async def get_menu_cache_stats(_: AdminOnlyDep):
+    """
+    Admin endpoint to inspect menu cache hit/miss counters for this process.
+    """
+    return menu_cache.get_stats()
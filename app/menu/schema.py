@@ -372,3 +372,21 @@ class PaginatedPizzaResponse(BaseSchema):
     @property
     def has_prev(self) -> bool:
         return self.page > 1
+
+
+# Menu snapshot schemas
+
+
+class SnapshotPizzaResponse(PizzaResponse):
+    price_matrix: dict[UUID, dict[UUID, Decimal]] = Field(
+        description="Unit price without extra toppings, keyed by size id then crust id",
+    )
+
+
+class MenuSnapshotResponse(BaseSchema):
+    version: int = Field(description="Menu version this snapshot was built from")
+    generated_at: datetime
+    pizzas: list[SnapshotPizzaResponse]
+    toppings: list[ToppingResponse]
+    sizes: list[SizeResponse]
+    crusts: list[CrustResponse]
@@ -1,6 +1,7 @@
 from sqlalchemy import select, asc, desc, func, and_
 from sqlalchemy.orm import selectinload
 from uuid import UUID
+from typing import Iterable, Sequence, TypeVar
 from app.menu.model import Pizza, Topping, ToppingCategory, Size, Crust, PizzaCategory
 from app.menu.schema import (
     PizzaCreate,
@@ -11,7 +12,16 @@ from app.menu.schema import (
     SizeUpdate,
     CrustCreate,
     CrustUpdate,
+    PaginatedPizzaResponse,
+    PizzaResponse,
+    ToppingResponse,
+    SizeResponse,
+    CrustResponse,
+    MenuSnapshotResponse,
+    SnapshotPizzaResponse,
 )
+from app.menu.cache import menu_cache
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import (
     PizzaAlreadyExistsError,
@@ -23,8 +33,26 @@ from app.core.exceptions import (
     CrustAlreadyExistsError,
     CrustNotFoundError,
 )
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
 import math
 
+ModelT = TypeVar("ModelT", Pizza, Topping, Size, Crust)
+
+topping_list_adapter = TypeAdapter(list[ToppingResponse])
+size_list_adapter = TypeAdapter(list[SizeResponse])
+crust_list_adapter = TypeAdapter(list[CrustResponse])
+
+
+async def _get_by_ids(
+    session: AsyncSession, model: type[ModelT], ids: set[UUID]
+) -> dict[UUID, ModelT]:
+    """Load many rows of `model` with one IN query, keyed by id."""
+    if not ids:
+        return {}
+    rows = await session.scalars(select(model).where(model.id.in_(ids)))
+    return {row.id: row for row in rows}
+
 
 class PizzaService:
     def __init__(
@@ -42,10 +70,38 @@ class PizzaService:
         name: str | None = None,
         is_available: bool | None = None,
         featured: bool | None = None,
+    ):
+        field, order = self._parse_sort_params(sort_by)
+        params = {
+            "page": page,
+            "limit": limit,
+            "sort_by": f"{field}:{order.lower()}",
+            "category": category.value if category else None,
+            "name": name.strip().lower() if name else None,
+            "is_available": is_available,
+            "featured": featured,
+        }
+        return await menu_cache.get_or_load(
+            "pizzas",
+            params,
+            lambda: self._load_all(
+                page, limit, field, order, category, name, is_available, featured
+            ),
+        )
+
+    async def _load_all(
+        self,
+        page: int,
+        limit: int,
+        field: str,
+        order: str,
+        category: PizzaCategory | None,
+        name: str | None,
+        is_available: bool | None,
+        featured: bool | None,
     ):
         skip = (page - 1) * limit
 
-        field, order = self._parse_sort_params(sort_by)
         sort_column = getattr(Pizza, field, Pizza.created_at)
         sort_order = asc(sort_column) if order.lower() == "asc" else desc(sort_column)
 
@@ -63,13 +119,15 @@ class PizzaService:
         )
 
         result = await self.session.scalars(stmt)
-        return {
-            "items": result.all(),
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "pages": math.ceil(total / limit) if total else 0,
-        }
+        return PaginatedPizzaResponse.model_validate(
+            {
+                "items": result.all(),
+                "page": page,
+                "limit": limit,
+                "total": total,
+                "pages": math.ceil(total / limit) if total else 0,
+            }
+        ).model_dump(mode="json")
 
     def _parse_sort_params(self, sort_by: str) -> tuple[str, str]:
         try:
@@ -131,6 +189,13 @@ class PizzaService:
             raise PizzaNotFoundError()
         return pizza
 
+    async def get_many(self, pizza_ids: Iterable[UUID]) -> dict[UUID, Pizza]:
+        pizza_ids = set(pizza_ids)
+        pizzas = await _get_by_ids(self.session, Pizza, pizza_ids)
+        if len(pizzas) != len(pizza_ids):
+            raise PizzaNotFoundError()
+        return pizzas
+
     async def create(self, data: PizzaCreate) -> Pizza:
         await self._check_duplicate_name(data.name)
 
@@ -148,6 +213,7 @@ class PizzaService:
 
         self.session.add(pizza)
         await self.session.commit()
+        await menu_cache.bump_version()
         loaded_pizza = await self.session.execute(
             select(Pizza)
             .options(selectinload(Pizza.default_toppings))
@@ -184,6 +250,7 @@ class PizzaService:
 
         self.session.add(pizza)
         await self.session.commit()
+        await menu_cache.bump_version()
         loaded_pizza = await self.session.execute(
             select(Pizza)
             .options(selectinload(Pizza.default_toppings))
@@ -195,6 +262,7 @@ class PizzaService:
         pizza = await self.get_one(pizza_id, load_toppings=False)
         await self.session.delete(pizza)
         await self.session.commit()
+        await menu_cache.bump_version()
 
     async def _check_duplicate_name(self, name: str, exclude_id: UUID | None = None):
         stmt = select(Pizza).where(Pizza.name == name)
@@ -223,6 +291,23 @@ class ToppingService:
         category: ToppingCategory | None = None,
         vegetarian_only: bool | None = None,
         is_available: bool | None = None,
+    ):
+        params = {
+            "category": category.value if category else None,
+            "vegetarian_only": vegetarian_only,
+            "is_available": is_available,
+        }
+        return await menu_cache.get_or_load(
+            "toppings",
+            params,
+            lambda: self._load_all(category, vegetarian_only, is_available),
+        )
+
+    async def _load_all(
+        self,
+        category: ToppingCategory | None,
+        vegetarian_only: bool | None,
+        is_available: bool | None,
     ):
         stmt = select(Topping)
 
@@ -244,7 +329,10 @@ class ToppingService:
 
         stmt = stmt.order_by(asc(Topping.name))
         result = await self.session.scalars(stmt)
-        return result.all()
+        return topping_list_adapter.dump_python(
+            topping_list_adapter.validate_python(result.all(), from_attributes=True),
+            mode="json",
+        )
 
     async def create(self, data: ToppingCreate) -> Topping:
         await self._check_duplicate_name(data.name)
@@ -257,6 +345,7 @@ class ToppingService:
 
         self.session.add(topping)
         await self.session.commit()
+        await menu_cache.bump_version()
         await self.session.refresh(topping)
         return topping
 
@@ -266,6 +355,14 @@ class ToppingService:
             raise ToppingNotFoundError()
         return topping
 
+    async def get_many(self, topping_ids: Iterable[UUID]) -> dict[UUID, Topping]:
+        topping_ids = set(topping_ids)
+        toppings = await _get_by_ids(self.session, Topping, topping_ids)
+        if len(toppings) != len(topping_ids):
+            missing_ids = topping_ids - toppings.keys()
+            raise ToppingNotFoundError(f"Toppings not found: {missing_ids}")
+        return toppings
+
     async def update(self, topping_id: UUID, data: ToppingUpdate) -> Topping:
         topping = await self.get_one(topping_id)
 
@@ -283,6 +380,7 @@ class ToppingService:
 
         self.session.add(topping)
         await self.session.commit()
+        await menu_cache.bump_version()
         await self.session.refresh(topping)
         return topping
 
@@ -290,6 +388,7 @@ class ToppingService:
         topping = await self.get_one(topping_id)
         await self.session.delete(topping)
         await self.session.commit()
+        await menu_cache.bump_version()
 
     async def _check_duplicate_name(self, name: str):
         stmt = select(Topping).where(Topping.name == name)
@@ -306,11 +405,21 @@ class SizeService:
         self.session = session
 
     async def get_all(self, available_only: bool = False):
+        return await menu_cache.get_or_load(
+            "sizes",
+            {"available_only": available_only},
+            lambda: self._load_all(available_only),
+        )
+
+    async def _load_all(self, available_only: bool):
         stmt = select(Size).order_by(asc(Size.sort_order))
         if available_only:
             stmt = stmt.where(Size.is_available == True)
         result = await self.session.scalars(stmt)
-        return result.all()
+        return size_list_adapter.dump_python(
+            size_list_adapter.validate_python(result.all(), from_attributes=True),
+            mode="json",
+        )
 
     async def create(self, data: SizeCreate) -> Size:
         await self._check_duplicate_name(data.name)
@@ -318,6 +427,7 @@ class SizeService:
         size = Size(**data.model_dump())
         self.session.add(size)
         await self.session.commit()
+        await menu_cache.bump_version()
         await self.session.refresh(size)
         return size
 
@@ -330,6 +440,13 @@ class SizeService:
             raise SizeNotFoundError()
         return size
 
+    async def get_many(self, size_ids: Iterable[UUID]) -> dict[UUID, Size]:
+        size_ids = set(size_ids)
+        sizes = await _get_by_ids(self.session, Size, size_ids)
+        if len(sizes) != len(size_ids):
+            raise SizeNotFoundError()
+        return sizes
+
     async def update(self, size_id: UUID, data: SizeUpdate) -> Size:
         size = await self.get_one(size_id)
 
@@ -344,6 +461,7 @@ class SizeService:
 
         self.session.add(size)
         await self.session.commit()
+        await menu_cache.bump_version()
         await self.session.refresh(size)
         return size
 
@@ -354,6 +472,7 @@ class SizeService:
         size = await self.get_one(size_id)
         await self.session.delete(size)
         await self.session.commit()
+        await menu_cache.bump_version()
 
     async def _check_duplicate_name(self, name: str):
         stmt = select(Size).where(Size.name == name)
@@ -370,11 +489,21 @@ class CrustService:
         self.session = session
 
     async def get_all(self, available_only: bool = False):
+        return await menu_cache.get_or_load(
+            "crusts",
+            {"available_only": available_only},
+            lambda: self._load_all(available_only),
+        )
+
+    async def _load_all(self, available_only: bool):
         stmt = select(Crust).order_by(asc(Crust.sort_order))
         if available_only:
             stmt = stmt.where(Crust.is_available == True)
         result = await self.session.scalars(stmt)
-        return result.all()
+        return crust_list_adapter.dump_python(
+            crust_list_adapter.validate_python(result.all(), from_attributes=True),
+            mode="json",
+        )
 
     async def create(self, data: CrustCreate) -> Crust:
         await self._check_duplicate_name(data.name)
@@ -382,6 +511,7 @@ class CrustService:
         crust = Crust(**data.model_dump())
         self.session.add(crust)
         await self.session.commit()
+        await menu_cache.bump_version()
         await self.session.refresh(crust)
         return crust
 
@@ -394,6 +524,13 @@ class CrustService:
             raise CrustNotFoundError()
         return crust
 
+    async def get_many(self, crust_ids: Iterable[UUID]) -> dict[UUID, Crust]:
+        crust_ids = set(crust_ids)
+        crusts = await _get_by_ids(self.session, Crust, crust_ids)
+        if len(crusts) != len(crust_ids):
+            raise CrustNotFoundError()
+        return crusts
+
     async def update(self, crust_id: UUID, data: CrustUpdate) -> Crust:
         crust = await self.get_one(crust_id)
 
@@ -408,6 +545,7 @@ class CrustService:
 
         self.session.add(crust)
         await self.session.commit()
+        await menu_cache.bump_version()
         await self.session.refresh(crust)
         return crust
 
@@ -418,9 +556,125 @@ class CrustService:
         crust = await self.get_one(crust_id)
         await self.session.delete(crust)
         await self.session.commit()
+        await menu_cache.bump_version()
 
     async def _check_duplicate_name(self, name: str):
         stmt = select(Crust).where(Crust.name == name)
         existing = await self.session.scalar(stmt)
         if existing:
             raise CrustAlreadyExistsError()
+
+
+class MenuCatalogService:
+    def __init__(
+        self,
+        session: AsyncSession,
+    ):
+        self.session = session
+
+    async def get_catalog(self, use_cache: bool = True) -> dict[str, dict[str, dict]]:
+        """
+        Every pizza, size, crust and topping (available or not) as json, keyed by
+        entity type then id. Used to price redis-backed carts without db reads.
+        """
+        if not use_cache:
+            return await self._load_catalog()
+        return await menu_cache.get_or_load("catalog", {}, self._load_catalog)
+
+    async def _load_catalog(self) -> dict[str, dict[str, dict]]:
+        pizzas = await self.session.scalars(
+            select(Pizza).options(selectinload(Pizza.default_toppings))
+        )
+        toppings = await self.session.scalars(select(Topping))
+        sizes = await self.session.scalars(select(Size))
+        crusts = await self.session.scalars(select(Crust))
+
+        def by_id(schema, rows) -> dict[str, dict]:
+            return {
+                str(row.id): schema.model_validate(row).model_dump(mode="json")
+                for row in rows
+            }
+
+        return {
+            "pizzas": by_id(PizzaResponse, pizzas),
+            "toppings": by_id(ToppingResponse, toppings),
+            "sizes": by_id(SizeResponse, sizes),
+            "crusts": by_id(CrustResponse, crusts),
+        }
+
+
+class MenuSnapshotService:
+    def __init__(
+        self,
+        session: AsyncSession,
+    ):
+        self.session = session
+
+    async def get_snapshot(self) -> bytes:
+        """Return the available menu as json bytes, built once per menu version."""
+        return await menu_cache.get_or_build_raw("snapshot", self._build_snapshot)
+
+    async def _build_snapshot(self) -> str:
+        version = await menu_cache.get_version()
+
+        pizzas = (
+            await self.session.scalars(
+                select(Pizza)
+                .where(Pizza.is_available == True)
+                .options(selectinload(Pizza.default_toppings))
+                .order_by(desc(Pizza.featured), asc(Pizza.name))
+            )
+        ).all()
+        toppings = (
+            await self.session.scalars(
+                select(Topping)
+                .where(Topping.is_available == True)
+                .order_by(asc(Topping.name))
+            )
+        ).all()
+        sizes = (
+            await self.session.scalars(
+                select(Size)
+                .where(Size.is_available == True)
+                .order_by(asc(Size.sort_order))
+            )
+        ).all()
+        crusts = (
+            await self.session.scalars(
+                select(Crust)
+                .where(Crust.is_available == True)
+                .order_by(asc(Crust.sort_order))
+            )
+        ).all()
+
+        snapshot = MenuSnapshotResponse(
+            version=version,
+            generated_at=datetime.now(timezone.utc),
+            pizzas=[
+                SnapshotPizzaResponse.model_validate(
+                    {
+                        **PizzaResponse.model_validate(pizza).model_dump(),
+                        "price_matrix": self._price_matrix(pizza, sizes, crusts),
+                    }
+                )
+                for pizza in pizzas
+            ],
+            toppings=topping_list_adapter.validate_python(toppings, from_attributes=True),
+            sizes=size_list_adapter.validate_python(sizes, from_attributes=True),
+            crusts=crust_list_adapter.validate_python(crusts, from_attributes=True),
+        )
+        return snapshot.model_dump_json(by_alias=True)
+
+    def _price_matrix(
+        self, pizza: Pizza, sizes: Sequence[Size], crusts: Sequence[Crust]
+    ) -> dict[UUID, dict[UUID, Decimal]]:
+        """Same formula as cart/order pricing, without extra toppings."""
+        return {
+            size.id: {
+                crust.id: (
+                    pizza.base_price * size.multiplier + crust.additional_price
+                ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+                for crust in crusts
+            }
+            for size in sizes
+        }
@@ -0,0 +1,116 @@
+import asyncio
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Awaitable, Callable
+from app.core.config import settings
+from app.utils.logger import logger
+
+
+class StageTimings:
+    """Count / avg / max latency per named stage."""
+
+    def __init__(self):
+        self._stages: dict[str, tuple[int, float, float]] = {}
+
+    def record(self, stage: str, ms: float):
+        count, total, peak = self._stages.get(stage, (0, 0.0, 0.0))
+        self._stages[stage] = (count + 1, total + ms, max(peak, ms))
+
+    @contextmanager
+    def measure(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - started) * 1000)
+
+    def stats(self) -> dict:
+        return {
+            stage: {
+                "count": count,
+                "avg_ms": round(total / count, 2),
+                "max_ms": round(peak, 2),
+            }
+            for stage, (count, total, peak) in self._stages.items()
+        }
+
+
+class KeyedDispatcher:
+    """
+    Runs jobs concurrently across keys and strictly in order within a key.
+
+    Each key hashes to one of `workers` tasks with its own bounded queue, so
+    all events for a user go through the same worker. submit() waits while
+    that queue is full, which stops the caller from reading more work.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timings = StageTimings()
+        self.processed = 0
+        self.failed = 0
+        self._queues: list[asyncio.Queue] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self):
+        self._queues = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in range(self.workers)
+        ]
+        self._tasks = [asyncio.create_task(self._work(q)) for q in self._queues]
+
+    async def submit(self, key: str, job: Callable[[], Awaitable]):
+        queue = self._queues[zlib.crc32(key.encode()) % self.workers]
+        if queue.full():
+            with self.timings.measure("backpressure"):
+                await queue.put((time.perf_counter(), job))
+        else:
+            queue.put_nowait((time.perf_counter(), job))
+
+    async def _work(self, queue: asyncio.Queue):
+        while True:
+            submitted_at, job = await queue.get()
+            started = time.perf_counter()
+            self.timings.record("queue_wait", (started - submitted_at) * 1000)
+            try:
+                await job()
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Dispatched job failed: {e}", exc_info=True)
+            finally:
+                total_ms = (time.perf_counter() - submitted_at) * 1000
+                self.timings.record("total", total_ms)
+                queue.task_done()
+
+    async def close(self, timeout: float):
+        """Let queued jobs finish for up to `timeout` seconds, then stop."""
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(q.join() for q in self._queues)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Dispatcher closed with jobs still queued")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict:
+        depths = [q.qsize() for q in self._queues]
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "processed": self.processed,
+            "failed": self.failed,
+            "stages": self.timings.stats(),
+        }
+
+
+event_dispatcher = KeyedDispatcher(
+    workers=settings.EVENT_DISPATCH_WORKERS,
+    queue_size=settings.EVENT_DISPATCH_QUEUE_SIZE,
+)
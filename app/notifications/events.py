@@ -1,11 +1,17 @@
 from datetime import datetime, timezone
 import asyncio
+import time
+from functools import partial
 from typing import Dict, Any
+from redis.exceptions import RedisError
+from app.core.config import settings
 from app.notifications.redis_pubsub import pubsub_service
+from app.notifications.streams import event_stream, INSTANCE_ID
+from app.notifications.dispatcher import event_dispatcher
+from app.notifications.presence import presence_registry
 from app.utils.logger import logger
 from app.notifications.model import NotificationPriority
-from app.notifications.service import NotificationService
-from app.core.database import async_session
+from app.notifications.writer import notification_writer
 from app.notifications.manager import notifications_manager
 from app.notifications.schema import (
     NotificationCreate,
@@ -24,25 +30,104 @@ class Channels:
     PROMO_EVENTS = "promo_events"
 
 
+# durable streams, persisted once across the fleet by the consumer group
+EVENT_STREAMS = [
+    Channels.ORDER_EVENTS,
+    Channels.PAYMENT_EVENTS,
+    Channels.DELIVERY_EVENTS,
+    Channels.CART_EVENTS,
+    Channels.PROMO_EVENTS,
+]
+
+# stream ids per channel handed to the dispatcher and not finished yet, so
+# claim_stale doesn't give this consumer back entries still in its queues
+in_flight: dict[str, set[str]] = {channel: set() for channel in EVENT_STREAMS}
+
+
+async def start_event_consumer():
+    """
+    Persist stream events; each one is handled by a single process. Events
+    for different users run concurrently, events for one user in order.
+    """
+    event_dispatcher.start()
+    try:
+        await event_stream.ensure_groups(*EVENT_STREAMS)
+        logger.info(f"Event consumer {INSTANCE_ID} started.")
+
+        last_claim = 0.0
+        while True:
+            try:
+                entries = []
+                claim_every = settings.EVENT_STREAM_CLAIM_IDLE_MS / 1000
+                if time.monotonic() - last_claim >= claim_every:
+                    # events a crashed (or failing) consumer read but never acked
+                    for channel in EVENT_STREAMS:
+                        entries += await event_stream.claim_stale(
+                            channel, INSTANCE_ID, skip=in_flight[channel]
+                        )
+                    last_claim = time.monotonic()
+
+                entries += await event_stream.read(*EVENT_STREAMS, consumer=INSTANCE_ID)
+            except (RedisError, OSError) as e:
+                logger.error(f"Event consumer read failed, retrying: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            for channel, message_id, data in entries:
+                in_flight[channel].add(message_id)
+                # blocks while the user's worker is saturated, pausing reads
+                await event_dispatcher.submit(
+                    str(data.get("user_id") or message_id),
+                    partial(consume_event, channel, message_id, data),
+                )
+    except asyncio.CancelledError:
+        logger.info("Event consumer cancelled")
+    except Exception as e:
+        logger.error(f"Event consumer error: {e}", exc_info=True)
+    finally:
+        # anything not finished stays pending and is claimed after restart
+        await event_dispatcher.close(timeout=settings.EVENT_DISPATCH_DRAIN_SECONDS)
+
+
+async def consume_event(channel: str, message_id: str, data: Dict[str, Any]):
+    try:
+        await handle_stream_entry(channel, message_id, data)
+    finally:
+        in_flight[channel].discard(message_id)
+
+
+async def handle_stream_entry(channel: str, message_id: str, data: Dict[str, Any]):
+    try:
+        # stream ids are only unique per stream
+        await route_event(
+            channel=channel, event_data=data, event_id=f"{channel}:{message_id}"
+        )
+    except Exception as e:
+        # left pending, retried by claim_stale
+        logger.error(
+            f"Error handling event {message_id} from {channel}: {e}", exc_info=True
+        )
+        return
+
+    try:
+        await event_stream.ack(channel, message_id)
+    except RedisError as e:
+        # stays pending; the redelivery reuses the stored notification
+        logger.error(f"Failed to ack event {message_id} from {channel}: {e}")
+
+
 async def start_event_listener():
+    """Deliver notifications routed to this replica to its websockets."""
     try:
-        channels = [
-            Channels.ORDER_EVENTS,
-            Channels.PAYMENT_EVENTS,
-            Channels.DELIVERY_EVENTS,
-            Channels.CART_EVENTS,
-            Channels.PROMO_EVENTS,
-        ]
-        await pubsub_service.subscribe(*channels)
+        await pubsub_service.subscribe(presence_registry.channel)
         logger.info("Event listener started.")
 
         async for message in pubsub_service.listen():
-            channel = message["channel"]
             data = message["data"]
             try:
-                await route_event(channel=channel, event_data=data)
+                await deliver_notification(data)
             except Exception as e:
-                logger.error(f"Error handling event from {channel}: {e}", exc_info=True)
+                logger.error(f"Error delivering notification: {e}", exc_info=True)
     except asyncio.CancelledError:
         logger.info("Event listener cancelled")
         await pubsub_service.close()
@@ -51,17 +136,49 @@ async def start_event_listener():
         await pubsub_service.close()
 
 
-async def route_event(channel: str, event_data: Dict[str, Any]):
+async def deliver_notification(data: Dict[str, Any]):
+    match data.get("scope"):
+        case "user":
+            await notifications_manager.send_to_user(
+                user_id=data["user_id"], message=data["message"]
+            )
+        case "admin":
+            await notifications_manager.send_to_admin(data["message"])
+        case _:
+            logger.warning(f"Unknown notification scope: {data}")
+
+
+async def publish_notification(
+    scope: str, message: Dict[str, Any], user_id: str | None = None
+):
+    """Route to the replicas holding a socket for the recipient, if any."""
+    with event_dispatcher.timings.measure("publish"):
+        if scope == "user":
+            replicas = await presence_registry.get_user_replicas(user_id)
+        else:
+            replicas = await presence_registry.get_admin_replicas()
+
+        data = {"scope": scope, "user_id": user_id, "message": message}
+        for replica in replicas:
+            if replica == INSTANCE_ID:
+                await deliver_notification(data)
+            else:
+                await pubsub_service.publish(
+                    presence_registry.get_replica_channel(replica), event_data=data
+                )
+
+
+async def route_event(channel: str, event_data: Dict[str, Any], event_id: str):
     match channel:
         case Channels.ORDER_EVENTS:
-            await handle_order_event(event_data)
+            await handle_order_event(event_data, event_id)
         case Channels.PAYMENT_EVENTS:
-            await handle_payment_event(event_data)
+            await handle_payment_event(event_data, event_id)
         case _:
             logger.warning(f"Unknown event channel: {channel}")
 
 
-async def handle_order_event(event_data: Dict[str, Any]):
+async def handle_order_event(event_data: Dict[str, Any], event_id: str):
     event_type = event_data.get("event_type")
     user_id = event_data.get("user_id")
     if not event_type or not user_id:
@@ -77,10 +194,11 @@ async def handle_order_event(event_data: Dict[str, Any]):
         user_id=user_id,
         event_data=event_data,
         template=template,
+        event_id=event_id,
     )
 
 
-async def handle_payment_event(event_data: Dict[str, Any]):
+async def handle_payment_event(event_data: Dict[str, Any], event_id: str):
     event_type = event_data.get("event_type")
     user_id = event_data.get("user_id")
     if not event_type or not user_id:
@@ -96,6 +214,7 @@ async def handle_payment_event(event_data: Dict[str, Any]):
         user_id=user_id,
         event_data=event_data,
         template=template,
+        event_id=event_id,
     )
 
 
@@ -104,13 +223,15 @@ async def dispatch_notification_from_template(
     user_id: uuid.UUID | None,
     event_data: dict,
     template: dict,
+    event_id: str,
 ):
     if user_id and "user" in template:
         user_tpl = template["user"]
         if user_tpl.get("persist", True):
-            async with async_session() as session:
-                notification = await NotificationService(session).create_notification(
-                    data=NotificationCreate(
+            # resolves once the batch holding it is committed
+            with event_dispatcher.timings.measure("persist"):
+                notification = await notification_writer.write(
+                    NotificationCreate(
                         user_id=user_id,
                         notification_type=user_tpl["type"],
                         title=user_tpl["title"],
@@ -119,23 +240,23 @@ async def dispatch_notification_from_template(
                         data=event_data,
                         channels=user_tpl["channels"],
                         expires_in_hours=user_tpl["expires_in_hours"],
+                        event_id=event_id,
                     )
                 )
-
-            await notifications_manager.send_to_user(
-                user_id=user_id,
+            # a redelivered event gets the row stored the first time and is
+            # pushed again, since the first push may be what failed; clients
+            # dedupe on the notification id
+            await publish_notification(
+                "user",
+                user_id=str(user_id),
                 message={
-                    "id": str(notification.id) if notification else None,
+                    "id": str(notification.id),
                     "type": user_tpl["type"].value,
                     "title": user_tpl["title"],
                     "message": user_tpl["message"].format(**event_data),
                     "priority": user_tpl["priority"].value,
                     "data": event_data,
-                    "created_at": (
-                        notification.created_at.isoformat()
-                        if notification
-                        else datetime.now(timezone.utc).isoformat()
-                    ),
+                    "created_at": notification.created_at.isoformat(),
                 },
             )
     if "admin" in template:
@@ -151,7 +272,7 @@ async def dispatch_notification_from_template(
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        await notifications_manager.send_to_admin(admin_payload)
+        await publish_notification("admin", message=admin_payload)
 
 
 async def publish_order_event(event_type: str, data: OrderEventData):
@@ -160,7 +281,7 @@ async def publish_order_event(event_type: str, data: OrderEventData):
         "timestamp": datetime.now(timezone.utc).isoformat(),
         **data.model_dump(exclude_unset=True, mode="json"),
     }
-    await pubsub_service.publish(Channels.ORDER_EVENTS, event_data=event)
+    await event_stream.add(Channels.ORDER_EVENTS, event)
 
 
 async def publish_payment_event(event_type: str, data: PaymentEventData):
@@ -169,7 +290,7 @@ async def publish_payment_event(event_type: str, data: PaymentEventData):
         "timestamp": datetime.now(timezone.utc).isoformat(),
         **data.model_dump(exclude_unset=True, mode="json"),
     }
-    await pubsub_service.publish(Channels.PAYMENT_EVENTS, event_data=event)
+    await event_stream.add(Channels.PAYMENT_EVENTS, event)
 
 
 ORDER_EVENT_TEMPLATES = {
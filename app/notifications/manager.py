@@ -1,69 +1,224 @@
-from typing import List, Dict
-from fastapi import WebSocket
+import asyncio
+import json
+import time
+from typing import Awaitable, Dict
+from fastapi import WebSocket, status
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.notifications.presence import presence_registry
 from app.utils.logger import logger
 
 
+def serialize(message: dict) -> str:
+    # same encoding as WebSocket.send_json, done once per message
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class SendStats:
+    def __init__(self):
+        self.sent = 0
+        self.dropped = 0
+        self.slow_disconnects = 0
+        self.total_send_ms = 0.0
+        self.max_send_ms = 0.0
+
+    def record_send(self, send_ms: float):
+        self.sent += 1
+        self.total_send_ms += send_ms
+        self.max_send_ms = max(self.max_send_ms, send_ms)
+
+
+class ConnectionWriter:
+    """
+    Outbound side of one websocket: a bounded queue drained by its own task,
+    so a slow client only ever delays itself.
+    """
+
+    def __init__(self, websocket: WebSocket, stats: SendStats):
+        self.websocket = websocket
+        self.stats = stats
+        self.queue: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=settings.WS_SEND_QUEUE_SIZE
+        )
+        self.closing = False
+        self.task = asyncio.create_task(self._drain())
+        self.close_task: asyncio.Task | None = None
+
+    def enqueue(self, payload: str):
+        """Never blocks; a full queue means a slow consumer (see WS_SLOW_CONSUMER_POLICY)."""
+        if self.closing:
+            return
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            if settings.WS_SLOW_CONSUMER_POLICY == "drop":
+                self.stats.dropped += 1
+                return
+            self.stats.slow_disconnects += 1
+            logger.warning("WS slow consumer, disconnecting")
+            self._abort(status.WS_1013_TRY_AGAIN_LATER)
+
+    async def _drain(self):
+        try:
+            while True:
+                payload = await self.queue.get()
+                started = time.perf_counter()
+                await asyncio.wait_for(
+                    self.websocket.send_text(payload),
+                    timeout=settings.WS_SEND_TIMEOUT_SECONDS,
+                )
+                self.stats.record_send((time.perf_counter() - started) * 1000)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.stats.slow_disconnects += 1
+            logger.warning("WS send timed out, disconnecting")
+            await self._close(status.WS_1013_TRY_AGAIN_LATER)
+        except Exception:
+            # socket already gone; the route's receive loop unregisters it
+            self.closing = True
+
+    def _abort(self, code: int):
+        self.closing = True
+        self.task.cancel()
+        self.close_task = asyncio.create_task(self._close(code))
+
+    async def _close(self, code: int):
+        self.closing = True
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    def stop(self):
+        self.closing = True
+        self.task.cancel()
+
+
 class NotificationsManager:
     def __init__(self):
-        self.active_user_connections: Dict[str, List[WebSocket]] = {}
-        self.active_admin_connections: List[WebSocket] = []
+        self.active_user_connections: Dict[str, Dict[WebSocket, ConnectionWriter]] = {}
+        self.active_admin_connections: Dict[WebSocket, ConnectionWriter] = {}
+        self.stats = SendStats()
 
     async def connect_user(self, user_id: str, websocket: WebSocket):
         await websocket.accept()
-        self.active_user_connections.setdefault(user_id, []).append(websocket)
-        logger.info(
-            f"WS connected: user={user_id}, "
-            f"total={len(self.active_user_connections[user_id])}"
-        )
+        connections = self.active_user_connections.setdefault(user_id, {})
+        connections[websocket] = ConnectionWriter(websocket, self.stats)
+        if len(connections) == 1:
+            await self._update_presence(presence_registry.register([user_id]))
+        logger.info(f"WS connected: user={user_id}, total={len(connections)}")
 
     async def connect_admin(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_admin_connections.append(websocket)
+        self.active_admin_connections[websocket] = ConnectionWriter(
+            websocket, self.stats
+        )
+        if len(self.active_admin_connections) == 1:
+            await self._update_presence(presence_registry.register(admin=True))
         logger.info(f"WS connected: ADMIN, total={len(self.active_admin_connections)}")
 
     async def send_to_user(self, user_id: str, message: dict):
-        connections = self.active_user_connections.get(user_id, [])
-        await self._safe_send(connections, message)
+        connections = self.active_user_connections.get(user_id)
+        if connections:
+            self._enqueue(connections.values(), serialize(message))
 
     async def send_to_admin(self, message: dict):
-        await self._safe_send(self.active_admin_connections, message)
+        if self.active_admin_connections:
+            self._enqueue(self.active_admin_connections.values(), serialize(message))
 
-    async def _safe_send(self, connections: List[WebSocket], message: dict):
-        disconnected = []
-        for ws in connections:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                disconnected.append(ws)
+    async def broadcast_to_all_users(self, message: dict):
+        payload = serialize(message)
+        for connections in self.active_user_connections.values():
+            self._enqueue(connections.values(), payload)
 
-        for ws in disconnected:
-            connections.remove(ws)
+    def _enqueue(self, writers, payload: str):
+        # enqueueing never awaits, each writer task sends concurrently
+        for writer in writers:
+            writer.enqueue(payload)
 
     async def disconnect_user(self, user_id: str, websocket: WebSocket):
         connections = self.active_user_connections.get(user_id)
         if not connections:
             return
 
-        if websocket in connections:
-            connections.remove(websocket)
+        writer = connections.pop(websocket, None)
+        if writer:
+            writer.stop()
 
         if not connections:
             del self.active_user_connections[user_id]
+            await self._update_presence(presence_registry.unregister([user_id]))
 
         logger.info(f"WS disconnected: user={user_id}")
 
     async def disconnect_admin(self, websocket: WebSocket):
-        if websocket in self.active_admin_connections:
-            self.active_admin_connections.remove(websocket)
+        writer = self.active_admin_connections.pop(websocket, None)
+        if writer:
+            writer.stop()
+            if not self.active_admin_connections:
+                await self._update_presence(presence_registry.unregister(admin=True))
 
         logger.info("WS disconnected: ADMIN")
 
-    async def broadcast_to_all_users(self, message: dict):
-        all_connections = []
-        for connections in self.active_user_connections.values():
-            all_connections.extend(connections)
+    def get_stats(self) -> dict:
+        writers = [
+            writer
+            for connections in self.active_user_connections.values()
+            for writer in connections.values()
+        ] + list(self.active_admin_connections.values())
+        depths = [writer.queue.qsize() for writer in writers]
+        stats = self.stats
+
+        return {
+            "users": len(self.active_user_connections),
+            "connections": len(writers),
+            "admin_connections": len(self.active_admin_connections),
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "sent": stats.sent,
+            "dropped": stats.dropped,
+            "slow_disconnects": stats.slow_disconnects,
+            "avg_send_ms": round(stats.total_send_ms / stats.sent, 2)
+            if stats.sent
+            else 0.0,
+            "max_send_ms": round(stats.max_send_ms, 2),
+        }
+
+    async def _update_presence(self, update: Awaitable):
+        # a socket must not fail over presence; the next heartbeat repairs it
+        try:
+            await update
+        except RedisError as e:
+            logger.error(f"Presence update failed: {e}")
+
+    async def refresh_presence(self):
+        await self._update_presence(
+            presence_registry.register(
+                list(self.active_user_connections),
+                admin=bool(self.active_admin_connections),
+            )
+        )
 
-        await self._safe_send(all_connections, message)
+    async def clear_presence(self):
+        await self._update_presence(
+            presence_registry.unregister(
+                list(self.active_user_connections),
+                admin=bool(self.active_admin_connections),
+            )
+        )
 
 
 notifications_manager = NotificationsManager()
+
+
+async def start_presence_heartbeat():
+    """Keep this replica's presence entries alive while it holds sockets."""
+    try:
+        while True:
+            await asyncio.sleep(settings.PRESENCE_HEARTBEAT_SECONDS)
+            await notifications_manager.refresh_presence()
+    except asyncio.CancelledError:
+        # entries would expire anyway, this just stops routing to us sooner
+        await notifications_manager.clear_presence()
+        logger.info("Presence heartbeat cancelled")
@@ -8,6 +8,7 @@ from sqlalchemy import (
     JSON,
     Enum,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import ARRAY
@@ -63,6 +64,8 @@ class Notification(Base):
         nullable=False,
     )
     data: Mapped[dict] = mapped_column(JSON, nullable=True)
+    # stream message id of the source event, keeps redeliveries from inserting twice
+    event_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     notification_type: Mapped[NotificationType] = mapped_column(
         Enum(NotificationType),
@@ -108,5 +111,21 @@ class Notification(Base):
 
     user: Mapped["User"] = relationship("User", back_populates="notifications")
 
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_notifications_user_id_created_at_unread",
+            "user_id",
+            "created_at",
+            postgresql_where=(is_read == False),
+        ),
+        Index("uq_notifications_event_id", "event_id", unique=True),
+        Index(
+            "ix_notifications_expires_at",
+            "expires_at",
+            postgresql_where=(expires_at.isnot(None)),
+        ),
+    )
+
     def __repr__(self):
         return f"<Notification {self.id} - {self.notification_type} for user {self.user_id}>"
@@ -0,0 +1,76 @@
+import time
+import redis.asyncio as redis
+from typing import Iterable
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.notifications.streams import INSTANCE_ID
+
+PRESENCE_ADMINS_KEY = "presence:admins"
+
+
+class PresenceRegistry:
+    """
+    Which replicas hold a websocket for whom, so a notification is published
+    only to the replica(s) that can deliver it.
+
+    - presence:user:{user_id}  zset, replica id -> expiry (epoch seconds)
+    - presence:admins          zset, replica id -> expiry
+
+    Replicas refresh their entries every PRESENCE_HEARTBEAT_SECONDS; a replica
+    that dies stops refreshing and drops out after PRESENCE_TTL_SECONDS.
+    """
+
+    def __init__(self, redis: redis.Redis, instance_id: str):
+        self.redis = redis
+        self.instance_id = instance_id
+
+    def get_user_key(self, user_id: str):
+        return f"presence:user:{user_id}"
+
+    def get_replica_channel(self, instance_id: str):
+        return f"notifications:{instance_id}"
+
+    @property
+    def channel(self):
+        return self.get_replica_channel(self.instance_id)
+
+    async def register(self, user_ids: Iterable[str] = (), admin: bool = False):
+        """Add or refresh this replica's entries; also prunes dead replicas."""
+        ttl = settings.PRESENCE_TTL_SECONDS
+        now = time.time()
+        keys = [self.get_user_key(user_id) for user_id in user_ids]
+        if admin:
+            keys.append(PRESENCE_ADMINS_KEY)
+        if not keys:
+            return
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.zadd(key, {self.instance_id: now + ttl})
+                pipe.zremrangebyscore(key, "-inf", now)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def unregister(self, user_ids: Iterable[str] = (), admin: bool = False):
+        keys = [self.get_user_key(user_id) for user_id in user_ids]
+        if admin:
+            keys.append(PRESENCE_ADMINS_KEY)
+        if not keys:
+            return
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.zrem(key, self.instance_id)
+            await pipe.execute()
+
+    async def _get_replicas(self, key: str) -> list[str]:
+        return await self.redis.zrangebyscore(key, time.time(), "+inf")
+
+    async def get_user_replicas(self, user_id: str) -> list[str]:
+        return await self._get_replicas(self.get_user_key(user_id))
+
+    async def get_admin_replicas(self) -> list[str]:
+        return await self._get_replicas(PRESENCE_ADMINS_KEY)
+
+
+presence_registry = PresenceRegistry(redis_client.redis, INSTANCE_ID)
@@ -1,17 +1,14 @@
 import json
 import redis.asyncio as redis
 from typing import Dict, Any, AsyncGenerator
-from app.core.config import settings
+from app.core.redis import redis_pool, pubsub_pool
 from app.utils.logger import logger
 
 
 class RedisPubSubService:
     def __init__(self):
-        self.redis_client = redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-            encoding="utf-8",
-        )
+        self.redis_client = redis.Redis(connection_pool=redis_pool)
+        self.subscriber_client = redis.Redis(connection_pool=pubsub_pool)
         self.pubsub = None
 
     async def publish(self, channel: str, event_data: Dict[str, Any]) -> int:
@@ -31,7 +28,7 @@ class RedisPubSubService:
         *channels: str,
     ) -> None:
         if not self.pubsub:
-            self.pubsub = self.redis_client.pubsub()
+            self.pubsub = self.subscriber_client.pubsub()
         await self.pubsub.subscribe(*channels)
         logger.info(f"Subscribed to channels {channels}")
 
@@ -58,9 +55,10 @@ class RedisPubSubService:
                     continue
 
     async def close(self) -> None:
+        # the pools themselves are closed in the app lifespan
         if self.pubsub:
-            await self.pubsub.close()
-        await self.redis_client.close()
+            await self.pubsub.aclose()
+            self.pubsub = None
         logger.info("Closed Redis Pub/Sub connection")
 
 
@@ -7,7 +7,7 @@ from app.auth.dependencies import (
     UserOrAdminDep,
     get_current_admin_ws,
 )
-from app.auth.model import User
+from app.auth.schema import AuthUser
 from app.notifications.manager import notifications_manager
 from app.notifications.service import NotificationService
 from app.notifications.schema import (
@@ -61,7 +61,7 @@ async def delete_notification(
 async def notifications_ws(
     websocket: WebSocket,
     db: Annotated[AsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user_ws)],
+    current_user: Annotated[AuthUser, Depends(get_current_user_ws)],
 ):
     user_id = str(current_user.id)
     await notifications_manager.connect_user(user_id=user_id, websocket=websocket)
@@ -83,7 +83,7 @@ async def notifications_ws(
 async def admin_notifications_ws(
     websocket: WebSocket,
     db: Annotated[AsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_admin_ws)],
+    current_user: Annotated[AuthUser, Depends(get_current_admin_ws)],
 ):
     await notifications_manager.connect_admin(websocket=websocket)
 
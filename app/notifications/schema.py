@@ -26,6 +26,7 @@ class NotificationCreate(NotificationBase):
     user_id: uuid.UUID
     channels: List[NotificationChannel] | None = [NotificationChannel.WEBSOCKET]
     expires_in_hours: int | None = None
+    event_id: str | None = None
 
 
 class NotificationRead(NotificationBase):
@@ -2,8 +2,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.notifications.schema import NotificationCreate
 from app.notifications.model import Notification
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.core.config import settings
+from app.core.database import delete_in_batches
 
 
 class NotificationService:
@@ -13,21 +16,49 @@ class NotificationService:
     ):
         self.session = session
 
-    async def create_notification(self, data: NotificationCreate):
+    def _to_values(self, data: NotificationCreate) -> dict:
         expires_at = None
 
         if data.expires_in_hours:
             expires_at = datetime.now(timezone.utc) + timedelta(
                 hours=data.expires_in_hours
             )
-        notification = Notification(
+        return {
             **data.model_dump(exclude={"expires_in_hours"}),
-            expires_at=expires_at,
+            "expires_at": expires_at,
+        }
+
+    async def create_notifications(self, items: list[NotificationCreate]):
+        """
+        Insert many notifications with one multi-row INSERT and commit. Returns
+        an (id, created_at) row per item, in order. An item whose event_id was
+        already stored gets the stored row, so a redelivered event can still
+        be pushed.
+        """
+        # ids are set here so returned rows can be matched back to the items
+        values = [{**self._to_values(data), "id": uuid4()} for data in items]
+        result = await self.session.execute(
+            pg_insert(Notification)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=[Notification.event_id])
+            .returning(Notification.id, Notification.created_at)
         )
-        self.session.add(notification)
+        inserted = {row.id: row for row in result}
+
+        duplicate_event_ids = [
+            v["event_id"] for v in values if v["id"] not in inserted
+        ]
+        stored = {}
+        if duplicate_event_ids:
+            result = await self.session.execute(
+                select(
+                    Notification.id, Notification.created_at, Notification.event_id
+                ).where(Notification.event_id.in_(duplicate_event_ids))
+            )
+            stored = {row.event_id: row for row in result}
+
         await self.session.commit()
-        await self.session.refresh(notification)
-        return notification
+        return [inserted.get(v["id"]) or stored[v["event_id"]] for v in values]
 
     async def get_user_notifications(
         self, user_id: UUID, limit: int, status: str | None
@@ -57,3 +88,20 @@ class NotificationService:
         )
         await self.session.execute(stmt)
         await self.session.commit()
+
+    async def purge_expired(
+        self,
+        retention_days: int = settings.EXPIRED_NOTIFICATION_RETENTION_DAYS,
+        batch_size: int = settings.CLEANUP_BATCH_SIZE,
+        max_batches: int | None = settings.CLEANUP_MAX_BATCHES,
+    ) -> int:
+        """Delete notifications that expired more than `retention_days` ago."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        return await delete_in_batches(
+            self.session,
+            Notification,
+            Notification.expires_at.isnot(None),
+            Notification.expires_at < cutoff,
+            batch_size=batch_size,
+            max_batches=max_batches,
+        )
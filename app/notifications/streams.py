@@ -0,0 +1,139 @@
+import json
+import os
+import socket
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+from typing import AbstractSet, Dict, Any
+from app.core.config import settings
+from app.core.redis import redis_client, pubsub_pool
+from app.utils.logger import logger
+
+# this process, as a stream consumer (one per uvicorn worker)
+INSTANCE_ID = f"{socket.gethostname()}-{os.getpid()}"
+
+StreamEntry = tuple[str, str, Dict[str, Any]]  # channel, message id, event data
+
+
+class RedisEventStream:
+    """
+    Durable event bus on Redis Streams, one stream per channel (stream:{channel}).
+
+    Every API process joins the same consumer group as its own consumer, so an
+    event is handed to exactly one process however many replicas run. Entries
+    stay pending until acked; entries left pending by a dead consumer are
+    claimed by a live one after EVENT_STREAM_CLAIM_IDLE_MS.
+    """
+
+    def __init__(self, redis: redis.Redis, reader: redis.Redis, group: str):
+        self.redis = redis
+        # blocking reads hold their connection, keep them off the command pool
+        self.reader = reader
+        self.group = group
+
+    def get_stream_key(self, channel: str):
+        return f"stream:{channel}"
+
+    async def add(self, channel: str, event_data: Dict[str, Any]) -> str:
+        return await self.redis.xadd(
+            self.get_stream_key(channel),
+            {"data": json.dumps(event_data)},
+            maxlen=settings.EVENT_STREAM_MAXLEN,
+            approximate=True,
+        )
+
+    async def ensure_groups(self, *channels: str):
+        for channel in channels:
+            try:
+                await self.redis.xgroup_create(
+                    self.get_stream_key(channel), self.group, id="0", mkstream=True
+                )
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    def _parse(self, channel: str, message_id: str, fields: dict) -> StreamEntry:
+        try:
+            data = json.loads(fields["data"])
+        except (KeyError, TypeError, ValueError):
+            logger.error(f"Malformed stream entry {channel}/{message_id}: {fields}")
+            data = {}
+        return channel, message_id, data
+
+    async def read(self, *channels: str, consumer: str) -> list[StreamEntry]:
+        response = await self.reader.xreadgroup(
+            self.group,
+            consumer,
+            {self.get_stream_key(channel): ">" for channel in channels},
+            count=settings.EVENT_STREAM_BATCH_SIZE,
+            block=settings.EVENT_STREAM_BLOCK_MS,
+        )
+        channel_by_key = {self.get_stream_key(c): c for c in channels}
+        return [
+            self._parse(channel_by_key[key], message_id, fields)
+            for key, messages in response or []
+            for message_id, fields in messages
+        ]
+
+    async def ack(self, channel: str, *message_ids: str):
+        if message_ids:
+            await self.redis.xack(
+                self.get_stream_key(channel), self.group, *message_ids
+            )
+
+    async def claim_stale(
+        self, channel: str, consumer: str, skip: AbstractSet[str] = frozenset()
+    ) -> list[StreamEntry]:
+        """
+        Take over entries idle past EVENT_STREAM_CLAIM_IDLE_MS. Entries already
+        delivered EVENT_STREAM_MAX_DELIVERIES times are acked and dropped.
+
+        Idle time counts from delivery, so entries the caller still has queued
+        look stale too; their ids go in `skip`.
+        """
+        key = self.get_stream_key(channel)
+        pending = await self.redis.xpending_range(
+            key,
+            self.group,
+            min="-",
+            max="+",
+            count=settings.EVENT_STREAM_BATCH_SIZE + len(skip),
+            idle=settings.EVENT_STREAM_CLAIM_IDLE_MS,
+        )
+        pending = [p for p in pending if p["message_id"] not in skip]
+        if not pending:
+            return []
+
+        dead = [
+            p["message_id"]
+            for p in pending
+            if p["times_delivered"] >= settings.EVENT_STREAM_MAX_DELIVERIES
+        ]
+        if dead:
+            logger.error(
+                f"Dropping {len(dead)} undeliverable events from {key}: {dead}"
+            )
+            await self.ack(channel, *dead)
+
+        retry = [p["message_id"] for p in pending if p["message_id"] not in dead]
+        if not retry:
+            return []
+
+        claimed = await self.redis.xclaim(
+            key, self.group, consumer, settings.EVENT_STREAM_CLAIM_IDLE_MS, retry
+        )
+        # entries trimmed off the stream come back without fields
+        await self.ack(
+            channel, *(message_id for message_id, fields in claimed if not fields)
+        )
+        return [
+            self._parse(channel, message_id, fields)
+            for message_id, fields in claimed
+            if fields
+        ]
+
+
+event_stream = RedisEventStream(
+    redis=redis_client.redis,
+    reader=redis.Redis(connection_pool=pubsub_pool),
+    group="notification-writers",
+)
@@ -0,0 +1,101 @@
+import asyncio
+from sqlalchemy.engine import Row
+from app.core.config import settings
+from app.core.database import async_session
+from app.notifications.dispatcher import StageTimings
+from app.notifications.schema import NotificationCreate
+from app.notifications.service import NotificationService
+from app.utils.logger import logger
+
+
+class NotificationWriter:
+    """
+    Collects notifications from concurrent callers and stores them in one
+    multi-row INSERT, once `batch_size` rows are buffered or `flush_ms` after
+    the first one, whichever comes first.
+
+    write() resolves only after the batch is committed, so callers push and
+    ack afterwards exactly as they would after their own commit.
+    """
+
+    def __init__(self, batch_size: int, flush_ms: int):
+        self.batch_size = batch_size
+        self.flush_ms = flush_ms
+        self.timings = StageTimings()
+        self.batches = 0
+        self.rows = 0
+        self.failed = 0
+        self._buffer: list[tuple[NotificationCreate, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def write(self, data: NotificationCreate) -> Row:
+        """Returns the stored (id, created_at), also for an already stored event_id."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._buffer.append((data, future))
+
+        if len(self._buffer) >= self.batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_ms / 1000, self._start_flush)
+        return await future
+
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[NotificationCreate, asyncio.Future]]):
+        try:
+            with self.timings.measure("flush"):
+                async with async_session() as session:
+                    rows = await NotificationService(session).create_notifications(
+                        [data for data, _ in batch]
+                    )
+        except Exception as e:
+            # callers see the error and leave their events pending for a retry
+            self.failed += len(batch)
+            logger.error(f"Failed to write {len(batch)} notifications: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.rows += len(batch)
+        for (_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
+
+    async def close(self):
+        """Write whatever is still buffered; called on shutdown."""
+        self._start_flush()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "batch_size": self.batch_size,
+            "flush_ms": self.flush_ms,
+            "buffered": len(self._buffer),
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch_rows": round(self.rows / self.batches, 2)
+            if self.batches
+            else 0.0,
+            "failed": self.failed,
+            "stages": self.timings.stats(),
+        }
+
+
+notification_writer = NotificationWriter(
+    batch_size=settings.NOTIFICATION_WRITE_BATCH_SIZE,
+    flush_ms=settings.NOTIFICATION_WRITE_FLUSH_MS,
+)
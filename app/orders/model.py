@@ -1,8 +1,19 @@
 import uuid
 import enum
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import Uuid, ForeignKey, TIMESTAMP, func, DECIMAL, Enum, Integer, String
-from datetime import datetime
+from sqlalchemy import (
+    Uuid,
+    ForeignKey,
+    TIMESTAMP,
+    func,
+    DECIMAL,
+    Enum,
+    Integer,
+    String,
+    Index,
+    Date,
+)
+from datetime import datetime, date
 from typing import TYPE_CHECKING
 from decimal import Decimal
 from app.core.base import Base
@@ -64,6 +75,8 @@ class OrderItemTopping(Base):
         nullable=False,
     )
 
+    __table_args__ = (Index("ix_order_item_topping_order_item_id", "order_item_id"),)
+
 
 class OrderItem(Base):
     __tablename__ = "order_item"
@@ -151,6 +164,8 @@ class OrderItem(Base):
         nullable=False,
     )
 
+    __table_args__ = (Index("ix_order_item_order_id", "order_id"),)
+
 
 class Order(Base):
     __tablename__ = "orders"
@@ -236,3 +251,78 @@ class Order(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    # (sort column, id) pairs back keyset pagination in OrderService
+    __table_args__ = (
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        Index("ix_orders_total_id", "total", "id"),
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_orders_order_status_created_at_id", "order_status", "created_at", "id"
+        ),
+    )
+
+
+class DailyOrderStats(Base):
+    """Per-day order counts and revenue for closed days, kept by the sales rollup."""
+
+    __tablename__ = "daily_order_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    order_status: Mapped[OrderStatus] = mapped_column(
+        Enum(OrderStatus), primary_key=True
+    )
+    payment_method: Mapped[PaymentMethod] = mapped_column(
+        Enum(PaymentMethod), primary_key=True
+    )
+    order_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[Decimal] = mapped_column(
+        DECIMAL(14, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class DailyPizzaSales(Base):
+    """Per-day quantity sold per pizza for closed days, kept by the sales rollup."""
+
+    __tablename__ = "daily_pizza_sales"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    pizza_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class SalesRollupWatermark(Base):
+    """
+    Single row: every day up to and including `day` is rolled up. Kept apart
+    from the rollup tables so it still advances over days without orders.
+    """
+
+    __tablename__ = "sales_rollup_watermark"
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=False, default=1
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
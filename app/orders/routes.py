@@ -8,6 +8,7 @@ from app.orders.schema import (
     OrderResponse,
     OrderUpdate,
     PaginatedOrderResponse,
+    CursorPaginatedOrderResponse,
     UserOrderQueryParams,
     AdminOrderQueryParams,
     OrderStatsQueryParams,
@@ -34,13 +35,28 @@ async def create_new_order(
     )
 
 
-@orders_router.get("/my-orders", response_model=list[OrderResponse])
+@orders_router.get(
+    "/my-orders",
+    response_model=list[OrderResponse] | CursorPaginatedOrderResponse,
+)
 async def get_my_orders(
     session: SessionDep,
     current_user: UserOrAdminDep,
     order_params: Annotated[UserOrderQueryParams, Query()],
 ):
-    """Get all orders for current user"""
+    """
+    Get all orders for current user.
+    Pass pagination=cursor (or a cursor) for keyset pagination.
+    """
+    if order_params.use_cursor:
+        return await OrderService(session=session).get_user_orders_by_cursor(
+            user_id=current_user.id,
+            limit=order_params.limit,
+            cursor=order_params.cursor,
+            include_total=order_params.include_total,
+            order_status=order_params.order_status,
+            payment_status=order_params.payment_status,
+        )
     return await OrderService(session=session).get_user_orders(
         user_id=current_user.id,
         page=order_params.page,
@@ -93,13 +109,29 @@ async def update_order_status(
     )
 
 
-@orders_router.get("/", response_model=PaginatedOrderResponse)
+@orders_router.get(
+    "/",
+    response_model=PaginatedOrderResponse | CursorPaginatedOrderResponse,
+)
 async def get_all_orders(
     session: SessionDep,
     _: AdminOnlyDep,
     order_params: Annotated[AdminOrderQueryParams, Query()],
 ):
-    """Get all orders (ADMIN route)"""
+    """
+    Get all orders (ADMIN route)
+    Pass pagination=cursor (or a cursor) for keyset pagination.
+    """
+    if order_params.use_cursor:
+        return await OrderService(session=session).get_all_orders_by_cursor(
+            limit=order_params.limit,
+            cursor=order_params.cursor,
+            include_total=order_params.include_total,
+            sort_by=order_params.sort_by,
+            order_status=order_params.order_status,
+            payment_status=order_params.payment_status,
+            payment_method=order_params.payment_method,
+        )
     return await OrderService(session=session).get_all_orders(
         page=order_params.page,
         limit=order_params.limit,
@@ -134,22 +166,10 @@ async def get_order_statistics(
     - Orders by status
     - Popular pizzas.
     """
-    order_service = OrderService(session)
-
-    totals = await order_service.get_order_stats(data.start_date, data.end_date)
-    status_breakdown = await order_service.get_orders_by_status(
-        data.start_date, data.end_date
-    )
-    top_pizzas = await order_service.get_top_selling_pizzas(
+    return await OrderService(session).get_stats_summary(
         data.start_date, data.end_date, data.limit
     )
 
-    return {
-        **totals,
-        "orders_by_status": status_breakdown,
-        "top_pizzas": top_pizzas,
-    }
-
 
 @orders_router.get("/stats/monthly-sales")
 async def get_monthly_sales(
@@ -1,4 +1,5 @@
 from pydantic import Field, computed_field
+from typing import Literal
 from uuid import UUID
 from datetime import datetime, date
 from decimal import Decimal
@@ -85,6 +86,22 @@ class PaginatedOrderResponse(BaseSchema):
         return self.page > 1
 
 
+class CursorPaginatedOrderResponse(BaseSchema):
+    limit: int = Field(ge=1, le=100, description="Items per page")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, null on the last page"
+    )
+    total: int | None = Field(
+        default=None, description="Total number of orders (only if includeTotal)"
+    )
+    items: list[OrderResponse] = Field(description="List of orders")
+
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
 class BaseOrderQueryParams(BaseSchema):
     page: int = Field(default=1, ge=1, description="Page number")
     limit: int = Field(default=10, ge=1, le=100, description="Items per page")
@@ -97,6 +114,22 @@ class BaseOrderQueryParams(BaseSchema):
     payment_method: PaymentMethod | None = Field(
         default=None, description="Filter by payment method"
     )
+    pagination: Literal["offset", "cursor"] = Field(
+        default="offset",
+        description="'offset' (page/limit) or 'cursor' (keyset, for deep paging)",
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="nextCursor from the previous page; implies cursor pagination",
+    )
+    include_total: bool = Field(
+        default=False,
+        description="Cursor pagination only: include a cached total count",
+    )
+
+    @property
+    def use_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
 
 
 class UserOrderQueryParams(BaseOrderQueryParams):
@@ -1,16 +1,43 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from decimal import Decimal
-from sqlalchemy import select, desc, and_, func, asc, text
+from sqlalchemy import (
+    select,
+    desc,
+    and_,
+    func,
+    asc,
+    tuple_,
+    Select,
+    delete,
+    insert,
+    update,
+    literal,
+    cast,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import (
+    insert as pg_insert,
+    aggregate_order_by,
+    JSON,
+)
 from sqlalchemy.orm import selectinload
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 import uuid
-import asyncio
 import math
-from app.orders.schema import OrderCreate
-from app.orders.utils import generate_order_num, format_address
-from app.menu.service import PizzaService, CrustService, SizeService
-from app.menu.model import Topping
-from app.orders.constants import TAX_RATE, DELIVERY_CHARGE
+from app.orders.schema import (
+    OrderCreate,
+    OrderResponse,
+    OrderItemResponse,
+    OrderItemToppingResponse,
+)
+from app.orders.utils import (
+    generate_order_num,
+    format_address,
+    encode_cursor,
+    decode_cursor,
+)
+from app.menu.service import PizzaService, CrustService, SizeService, ToppingService
+from app.cart.pricing import price_line, price_totals
 from app.orders.model import (
     Order,
     OrderItem,
@@ -18,12 +45,17 @@ from app.orders.model import (
     OrderStatus,
     PaymentStatus,
     PaymentMethod,
+    DailyOrderStats,
+    DailyPizzaSales,
+    SalesRollupWatermark,
 )
 from app.address.service import AddressesService
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.core.exceptions import (
+    InvalidCursorError,
     OrderNotFoundError,
     OrderCancelFailure,
-    ToppingNotFoundError,
     OrderStatusUpdateError,
 )
 from app.notifications.events import publish_order_event
@@ -37,6 +69,19 @@ ORDER_STATUS_MESSAGES = {
     OrderStatus.CANCELLED: "Your order has been cancelled.",
 }
 
+# Keyset sort columns and how to parse their cursor values back
+CURSOR_SORT_FIELDS = {
+    "created_at": datetime.fromisoformat,
+    "order_no": str,
+    "total": Decimal,
+}
+
+order_count_cache = LRUCache(maxsize=256, ttl=settings.ORDER_COUNT_CACHE_SECONDS)
+order_stats_cache = LRUCache(maxsize=64, ttl=settings.ORDER_STATS_CACHE_SECONDS)
+
+# advisory lock serializing rollup refreshes against incremental rollup updates
+SALES_ROLLUP_LOCK_ID = 618_442_201
+
 
 class OrderService:
     def __init__(
@@ -65,79 +110,78 @@ class OrderService:
             notes=data.notes,
             subtotal=Decimal("0.00"),
             tax=Decimal("0.00"),
-            delivery_charge=DELIVERY_CHARGE,
+            delivery_charge=Decimal("0.00"),
             total=Decimal("0.00"),
             payment_method=payment_method,
         )
 
         subtotal = Decimal("0.00")
+        item_rows: list[dict] = []
+        topping_rows: list[list[dict]] = []
 
-        pizza_service = PizzaService(self.session)
-        size_service = SizeService(self.session)
-        crust_service = CrustService(self.session)
-        for order_item_data in data.order_items:
-            pizza, size, crust = await asyncio.gather(
-                pizza_service.get_one(order_item_data.pizza_id, load_toppings=False),
-                size_service.get_one(order_item_data.size_id),
-                crust_service.get_one(order_item_data.crust_id),
-            )
+        # Resolve every referenced menu entity up front, one query per type
+        items = data.order_items
+        pizzas = await PizzaService(self.session).get_many(
+            item.pizza_id for item in items
+        )
+        sizes = await SizeService(self.session).get_many(
+            item.size_id for item in items
+        )
+        crusts = await CrustService(self.session).get_many(
+            item.crust_id for item in items
+        )
+        toppings_by_id = await ToppingService(self.session).get_many(
+            topping_id for item in items for topping_id in item.toppings_ids or []
+        )
 
-            toppings: list[Topping] = []
-            toppings_total = Decimal("0.00")
-
-            if order_item_data.toppings_ids:
-                toppings = list(
-                    (
-                        await self.session.scalars(
-                            select(Topping).where(
-                                Topping.id.in_(order_item_data.toppings_ids)
-                            )
-                        )
-                    ).all()
-                )
-                if len(toppings) != len(order_item_data.toppings_ids):
-                    found_ids = {t.id for t in toppings}
-                    missing_ids = set(order_item_data.toppings_ids) - found_ids
-                    raise ToppingNotFoundError(f"Toppings not found: {missing_ids}")
-
-                toppings_total = sum((t.price for t in toppings), Decimal("0.00"))
-            base_pizza_price = pizza.base_price
-            size_price = size.multiplier * base_pizza_price
-            crust_price = crust.additional_price
-            unit_price = size_price + crust_price + toppings_total
-            total_price = unit_price * order_item_data.quantity
-            subtotal += total_price
-
-            order_item = OrderItem(
-                pizza_id=pizza.id,
-                size_id=size.id,
-                crust_id=crust.id,
-                pizza_name=pizza.name,
-                size_name=size.name,
-                crust_name=crust.name,
-                size_price=size_price,
-                crust_price=crust_price,
-                base_pizza_price=base_pizza_price,
-                toppings_total_price=toppings_total,
-                unit_price=unit_price,
-                total_price=total_price,
-                quantity=order_item_data.quantity,
+        for order_item_data in items:
+            pizza = pizzas[order_item_data.pizza_id]
+            size = sizes[order_item_data.size_id]
+            crust = crusts[order_item_data.crust_id]
+            toppings = [
+                toppings_by_id[topping_id]
+                for topping_id in dict.fromkeys(order_item_data.toppings_ids or [])
+            ]
+            line = price_line(pizza, size, crust, toppings, order_item_data.quantity)
+            subtotal += line.total_price
+
+            item_rows.append(
+                {
+                    "pizza_id": pizza.id,
+                    "size_id": size.id,
+                    "crust_id": crust.id,
+                    "pizza_name": pizza.name,
+                    "size_name": size.name,
+                    "crust_name": crust.name,
+                    "size_price": line.size_price,
+                    "crust_price": line.crust_price,
+                    "base_pizza_price": line.base_pizza_price,
+                    "toppings_total_price": line.toppings_total_price,
+                    "unit_price": line.unit_price,
+                    "total_price": line.total_price,
+                    "quantity": order_item_data.quantity,
+                }
+            )
+            topping_rows.append(
+                [
+                    {
+                        "topping_id": topping.id,
+                        "topping_name": topping.name,
+                        "topping_price": topping.price,
+                    }
+                    for topping in toppings
+                ]
             )
 
-            for topping in toppings:
-                order_item_topping = OrderItemTopping(
-                    topping_id=topping.id,
-                    topping_name=topping.name,
-                    topping_price=topping.price,
-                )
-                order_item.toppings.append(order_item_topping)
-
-            order.order_items.append(order_item)
-        order.subtotal = subtotal
-        order.tax = subtotal * TAX_RATE
-        order.total = subtotal + order.tax + DELIVERY_CHARGE
+        totals = price_totals(subtotal)
+        order.subtotal = totals.subtotal
+        order.tax = totals.tax
+        order.delivery_charge = totals.delivery_charge
+        order.total = totals.total
 
         self.session.add(order)
+        await self.session.flush()
+        order_items = await self._insert_order_items(order.id, item_rows, topping_rows)
         await self.session.commit()
 
         await publish_order_event(
@@ -152,8 +196,76 @@ class OrderService:
             ),
         )
 
-        loaded_order = await self.load_order(order.id)
-        return loaded_order
+        # Built from what was just written, no need to re-select the graph
+        return OrderResponse(
+            id=order.id,
+            order_no=order.order_no,
+            order_items=order_items,
+            user_id=order.user_id,
+            order_status=order.order_status,
+            payment_status=order.payment_status,
+            payment_method=order.payment_method,
+            subtotal=order.subtotal,
+            tax=order.tax,
+            delivery_charge=order.delivery_charge,
+            total=order.total,
+            delivery_address=order.delivery_address,
+            notes=order.notes,
+            created_at=order.created_at,
+            updated_at=order.updated_at,
+        )
+
+    async def _insert_order_items(
+        self,
+        order_id: uuid.UUID,
+        item_rows: list[dict],
+        topping_rows: list[list[dict]],
+    ) -> list[OrderItemResponse]:
+        """
+        Write order items and their topping snapshots with one multi-row
+        INSERT ... RETURNING per table. `topping_rows[i]` belongs to `item_rows[i]`.
+        """
+        if not item_rows:
+            return []
+
+        item_ids = (
+            await self.session.scalars(
+                insert(OrderItem).returning(
+                    OrderItem.id, sort_by_parameter_order=True
+                ),
+                [{**row, "order_id": order_id} for row in item_rows],
+            )
+        ).all()
+
+        item_toppings = [
+            [{**row, "order_item_id": item_id} for row in rows]
+            for item_id, rows in zip(item_ids, topping_rows)
+        ]
+        flat_toppings = [row for rows in item_toppings for row in rows]
+        topping_ids = iter(
+            (
+                await self.session.scalars(
+                    insert(OrderItemTopping).returning(
+                        OrderItemTopping.id, sort_by_parameter_order=True
+                    ),
+                    flat_toppings,
+                )
+            ).all()
+            if flat_toppings
+            else []
+        )
+
+        return [
+            OrderItemResponse(
+                id=item_id,
+                toppings=[
+                    OrderItemToppingResponse(id=next(topping_ids), **topping)
+                    for topping in toppings
+                ],
+                **row,
+            )
+            for item_id, row, toppings in zip(item_ids, item_rows, item_toppings)
+        ]
 
     async def get_user_orders(
         self,
@@ -177,6 +289,27 @@ class OrderService:
         result = await self.session.scalars(stmt)
         return result.all()
 
+    async def get_user_orders_by_cursor(
+        self,
+        user_id: uuid.UUID,
+        limit: int = 10,
+        cursor: str | None = None,
+        include_total: bool = False,
+        order_status: OrderStatus | None = None,
+        payment_status: PaymentStatus | None = None,
+    ):
+        base_query, count_query = self._build_queries(order_status, payment_status)
+        return await self._paginate_by_cursor(
+            base_query.where(Order.user_id == user_id),
+            count_query.where(Order.user_id == user_id),
+            count_key=("user", user_id, order_status, payment_status),
+            field="created_at",
+            order="desc",
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
     async def get_user_order(
         self,
         user_id: uuid.UUID,
@@ -217,7 +350,9 @@ class OrderService:
             raise OrderCancelFailure(
                 message="Cannot cancel paid order. Please request refund."
             )
+        old_status = order.order_status
         order.order_status = OrderStatus.CANCELLED
+        await SalesRollupService(self.session).apply_status_change(order, old_status)
         await self.session.commit()
         await self.session.refresh(order)
 
@@ -276,6 +411,106 @@ class OrderService:
             "pages": math.ceil(total / limit) if total else 0,
         }
 
+    async def get_all_orders_by_cursor(
+        self,
+        limit: int = 10,
+        cursor: str | None = None,
+        include_total: bool = False,
+        sort_by: str = "created_at:desc",
+        order_status: OrderStatus | None = None,
+        payment_status: PaymentStatus | None = None,
+        payment_method: PaymentMethod | None = None,
+    ):
+        base_query, count_query = self._build_queries(
+            order_status=order_status,
+            payment_status=payment_status,
+            payment_method=payment_method,
+        )
+        field, order = self._parse_sort_params(sort_by)
+        return await self._paginate_by_cursor(
+            base_query,
+            count_query,
+            count_key=("all", order_status, payment_status, payment_method),
+            field=field,
+            order=order.lower(),
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+    async def _paginate_by_cursor(
+        self,
+        base_query: Select,
+        count_query: Select,
+        count_key: tuple,
+        field: str,
+        order: str,
+        limit: int,
+        cursor: str | None,
+        include_total: bool,
+    ):
+        """
+        Keyset pagination over (field, id), so deep pages cost the same as the first.
+        Backed by the composite (field, id) indexes on orders.
+        """
+        sort_column = getattr(Order, field)
+        key = tuple_(sort_column, Order.id)
+
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("f") != field or payload.get("d") != order:
+                raise InvalidCursorError(message="Cursor does not match sort order")
+            try:
+                last_value = CURSOR_SORT_FIELDS[field](payload["v"])
+                last_id = uuid.UUID(payload["id"])
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                raise InvalidCursorError()
+            base_query = base_query.where(
+                key < tuple_(last_value, last_id)
+                if order == "desc"
+                else key > tuple_(last_value, last_id)
+            )
+
+        direction = desc if order == "desc" else asc
+        rows = (
+            await self.session.scalars(
+                base_query.options(
+                    selectinload(Order.order_items).selectinload(OrderItem.toppings),
+                )
+                .order_by(direction(sort_column), direction(Order.id))
+                .limit(limit + 1)
+            )
+        ).all()
+
+        items = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                {
+                    "f": field,
+                    "d": order,
+                    "v": getattr(last, field).isoformat()
+                    if field == "created_at"
+                    else str(getattr(last, field)),
+                    "id": str(last.id),
+                }
+            )
+
+        total = None
+        if include_total:
+            total = order_count_cache.get(count_key)
+            if total is None:
+                total = await self.session.scalar(count_query)
+                order_count_cache.set(count_key, total)
+
+        return {
+            "items": items,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+
     async def update_order_status(self, order_id: uuid.UUID, order_status: OrderStatus):
         order = await self.session.scalar(select(Order).where(Order.id == order_id))
         if not order:
@@ -292,7 +527,9 @@ class OrderService:
                 f"Cannot transition from {order.order_status.value} to {order_status.value}"
             )
 
+        old_status = order.order_status
         order.order_status = order_status
+        await SalesRollupService(self.session).apply_status_change(order, old_status)
         await self.session.commit()
 
         status_message = ORDER_STATUS_MESSAGES.get(
@@ -355,65 +592,329 @@ class OrderService:
         except ValueError:
             return "created_at", "desc"
 
-    async def get_order_stats(self, start_date: date, end_date: date):
-        end_date = end_date + timedelta(days=1)
-        total_orders = await self.session.scalar(
-            select(func.count(Order.id)).where(
-                Order.created_at >= start_date, Order.created_at < end_date
-            )
+    async def get_stats_summary(
+        self, start_date: date, end_date: date, limit: int | None = None
+    ):
+        """
+        Totals, status breakdown and top pizzas in a single statement.
+
+        Reads the rollup up to the watermark and the raw orders after it, with
+        the watermark lookup and all aggregates folded into CTEs so the dashboard
+        costs one round trip. Results are cached briefly per (start_date, end_date, limit).
+        """
+        cache_key = (start_date, end_date, limit)
+        cached = order_stats_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        watermark = select(SalesRollupWatermark.day).scalar_subquery()
+        # LEAST/GREATEST ignore NULLs, so no watermark yet means "scan everything raw"
+        rollup_end = func.least(end_date, watermark)
+        raw_start = func.greatest(start_date, watermark + 1)
+        in_rollup = DailyOrderStats.day.between(start_date, rollup_end)
+        in_raw = and_(
+            Order.created_at >= raw_start,
+            Order.created_at < end_date + timedelta(days=1),
         )
 
-        total_sales = await self.session.scalar(
-            select(func.coalesce(func.sum(Order.total), 0)).where(
-                Order.created_at >= start_date, Order.created_at < end_date
+        status_rows = union_all(
+            select(
+                DailyOrderStats.order_status,
+                DailyOrderStats.order_count,
+                DailyOrderStats.revenue,
+            ).where(in_rollup),
+            select(
+                Order.order_status,
+                func.count(Order.id),
+                func.sum(Order.total),
             )
+            .where(in_raw)
+            .group_by(Order.order_status),
+        ).subquery("status_rows")
+        status_totals = (
+            select(
+                status_rows.c.order_status,
+                func.sum(status_rows.c.order_count).label("order_count"),
+                func.sum(status_rows.c.revenue).label("revenue"),
+            )
+            .group_by(status_rows.c.order_status)
+            .cte("status_totals")
         )
 
-        return {
-            "total_orders": total_orders,
-            "total_sales": total_sales,
-        }
-
-    async def get_orders_by_status(self, start_date: date, end_date: date):
-        end_date = end_date + timedelta(days=1)
-        result = await self.session.execute(
-            select(Order.order_status, func.count(Order.id))
-            .where(Order.created_at >= start_date, Order.created_at < end_date)
-            .group_by(Order.order_status)
-        )
-
-        return {status.value: count for status, count in result.all()}
-
-    async def get_top_selling_pizzas(
-        self, start_date: date, end_date: date, limit: int | None = None
-    ):
-        end_date = end_date + timedelta(days=1)
-        result = await self.session.execute(
+        pizza_rows = union_all(
+            select(DailyPizzaSales.pizza_name, DailyPizzaSales.quantity).where(
+                DailyPizzaSales.day.between(start_date, rollup_end)
+            ),
             select(OrderItem.pizza_name, func.sum(OrderItem.quantity))
             .join(OrderItem.order)
-            .where(Order.created_at >= start_date, Order.created_at < end_date)
-            .group_by(OrderItem.pizza_name)
-            .order_by(func.sum(OrderItem.quantity).desc())
+            .where(in_raw)
+            .group_by(OrderItem.pizza_name),
+        ).subquery("pizza_rows")
+        sold = func.sum(pizza_rows.c.quantity)
+        top_pizzas = (
+            select(pizza_rows.c.pizza_name, sold.label("sold"))
+            .group_by(pizza_rows.c.pizza_name)
+            .order_by(desc(sold), pizza_rows.c.pizza_name)
             .limit(limit)
+            .subquery("top_pizzas")
         )
 
-        return [{"name": name, "sold": sold} for name, sold in result.all()]
+        stmt = select(
+            select(func.coalesce(func.sum(status_totals.c.order_count), 0))
+            .scalar_subquery()
+            .label("total_orders"),
+            select(func.coalesce(func.sum(status_totals.c.revenue), 0))
+            .scalar_subquery()
+            .label("total_sales"),
+            select(
+                func.json_object_agg(
+                    status_totals.c.order_status,
+                    status_totals.c.order_count,
+                    type_=JSON,
+                )
+            )
+            .where(status_totals.c.order_count > 0)
+            .scalar_subquery()
+            .label("orders_by_status"),
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "name", top_pizzas.c.pizza_name, "sold", top_pizzas.c.sold
+                        ),
+                        desc(top_pizzas.c.sold),
+                        top_pizzas.c.pizza_name,
+                    ),
+                    type_=JSON,
+                )
+            )
+            .scalar_subquery()
+            .label("top_pizzas"),
+        )
+        row = (await self.session.execute(stmt)).one()
+
+        summary = {
+            "total_orders": row.total_orders,
+            "total_sales": row.total_sales,
+            # enum columns come back as member names, the API exposes values
+            "orders_by_status": {
+                OrderStatus[status].value: count
+                for status, count in (row.orders_by_status or {}).items()
+            },
+            "top_pizzas": row.top_pizzas or [],
+        }
+        order_stats_cache.set(cache_key, summary)
+        return summary
 
     async def get_monthly_sales(self, months_count: int = 6):
-        month_trunc = func.date_trunc("month", Order.created_at)
-        stmt = (
-            select(
-                func.to_char(month_trunc, "YYYY-MM").label("month"),
-                func.count(Order.id).label("total_orders"),
-                func.sum(Order.total).label("revenue"),
+        rollup = SalesRollupService(self.session)
+        today = await self.session.scalar(select(func.current_date()))
+        month_index = today.year * 12 + today.month - 1 - (months_count - 1)
+        first_month = date(month_index // 12, month_index % 12 + 1, 1)
+
+        rollup_range, raw_start = await rollup.split_range(first_month, today)
+
+        months: dict[str, dict] = {}
+
+        def add(month: str, total_orders: int, revenue: Decimal):
+            entry = months.setdefault(
+                month, {"month": month, "total_orders": 0, "revenue": Decimal("0")}
+            )
+            entry["total_orders"] += total_orders
+            entry["revenue"] += revenue
+
+        if rollup_range:
+            month_trunc = func.date_trunc("month", DailyOrderStats.day)
+            result = await self.session.execute(
+                select(
+                    func.to_char(month_trunc, "YYYY-MM"),
+                    func.sum(DailyOrderStats.order_count),
+                    func.sum(DailyOrderStats.revenue),
+                )
+                .where(DailyOrderStats.day.between(*rollup_range))
+                .group_by(month_trunc)
+            )
+            for month, total_orders, revenue in result.all():
+                add(month, total_orders, revenue)
+
+        if raw_start:
+            month_trunc = func.date_trunc("month", Order.created_at)
+            result = await self.session.execute(
+                select(
+                    func.to_char(month_trunc, "YYYY-MM"),
+                    func.count(Order.id),
+                    func.sum(Order.total),
+                )
+                .where(Order.created_at >= raw_start)
+                .group_by(month_trunc)
+            )
+            for month, total_orders, revenue in result.all():
+                add(month, total_orders, revenue)
+
+        return [months[month] for month in sorted(months)]
+
+
+class SalesRollupService:
+    """
+    Maintains daily_order_stats / daily_pizza_sales for closed days (before today).
+
+    sales_rollup_watermark records the last rolled-up day: stats read the rollup
+    up to it and scan the raw orders table only for the days after it.
+
+    refresh() rewrites whole days while apply_status_change() adjusts single
+    rows, so the two exclude each other through SALES_ROLLUP_LOCK_ID: refresh
+    takes it exclusively, status changes take it shared (they don't block each
+    other).
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ):
+        self.session = session
+
+    async def get_watermark(self) -> date | None:
+        return await self.session.scalar(select(SalesRollupWatermark.day))
+
+    async def _lock(self, shared: bool = False):
+        # transaction-scoped, released on commit/rollback
+        lock = (
+            func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+        )
+        await self.session.execute(select(lock(SALES_ROLLUP_LOCK_ID)))
+
+    async def split_range(
+        self, start_date: date, end_date: date
+    ) -> tuple[tuple[date, date] | None, date | None]:
+        """Split [start_date, end_date] into a rollup day range and a raw-scan start date."""
+        watermark = await self.get_watermark()
+        if watermark is None or watermark < start_date:
+            return None, start_date
+
+        rollup_end = min(end_date, watermark)
+        raw_start = rollup_end + timedelta(days=1)
+        return (start_date, rollup_end), raw_start if raw_start <= end_date else None
+
+    async def refresh(
+        self, lookback_days: int = settings.SALES_ROLLUP_LOOKBACK_DAYS
+    ) -> tuple[date, date] | None:
+        """
+        Recompute every closed day from the watermark (or the last `lookback_days`)
+        up to yesterday. Idempotent, safe to run on a schedule.
+        """
+        # waits for in-flight status changes to commit, so they're in the scan
+        await self._lock()
+        today = await self.session.scalar(select(func.current_date()))
+        end = today - timedelta(days=1)
+        start = today - timedelta(days=lookback_days)
+
+        watermark = await self.get_watermark()
+        if watermark is None:
+            first_day = await self.session.scalar(
+                select(func.min(func.date(Order.created_at)))
             )
+            if first_day is None:
+                return None
+            start = first_day
+        else:
+            start = min(start, watermark + timedelta(days=1))
+
+        if start > end:
+            return None
+
+        day = func.date(Order.created_at)
+        in_range = and_(
+            Order.created_at >= start,
+            Order.created_at < end + timedelta(days=1),
+        )
+
+        await self.session.execute(
+            delete(DailyOrderStats).where(DailyOrderStats.day.between(start, end))
+        )
+        await self.session.execute(
+            delete(DailyPizzaSales).where(DailyPizzaSales.day.between(start, end))
+        )
+        await self.session.execute(
+            insert(DailyOrderStats).from_select(
+                ["day", "order_status", "payment_method", "order_count", "revenue"],
+                select(
+                    day,
+                    Order.order_status,
+                    Order.payment_method,
+                    func.count(Order.id),
+                    func.coalesce(func.sum(Order.total), 0),
+                )
+                .where(in_range)
+                .group_by(day, Order.order_status, Order.payment_method),
+            )
+        )
+        await self.session.execute(
+            insert(DailyPizzaSales).from_select(
+                ["day", "pizza_name", "quantity"],
+                select(day, OrderItem.pizza_name, func.sum(OrderItem.quantity))
+                .join(OrderItem.order)
+                .where(in_range)
+                .group_by(day, OrderItem.pizza_name),
+            )
+        )
+        stmt = pg_insert(SalesRollupWatermark).values(id=1, day=end)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={"day": stmt.excluded.day, "updated_at": func.now()},
+            )
+        )
+        await self.session.commit()
+        return start, end
+
+    async def apply_status_change(self, order: Order, old_status: OrderStatus):
+        """
+        Move an order between status buckets if its day is already rolled up.
+        Runs in the caller's transaction; days after the watermark need nothing.
+        """
+        if old_status == order.order_status:
+            return
+
+        # held until the caller commits; keeps a refresh from recounting this
+        # order's day while the change is in flight
+        await self._lock(shared=True)
+
+        order_day = (
+            select(func.date(Order.created_at))
+            .where(Order.id == order.id)
+            .scalar_subquery()
+        )
+        watermark = select(SalesRollupWatermark.day).scalar_subquery()
+
+        await self.session.execute(
+            update(DailyOrderStats)
             .where(
-                Order.created_at
-                >= func.date_trunc("month", func.now())
-                - text(f"INTERVAL '{months_count - 1} months'")
+                DailyOrderStats.day == order_day,
+                DailyOrderStats.order_status == old_status,
+                DailyOrderStats.payment_method == order.payment_method,
+            )
+            .values(
+                order_count=DailyOrderStats.order_count - 1,
+                revenue=DailyOrderStats.revenue - order.total,
+            )
+        )
+
+        stmt = pg_insert(DailyOrderStats).from_select(
+            ["day", "order_status", "payment_method", "order_count", "revenue"],
+            select(
+                order_day,
+                cast(order.order_status, DailyOrderStats.order_status.type),
+                cast(order.payment_method, DailyOrderStats.payment_method.type),
+                literal(1),
+                cast(order.total, DailyOrderStats.revenue.type),
+            ).where(order_day <= watermark),
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["day", "order_status", "payment_method"],
+                set_={
+                    "order_count": DailyOrderStats.order_count + 1,
+                    "revenue": DailyOrderStats.revenue + stmt.excluded.revenue,
+                },
             )
-            .group_by(month_trunc)
-            .order_by(month_trunc)
         )
-        result = await self.session.execute(stmt)
-        return result.mappings().all()
@@ -1,5 +1,9 @@
 import uuid
+import json
+import base64
+import binascii
 from app.address.model import Address
+from app.core.exceptions import InvalidCursorError
 
 
 def generate_order_num() -> str:
@@ -12,3 +16,19 @@ def format_address(address: Address) -> str:
         f"{address.street}, {address.city}, {address.state}, "
         f"{address.postal_code}, {address.country}"
     )
+
+
+def encode_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise InvalidCursorError()
+    if not isinstance(payload, dict):
+        raise InvalidCursorError()
+    return payload
@@ -1,5 +1,15 @@
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import Uuid, TIMESTAMP, func, Enum, String, ForeignKey, DECIMAL, JSON
+from sqlalchemy import (
+    Uuid,
+    TIMESTAMP,
+    func,
+    Enum,
+    String,
+    ForeignKey,
+    DECIMAL,
+    JSON,
+    Index,
+)
 from datetime import datetime
 from decimal import Decimal
 import uuid
@@ -102,3 +112,5 @@ class Payment(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (Index("ix_payments_order_id", "order_id"),)
@@ -11,6 +11,7 @@ from app.core.exceptions import (
 )
 from app.payments.model import Payment, PaymentProvider, PaymentTransactionStatus
 from app.orders.model import OrderStatus, PaymentStatus
+from app.orders.service import SalesRollupService
 from app.notifications.events import publish_payment_event
 from app.notifications.schema import PaymentEventData
 from app.utils.logger import logger
@@ -152,8 +153,10 @@ class PaymentService:
         )
         if not order:
             raise OrderNotFoundError()
+        old_status = order.order_status
         order.payment_status = PaymentStatus.PAID
         order.order_status = OrderStatus.CONFIRMED
+        await SalesRollupService(self.session).apply_status_change(order, old_status)
 
         await self.session.commit()
         await self.session.refresh(payment)
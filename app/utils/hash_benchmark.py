@@ -0,0 +1,35 @@
+import time
+import statistics
+from app.core.config import settings
+from app.auth.utils import pwd_context
+
+PASSWORD = "correct-horse-battery-staple"
+
+
+def bench(label: str, fn, runs: int):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    print(
+        f"{label:<8} median {statistics.median(timings):7.1f}ms"
+        f"  max {max(timings):7.1f}ms  ({runs} runs)"
+    )
+
+
+def run_benchmark(runs: int = 10):
+    """CPU cost of one login (verify) and one signup/reset (hash) with the current settings."""
+    print(
+        f"scheme={settings.PASSWORD_HASH_SCHEME} bcrypt_rounds={settings.BCRYPT_ROUNDS} "
+        f"argon2_t={settings.ARGON2_TIME_COST} argon2_m={settings.ARGON2_MEMORY_COST_KIB}KiB "
+        f"argon2_p={settings.ARGON2_PARALLELISM}"
+    )
+    hashed = pwd_context.hash(PASSWORD)
+    bench("hash", lambda: pwd_context.hash(PASSWORD), runs)
+    bench("verify", lambda: pwd_context.verify(PASSWORD, hashed), runs)
+
+
+if __name__ == "__main__":
+    run_benchmark()
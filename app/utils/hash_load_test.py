@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+import httpx
+from app.core.config import settings
+
+
+def percentiles(timings: list[float]) -> str:
+    if len(timings) < 2:
+        return "not enough samples"
+    cuts = statistics.quantiles(timings, n=100)
+    return (
+        f"p50 {cuts[49]:7.1f}ms  p99 {cuts[98]:7.1f}ms"
+        f"  max {max(timings):7.1f}ms  ({len(timings)} requests)"
+    )
+
+
+async def probe(client: httpx.AsyncClient, path: str, stop: asyncio.Event):
+    """Latency of an endpoint that never hashes, requested back to back."""
+    timings = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+    return timings
+
+
+async def measure_probe(client: httpx.AsyncClient, path: str, seconds: float):
+    stop = asyncio.Event()
+    task = asyncio.create_task(probe(client, path, stop))
+    await asyncio.sleep(seconds)
+    stop.set()
+    return await task
+
+
+async def login_burst(
+    client: httpx.AsyncClient, email: str, password: str, logins: int, concurrency: int
+) -> Counter:
+    statuses = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login():
+        async with semaphore:
+            response = await client.post(
+                f"{settings.API_V1_STR}/auth/login",
+                json={"email": email, "password": password},
+            )
+            statuses[response.status_code] += 1
+
+    await asyncio.gather(*(login() for _ in range(logins)))
+    return statuses
+
+
+async def run_load_test(
+    base_url: str,
+    email: str,
+    password: str,
+    logins: int,
+    concurrency: int,
+    probe_path: str,
+):
+    """
+    p99 of an unrelated endpoint on its own, then during a burst of logins.
+    With hashing off the event loop the two should stay close; a burst past
+    PASSWORD_HASH_MAX_PENDING shows up as 503s, not as probe latency.
+    """
+    print(
+        f"workers={settings.PASSWORD_HASH_WORKERS} "
+        f"max_pending={settings.PASSWORD_HASH_MAX_PENDING} "
+        f"logins={logins} concurrency={concurrency} probe={probe_path}"
+    )
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        baseline = await measure_probe(client, probe_path, seconds=3)
+        print(f"idle     {percentiles(baseline)}")
+
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(probe(client, probe_path, stop))
+        started = time.perf_counter()
+        statuses = await login_burst(client, email, password, logins, concurrency)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        print(f"burst    {percentiles(await probe_task)}")
+
+    print(
+        f"logins   {dict(statuses)} in {elapsed:.1f}s "
+        f"({logins / elapsed:.1f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Event-loop latency of a running API during a login burst"
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probe-path", default="/internal/metrics")
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_load_test(
+            args.base_url,
+            args.email,
+            args.password,
+            args.logins,
+            args.concurrency,
+            args.probe_path,
+        )
+    )
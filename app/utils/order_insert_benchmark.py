@@ -0,0 +1,141 @@
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+from sqlalchemy import select
+from app.address.model import Address
+from app.cart.pricing import price_line
+from app.core.database import async_session, engine
+from app.menu.model import Crust, Pizza, Size, Topping
+from app.orders.model import Order, OrderItem, OrderItemTopping
+from app.orders.service import OrderService
+from app.orders.utils import format_address, generate_order_num
+
+LINE_COUNTS = (1, 10, 50)
+TOPPINGS_PER_LINE = 3
+
+
+def new_order(address: Address) -> Order:
+    return Order(
+        order_no=generate_order_num(),
+        user_id=address.user_id,
+        address_id=address.id,
+        delivery_address=format_address(address),
+        subtotal=Decimal("0.00"),
+        tax=Decimal("0.00"),
+        delivery_charge=Decimal("0.00"),
+        total=Decimal("0.00"),
+    )
+
+
+def build_lines(menu: dict, lines: int) -> tuple[list[dict], list[list[dict]]]:
+    """Item and topping snapshot rows shaped like create_order builds them."""
+    pizza, size, crust, toppings = (
+        menu["pizza"],
+        menu["size"],
+        menu["crust"],
+        menu["toppings"],
+    )
+    line = price_line(pizza, size, crust, toppings, 1)
+    item_row = {
+        "pizza_id": pizza.id,
+        "size_id": size.id,
+        "crust_id": crust.id,
+        "pizza_name": pizza.name,
+        "size_name": size.name,
+        "crust_name": crust.name,
+        "size_price": line.size_price,
+        "crust_price": line.crust_price,
+        "base_pizza_price": line.base_pizza_price,
+        "toppings_total_price": line.toppings_total_price,
+        "unit_price": line.unit_price,
+        "total_price": line.total_price,
+        "quantity": 1,
+    }
+    topping_rows = [
+        {
+            "topping_id": topping.id,
+            "topping_name": topping.name,
+            "topping_price": topping.price,
+        }
+        for topping in toppings
+    ]
+    return [item_row] * lines, [topping_rows] * lines
+
+
+async def orm_path(session, address, item_rows, topping_rows):
+    """The previous path: ORM objects flushed by the unit of work, then a reload."""
+    order = new_order(address)
+    for row, toppings in zip(item_rows, topping_rows):
+        order_item = OrderItem(**row)
+        order_item.toppings.extend(OrderItemTopping(**t) for t in toppings)
+        order.order_items.append(order_item)
+    session.add(order)
+    await session.flush()
+    session.expunge_all()
+    await OrderService(session).load_order(order.id)
+
+
+async def bulk_path(session, address, item_rows, topping_rows):
+    """The current path: multi-row INSERT ... RETURNING, response built in memory."""
+    order = new_order(address)
+    session.add(order)
+    await session.flush()
+    await OrderService(session)._insert_order_items(order.id, item_rows, topping_rows)
+
+
+async def bench(label: str, path, menu: dict, lines: int, runs: int):
+    item_rows, topping_rows = build_lines(menu, lines)
+    timings = []
+    # run 0 is a warm-up, so connection setup isn't measured
+    for run in range(runs + 1):
+        # each run in its own transaction, rolled back so nothing is kept
+        async with async_session() as session:
+            address = await session.get(Address, menu["address_id"])
+            started = time.perf_counter()
+            await path(session, address, item_rows, topping_rows)
+            if run:
+                timings.append((time.perf_counter() - started) * 1000)
+            await session.rollback()
+
+    print(
+        f"{label:<5} {lines:>3} lines  median {statistics.median(timings):7.2f}ms"
+        f"  max {max(timings):7.2f}ms  ({runs} runs)"
+    )
+
+
+async def load_menu() -> dict:
+    async with async_session() as session:
+        address = await session.scalar(select(Address).limit(1))
+        pizza = await session.scalar(select(Pizza).limit(1))
+        size = await session.scalar(select(Size).limit(1))
+        crust = await session.scalar(select(Crust).limit(1))
+        toppings = (
+            await session.scalars(select(Topping).limit(TOPPINGS_PER_LINE))
+        ).all()
+
+    if not all((address, pizza, size, crust)):
+        raise SystemExit("Needs at least one address, pizza, size and crust")
+    return {
+        "address_id": address.id,
+        "pizza": pizza,
+        "size": size,
+        "crust": crust,
+        "toppings": list(toppings),
+    }
+
+
+async def run_benchmark(runs: int = 20):
+    """Order item writes, ORM unit of work + reload vs bulk INSERT ... RETURNING."""
+    try:
+        menu = await load_menu()
+        print(f"{TOPPINGS_PER_LINE} toppings per line, runs rolled back")
+        for lines in LINE_COUNTS:
+            await bench("orm", orm_path, menu, lines, runs)
+            await bench("bulk", bulk_path, menu, lines, runs)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,34 @@
+import redis.asyncio as redis
+from asgiref.sync import async_to_sync
+from app.cart.service import RedisCartService
+from app.cart.store import RedisCartStore
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.redis import create_redis_pool
+from app.core.database import async_session, engine
+from app.utils.logger import logger
+
+
+async def flush_idle_carts():
+    if settings.CART_BACKEND != "redis":
+        return 0
+
+    # connections are bound to this task's event loop
+    client = redis.Redis.from_pool(create_redis_pool(max_connections=4))
+    try:
+        async with async_session() as session:
+            flushed = await RedisCartService(
+                session, store=RedisCartStore(client)
+            ).flush_idle_carts()
+    finally:
+        await client.aclose()
+        await engine.dispose()
+
+    if flushed:
+        logger.info(f"Flushed {flushed} idle carts to postgres")
+    return flushed
+
+
+@celery_app.task()
+def flush_idle_carts_task():
+    return async_to_sync(flush_idle_carts)()
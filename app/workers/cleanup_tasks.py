@@ -0,0 +1,34 @@
+import time
+from asgiref.sync import async_to_sync
+from app.cart.service import DatabaseCartService
+from app.core.celery_app import celery_app
+from app.core.database import async_session, engine
+from app.notifications.service import NotificationService
+from app.utils.logger import logger
+
+
+async def purge_stale_rows():
+    started = time.perf_counter()
+    try:
+        async with async_session() as session:
+            guest_carts = await DatabaseCartService(session).purge_guest_carts()
+            notifications = await NotificationService(session).purge_expired()
+    finally:
+        # connections are bound to this task's event loop
+        await engine.dispose()
+
+    stats = {
+        "guest_carts": guest_carts,
+        "notifications": notifications,
+        "duration_ms": round((time.perf_counter() - started) * 1000),
+    }
+    logger.info(
+        f"Cleanup purged {guest_carts} guest carts and {notifications} expired "
+        f"notifications in {stats['duration_ms']}ms"
+    )
+    return stats
+
+
+@celery_app.task()
+def purge_stale_rows_task():
+    return async_to_sync(purge_stale_rows)()
@@ -0,0 +1,23 @@
+from asgiref.sync import async_to_sync
+from app.core.celery_app import celery_app
+from app.core.database import async_session, engine
+from app.orders.service import SalesRollupService
+from app.utils.logger import logger
+
+
+async def refresh_sales_rollup():
+    try:
+        async with async_session() as session:
+            refreshed = await SalesRollupService(session).refresh()
+    finally:
+        # connections are bound to this task's event loop
+        await engine.dispose()
+
+    if refreshed:
+        logger.info(f"Sales rollup refreshed for {refreshed[0]} .. {refreshed[1]}")
+    return [day.isoformat() for day in refreshed] if refreshed else None
+
+
+@celery_app.task()
+def refresh_sales_rollup_task():
+    return async_to_sync(refresh_sales_rollup)()
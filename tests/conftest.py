@@ -0,0 +1,28 @@
+import asyncio
+import os
+import pytest
+
+# Runs against a real Postgres: planner behaviour is what's under test. Point
+# TEST_DATABASE_URL at a throwaway database; its tables are created and
+# dropped by the run. The rest of the app settings come from the usual env.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+if not TEST_DATABASE_URL:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(scope="session")
+def db_url() -> str:
+    return TEST_DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def seeded_db(db_url):
+    """Schema from the models (indexes included) plus seeded rows, ANALYZEd."""
+    from tests.seed import create_schema, drop_schema, seed
+
+    asyncio.run(create_schema(db_url))
+    try:
+        yield asyncio.run(seed(db_url))
+    finally:
+        asyncio.run(drop_schema(db_url))
@@ -0,0 +1,165 @@
+import uuid
+from decimal import Decimal
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.address.model import Address
+from app.auth.model import User
+from app.cart.model import Cart, CartItem
+from app.core.base import Base
+from app.menu.model import (
+    Crust,
+    Pizza,
+    PizzaCategory,
+    Size,
+    Topping,
+    ToppingCategory,
+)
+from app.notifications.model import Notification, NotificationType
+from app.orders.model import Order, OrderItem, OrderItemTopping, OrderStatus
+from app.orders.utils import format_address, generate_order_num
+
+# registers the payments tables on Base.metadata, orders reference them
+from app.payments import model as payments_models  # noqa: F401
+
+USERS = 20
+ORDERS_PER_USER = 10
+NOTIFICATIONS_PER_USER = 20
+
+
+def create_engine(db_url: str) -> AsyncEngine:
+    # every test runs its own event loop, so connections can't be pooled
+    return create_async_engine(db_url, poolclass=NullPool)
+
+
+async def create_schema(db_url: str):
+    engine = create_engine(db_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+async def drop_schema(db_url: str):
+    engine = create_engine(db_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def seed(db_url: str) -> list[uuid.UUID]:
+    """Users with an address, a cart, orders and notifications; returns user ids."""
+    engine = create_engine(db_url)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        pizza = Pizza(
+            name="Margherita",
+            description="Tomato, mozzarella, basil",
+            base_price=Decimal("8.00"),
+            category=PizzaCategory.VEG,
+        )
+        size = Size(name="medium", display_name="Medium")
+        crust = Crust(name="thin")
+        toppings = [
+            Topping(
+                name=f"topping-{i}",
+                price=Decimal("1.00"),
+                category=ToppingCategory.VEGETABLE,
+            )
+            for i in range(3)
+        ]
+        session.add_all([pizza, size, crust, *toppings])
+
+        user_ids = []
+        for u in range(USERS):
+            user = User(
+                email=f"user{u}@example.com",
+                password_hash="x",
+                first_name="Test",
+                last_name=f"User{u}",
+            )
+            address = Address(
+                full_name="Test User",
+                phone_number="0000000000",
+                street="1 Main St",
+                city="City",
+                state="State",
+                postal_code="00000",
+                country="Country",
+                user=user,
+            )
+            session.add_all([user, address])
+            await session.flush()
+            user_ids.append(user.id)
+
+            cart = Cart(user_id=user.id)
+            cart.cart_items = [
+                CartItem(
+                    quantity=1,
+                    total=Decimal("10.00"),
+                    pizza=pizza,
+                    size=size,
+                    crust=crust,
+                    toppings=toppings[:2],
+                    fingerprint=f"{user.id}-{i}",
+                )
+                for i in range(2)
+            ]
+            session.add(cart)
+
+            for o in range(ORDERS_PER_USER):
+                order = Order(
+                    order_no=generate_order_num(),
+                    user_id=user.id,
+                    address_id=address.id,
+                    delivery_address=format_address(address),
+                    subtotal=Decimal("20.00"),
+                    tax=Decimal("1.00"),
+                    delivery_charge=Decimal("0.00"),
+                    total=Decimal("21.00"),
+                    order_status=list(OrderStatus)[o % len(OrderStatus)],
+                )
+                order.order_items = [
+                    OrderItem(
+                        pizza_id=pizza.id,
+                        size_id=size.id,
+                        crust_id=crust.id,
+                        pizza_name=pizza.name,
+                        size_name=size.name,
+                        crust_name=crust.name,
+                        size_price=Decimal("8.00"),
+                        crust_price=Decimal("0.00"),
+                        base_pizza_price=Decimal("8.00"),
+                        toppings_total_price=Decimal("2.00"),
+                        unit_price=Decimal("10.00"),
+                        total_price=Decimal("10.00"),
+                        quantity=1,
+                        toppings=[
+                            OrderItemTopping(
+                                topping_id=topping.id,
+                                topping_name=topping.name,
+                                topping_price=topping.price,
+                            )
+                            for topping in toppings[:2]
+                        ],
+                    )
+                    for _ in range(2)
+                ]
+                session.add(order)
+
+            session.add_all(
+                Notification(
+                    user_id=user.id,
+                    title="Order update",
+                    message="Your order is on its way!",
+                    notification_type=NotificationType.ORDER_UPDATE,
+                    is_read=n % 2 == 0,
+                )
+                for n in range(NOTIFICATIONS_PER_USER)
+            )
+
+        await session.commit()
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+    await engine.dispose()
+    return user_ids
@@ -0,0 +1,138 @@
+"""
+EXPLAIN every statement a service call issues and check it is served by the
+indexes from __table_args__ (migration 569f0de08363) instead of a seq scan.
+
+Sequential scans are disabled for the session, so the planner only falls back
+to one when no index can serve the query; the seeded tables are too small for
+the plain cost comparison to mean anything.
+"""
+
+import asyncio
+import json
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.address.service import AddressesService
+from app.auth.model import UserRole
+from app.auth.schema import AuthUser
+from app.cart.service import DatabaseCartService
+from app.notifications.service import NotificationService
+from app.orders.model import OrderStatus
+from app.orders.service import OrderService
+from tests.seed import create_engine
+
+
+def walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+async def explain_calls(db_url: str, call) -> list[tuple[str, list[dict]]]:
+    """Run `call(session)`, then EXPLAIN each SELECT it sent, with its parameters."""
+    engine = create_engine(db_url)
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SET enable_seqscan = off"))
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            await call(AsyncSession(bind=conn))
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+            plans = []
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar_one()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                plans.append((statement, list(walk(plan[0]["Plan"]))))
+            return plans
+    finally:
+        await engine.dispose()
+
+
+def assert_indexed(plans, *expected: str | set[str]):
+    """No seq scans, and each expected index (or one of a set of them) is used."""
+    assert plans, "the service call issued no SELECT"
+    used = set()
+    for statement, nodes in plans:
+        seq_scans = [n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"]
+        assert not seq_scans, f"seq scan on {seq_scans} for:\n{statement}"
+        used.update(n["Index Name"] for n in nodes if "Index Name" in n)
+    for indexes in expected:
+        indexes = {indexes} if isinstance(indexes, str) else indexes
+        assert indexes & used, f"none of {indexes} used, got {used}"
+
+
+def explain(db_url, call):
+    return asyncio.run(explain_calls(db_url, call))
+
+
+def test_user_orders_use_user_and_order_item_indexes(db_url, seeded_db):
+    user_id = seeded_db[0]
+    plans = explain(db_url, lambda s: OrderService(s).get_user_orders(user_id))
+    assert_indexed(
+        plans,
+        "ix_orders_user_id_created_at_id",
+        "ix_order_item_order_id",
+        "ix_order_item_topping_order_item_id",
+    )
+
+
+def test_admin_orders_by_status_use_status_index(db_url, seeded_db):
+    plans = explain(
+        db_url,
+        lambda s: OrderService(s).get_all_orders(order_status=OrderStatus.CONFIRMED),
+    )
+    assert_indexed(plans, "ix_orders_order_status_created_at_id")
+
+
+def test_user_notifications_use_user_index(db_url, seeded_db):
+    user_id = seeded_db[0]
+    plans = explain(
+        db_url,
+        lambda s: NotificationService(s).get_user_notifications(user_id, 20, None),
+    )
+    assert_indexed(plans, "ix_notifications_user_id_created_at")
+
+
+def test_unread_notifications_use_an_index(db_url, seeded_db):
+    user_id = seeded_db[0]
+    plans = explain(
+        db_url,
+        lambda s: NotificationService(s).get_user_notifications(user_id, 20, "unread"),
+    )
+    # the partial index when the planner can prove is_read = false, else the full one
+    assert_indexed(
+        plans,
+        {
+            "ix_notifications_user_id_created_at_unread",
+            "ix_notifications_user_id_created_at",
+        },
+    )
+
+
+def test_user_cart_uses_cart_indexes(db_url, seeded_db):
+    user_id = seeded_db[0]
+    plans = explain(db_url, lambda s: DatabaseCartService(s).get_user_cart(user_id))
+    # (cart_id, fingerprint) from the cart item fingerprint migration also leads
+    # with cart_id, the planner may take either
+    assert_indexed(
+        plans,
+        "ix_cart_user_id",
+        {"ix_cart_item_cart_id", "uq_cart_item_cart_id_fingerprint"},
+    )
+
+
+def test_user_addresses_use_user_index(db_url, seeded_db):
+    user = AuthUser(
+        id=seeded_db[0], email="user0@example.com", role=UserRole.USER, is_verified=True
+    )
+    plans = explain(db_url, lambda s: AddressesService(s).get_all(user))
+    assert_indexed(plans, "ix_addresses_user_id")